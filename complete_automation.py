@@ -1,2406 +1,3552 @@
-# 청산부동산 유튜브 완전 자동화 시스템 v3.0 - 업그레이드 완료
-# 🔧 수정사항:
-# 1. Google Sheets 인증 문제 완전 해결 (Mock 모드 탈출)
-# 2. 실시간 진행률 바 + 단계별 상태 표시 강화
-# 3. "광고시 유의사항" 필드 추가 (PPT, 스크립트, YouTube 설명에 포함)
-# 4. 완전 자동화 100% 달성 (선택적 확인 팝업)
-# 5. 🆕 모든 오류 수정 완료 - 바로 작동 가능!
-
-# 기본 라이브러리
-import json
-import os
-import time
-import threading
-import logging
-import urllib.parse
-import csv
-import io
-import signal
-import sys
-import subprocess
-import shutil
-import re
-from datetime import datetime, timedelta
-from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Any
-import tempfile
-import platform
-
-# 안전한 import with 예외처리
-try:
-    import requests
-except ImportError:
-    print("⚠️ requests 라이브러리가 없습니다. pip install requests")
-    requests = None
-
-try:
-    import pandas as pd
-except ImportError:
-    print("⚠️ pandas 라이브러리가 없습니다. pip install pandas")
-    pd = None
-
-# GUI 라이브러리 안전 import
-try:
-    import tkinter as tk
-    from tkinter import messagebox, ttk, filedialog
-    from tkinter import scrolledtext
-    GUI_AVAILABLE = True
-except ImportError:
-    print("⚠️ tkinter GUI를 사용할 수 없습니다.")
-    GUI_AVAILABLE = False
-    tk = None
-
-# PPT 라이브러리
-try:
-    from pptx import Presentation
-    from pptx.util import Inches, Pt
-    from pptx.dml.color import RGBColor
-    PPTX_AVAILABLE = True
-except ImportError:
-    print("ℹ️ python-pptx 없음. PPT 기능은 Mock으로 동작합니다.")
-    PPTX_AVAILABLE = False
-
-# 이미지 처리 라이브러리
-try:
-    from PIL import Image, ImageDraw, ImageFont
-    PIL_AVAILABLE = True
-except ImportError:
-    print("ℹ️ Pillow 없음. 썸네일 기능은 Mock으로 동작합니다.")
-    PIL_AVAILABLE = False
-
-# TTS 라이브러리 (여러 옵션 지원)
-TTS_ENGINE = None
-try:
-    import pyttsx3
-    TTS_ENGINE = "pyttsx3"
-    print("✅ pyttsx3 TTS 엔진 사용 가능")
-except ImportError:
-    try:
-        import gtts
-        TTS_ENGINE = "gtts"
-        print("✅ Google TTS 엔진 사용 가능")
-    except ImportError:
-        print("ℹ️ TTS 라이브러리 없음. Mock 모드로 동작합니다.")
-        print("설치: pip install pyttsx3 gTTS")
-
-# 🔧 수정된 구글시트 라이브러리들 - 인증 문제 완전 해결
-GSPREAD_AVAILABLE = False
-try:
-    import gspread
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.oauth2.service_account import Credentials as ServiceAccountCredentials
-    GSPREAD_AVAILABLE = True
-    print("✅ 최신 Google Sheets API 사용 가능")
-except ImportError:
-    print("ℹ️ Google Sheets API 없음. Mock 모드로 동작합니다.")
-    print("설치: pip install gspread google-auth google-auth-oauthlib google-auth-httplib2")
-
-# YouTube API 라이브러리
-YOUTUBE_API_AVAILABLE = False
-try:
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-    from googleapiclient.http import MediaFileUpload
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-    YOUTUBE_API_AVAILABLE = True
-    print("✅ YouTube API 사용 가능")
-except ImportError:
-    print("ℹ️ YouTube API 없음. Mock 모드로 동작합니다.")
-    print("설치: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-     format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-# 전역 설정
-SAFE_MODE = not all([requests, pd])
-MONITORING_ACTIVE = False
-SHUTDOWN_FLAG = False
-
-
-@dataclass
-class PropertyData:
-    """부동산 데이터 클래스 - 광고시 유의사항 필드 추가"""
-    address: str
-    property_type: str
-    average_price: str
-    recent_trades: List[str]
-    price_trend: str
-    market_analysis: str
-    school_info: str
-    transport_info: str
-    advertising_notice: str = "본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다. 부동산 투자 시 신중한 검토가 필요합니다."  # 🆕 추가
-    contact_info: str = "청산부동산 02-1234-5678"
-    brand_message: str = "신뢰할 수 있는 부동산 전문가, 청산부동산과 함께하세요"
-
-
-@dataclass
-class ContentResult:
-    """콘텐츠 생성 결과 클래스"""
-    video_file: str
-    script: str
-    ppt_file: str
-    voice_file: str
-    subtitle_file: str
-    thumbnail_file: str
-    youtube_url: str
-    success: bool
-    error_message: Optional[str] = None
-    sheets_row_id: Optional[int] = None
-
-# 🆕 진행률 추적 클래스 추가
-
-
-class ProgressTracker:
-    """실시간 진행률 추적 시스템"""
-
-    def __init__(self, callback=None):
-        self.callback = callback
-        self.current_step = 0
-        self.total_steps = 10
-        self.step_details = {
-            0: "🚀 자동화 시스템 초기화",
-            1: "🏠 부동산 데이터 수집 중",
-            2: "✍️ AI 스크립트 생성 중",
-            3: "📊 브랜디드 PPT 생성 중",
-            4: "🎨 썸네일 및 이미지 생성 중",
-            5: "🎙️ 음성 나레이션 생성 중",
-            6: "📝 자막 파일 생성 중",
-            7: "🎬 영상 편집 및 합성 중",
-            8: "📺 YouTube 업로드 준비 중",
-            9: "✅ 최종 완료 및 상태 업데이트"
-        }
-
-    def update(self, step: int, message: str = "", sub_progress: int = 0):
-        """진행률 업데이트"""
-        self.current_step = step
-
-        # 전체 진행률 계산 (0-100%)
-        overall_progress = int((step / self.total_steps) * 100)
-
-        # 단계별 세부 진행률 추가
-        if sub_progress > 0:
-            step_increment = (1 / self.total_steps) * (sub_progress / 100)
-            overall_progress = int(
-    ((step + step_increment) / self.total_steps) * 100)
-
-        # 기본 메시지가 없으면 단계별 기본 메시지 사용
-        if not message:
-            message = self.step_details.get(step, f"단계 {step + 1} 처리 중")
-
-        # 로그 출력
-        logger.info(f"[{overall_progress}%] {message}")
-
-        # 콜백 호출
-        if self.callback:
-            try:
-                self.callback(message, overall_progress)
-            except Exception as e:
-                logger.warning(f"진행률 콜백 오류: {e}")
-
-    def substep(self, message: str, sub_progress: int):
-        """현재 단계 내 세부 진행률"""
-        self.update(self.current_step, message, sub_progress)
-
-
-class RealTTSEngine:
-    """실제 TTS 음성 생성 엔진"""
-
-    def __init__(self):
-        self.engine_type = TTS_ENGINE
-        if self.engine_type == "pyttsx3":
-            try:
-                import pyttsx3
-                self.engine = pyttsx3.init()
-                self.engine.setProperty('rate', 150)  # 속도 조절
-                self.engine.setProperty('volume', 0.9)  # 볼륨 조절
-            except:
-                self.engine = None
-        else:
-            self.engine = None
-
-    def generate_voice(self, script: str, output_file: str,
-                       progress_tracker: ProgressTracker = None) -> bool:
-        """실제 음성 생성 - 진행률 추적 추가"""
-        try:
-            if progress_tracker:
-                progress_tracker.substep("🎙️ 음성 엔진 초기화 중", 10)
-
-            if self.engine_type == "pyttsx3" and self.engine:
-                if progress_tracker:
-                    progress_tracker.substep("🎙️ pyttsx3 음성 생성 중", 50)
-
-                # pyttsx3 사용
-                self.engine.save_to_file(script, output_file)
-                self.engine.runAndWait()
-
-                if progress_tracker:
-                    progress_tracker.substep("🎙️ 음성 파일 저장 완료", 100)
-                return True
-
-            elif self.engine_type == "gtts":
-                if progress_tracker:
-                    progress_tracker.substep("🎙️ Google TTS 음성 생성 중", 50)
-
-                # Google TTS 사용
-                from gtts import gTTS
-
-                # 임시 mp3 파일 생성
-                temp_mp3 = output_file.replace('.wav', '.mp3')
-                tts = gTTS(text=script, lang='ko')
-                tts.save(temp_mp3)
-
-                if progress_tracker:
-                    progress_tracker.substep("🎙️ 오디오 포맷 변환 중", 80)
-
-                # mp3를 wav로 변환 (필요시)
-                if output_file.endswith('.wav'):
-                    self._convert_mp3_to_wav(temp_mp3, output_file)
-                    os.remove(temp_mp3)
-                else:
-                    os.rename(temp_mp3, output_file)
-
-                if progress_tracker:
-                    progress_tracker.substep("🎙️ 음성 파일 저장 완료", 100)
-                return True
-
-            else:
-                # Mock 음성 파일 생성
-                if progress_tracker:
-                    progress_tracker.substep("🎙️ Mock 음성 파일 생성 중", 50)
-
-                result = self._create_mock_voice(script, output_file)
-
-                if progress_tracker:
-                    progress_tracker.substep("🎙️ Mock 음성 파일 생성 완료", 100)
-                return result
-
-        except Exception as e:
-            logger.error(f"음성 생성 오류: {e}")
-            if progress_tracker:
-                progress_tracker.substep("❌ 음성 생성 실패, Mock 파일 생성 중", 80)
-            return self._create_mock_voice(script, output_file)
-
-    def _convert_mp3_to_wav(self, mp3_file: str, wav_file: str):
-        """MP3를 WAV로 변환"""
-        try:
-            # FFmpeg 사용 (설치되어 있는 경우)
-            subprocess.run([
-                'ffmpeg', '-i', mp3_file, '-acodec', 'pcm_s16le',
-                '-ar', '44100', wav_file
-            ], check=True, capture_output=True)
-        except:
-            # FFmpeg 없으면 그냥 복사
-            shutil.copy2(mp3_file, wav_file)
-
-    def _create_mock_voice(self, script: str, output_file: str) -> bool:
-        """Mock 음성 파일 생성"""
-        try:
-            # 빈 오디오 파일 생성 (실제로는 무음)
-            duration = len(script) * 0.1  # 글자당 0.1초
-
-            # WAV 헤더만 있는 빈 파일 생성
-            with open(output_file, 'wb') as f:
-                # 간단한 WAV 헤더 작성
-                f.write(b'RIFF')
-                f.write((36).to_bytes(4, 'little'))
-                f.write(b'WAVE')
-                f.write(b'fmt ')
-                f.write((16).to_bytes(4, 'little'))
-                f.write((1).to_bytes(2, 'little'))
-                f.write((1).to_bytes(2, 'little'))
-                f.write((44100).to_bytes(4, 'little'))
-                f.write((88200).to_bytes(4, 'little'))
-                f.write((2).to_bytes(2, 'little'))
-                f.write((16).to_bytes(2, 'little'))
-                f.write(b'data')
-                f.write((0).to_bytes(4, 'little'))
-
-            logger.info(f"Mock 음성 파일 생성: {output_file}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Mock 음성 생성 오류: {e}")
-            return False
-
-
-class RealVideoEditor:
-    """실제 영상 편집 엔진 - 진행률 추적 개선"""
-
-    def __init__(self):
-        self.ffmpeg_available = self._check_ffmpeg()
-
-    def _check_ffmpeg(self) -> bool:
-        """FFmpeg 설치 확인 - 개선된 버전"""
-        ffmpeg_commands = ['ffmpeg', 'ffmpeg.exe']
-
-        for cmd in ffmpeg_commands:
-            try:
-                result = subprocess.run(
-                    [cmd, '-version'], capture_output=True, check=True, timeout=10)
-                if result.returncode == 0:
-                    logger.info("✅ FFmpeg 사용 가능")
-                    return True
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                continue
-
-        import shutil
-        if shutil.which('ffmpeg'):
-            logger.info("✅ FFmpeg PATH에서 발견")
-            return True
-
-        logger.warning("⚠️ FFmpeg 없음. Mock 영상 생성합니다.")
-        return False
-
-    def create_video_from_ppt(self, ppt_file: str, voice_file: str,
-                             subtitle_file: str, output_video: str,
-                             progress_tracker: ProgressTracker = None) -> bool:
-        """PPT + 음성 + 자막으로 영상 생성 - 진행률 추적 추가"""
-        try:
-            if progress_tracker:
-                progress_tracker.substep("🎬 영상 편집 시스템 초기화", 10)
-
-            if self.ffmpeg_available:
-                return self._create_real_video(ppt_file, voice_file,
-                                             subtitle_file, output_video, progress_tracker)
-            else:
-                if progress_tracker:
-                    progress_tracker.substep("🎬 Mock 영상 생성 중", 50)
-                result = self._create_mock_video(output_video)
-                if progress_tracker:
-                    progress_tracker.substep("🎬 Mock 영상 생성 완료", 100)
-                return result
-
-        except Exception as e:
-            logger.error(f"영상 생성 오류: {e}")
-            if progress_tracker:
-                progress_tracker.substep("❌ 영상 생성 실패, Mock 파일 생성", 80)
-            return self._create_mock_video(output_video)
-
-    def _create_real_video(self, ppt_file: str, voice_file: str,
-                          subtitle_file: str, output_video: str,
-                          progress_tracker: ProgressTracker = None) -> bool:
-        """실제 영상 생성 (FFmpeg 사용) - 진행률 추적"""
-        try:
-            if progress_tracker:
-                progress_tracker.substep("🎬 PPT 슬라이드 변환 중", 20)
-
-            # 1단계: PPT를 이미지로 변환
-            if PPTX_AVAILABLE and ppt_file.endswith('.pptx'):
-                images = self._convert_ppt_to_images(
-                    ppt_file, progress_tracker)
-            else:
-                # 단일 이미지 생성
-                images = [self._create_slide_image(f"청산부동산 분석",
-                                                 "부동산 전문가의 시장 분석")]
-
-            if progress_tracker:
-                progress_tracker.substep("🎬 이미지와 오디오 합성 중", 60)
-
-            # 2단계: 이미지들로 영상 생성
-            if images:
-                return self._combine_images_audio_to_video(
-                    images, voice_file, subtitle_file, output_video, progress_tracker)
-            else:
-                if progress_tracker:
-                    progress_tracker.substep("🎬 Mock 영상 생성으로 대체", 90)
-                return self._create_mock_video(output_video)
-
-        except Exception as e:
-            logger.error(f"실제 영상 생성 오류: {e}")
-            return self._create_mock_video(output_video)
-
-    def _convert_ppt_to_images(
-    self,
-    ppt_file: str,
-     progress_tracker: ProgressTracker = None) -> List[str]:
-        """PPT를 이미지로 변환 - 진행률 추적"""
-        try:
-            from pptx import Presentation
-
-            prs = Presentation(ppt_file)
-            images = []
-            total_slides = len(prs.slides)
-
-            if progress_tracker:
-                progress_tracker.substep(f"🎬 {total_slides}개 슬라이드 처리 시작", 30)
-
-            for i, slide in enumerate(prs.slides):
-                # 슬라이드별 진행률
-                slide_progress = 30 + int((i / total_slides) * 30)  # 30-60% 범위
-                if progress_tracker:
-                    progress_tracker.substep(
-    f"🎬 슬라이드 {i+1}/{total_slides} 변환 중", slide_progress)
-
-                # 슬라이드를 이미지로 변환하는 로직
-                image_path = f"slide_{i+1}_{int(time.time())}.png"
-
-                # 간단한 텍스트 이미지 생성
-                if PIL_AVAILABLE:
-                    img = Image.new('RGB', (1920, 1080), color='#1E3A8A')
-                    draw = ImageDraw.Draw(img)
-
-                    # 폰트 로드 시도
-                    try:
-                        font_large = ImageFont.truetype("arial.ttf", 60)
-                        font_medium = ImageFont.truetype("arial.ttf", 40)
-                    except:
-                        font_large = ImageFont.load_default()
-                        font_medium = ImageFont.load_default()
-
-                    # 슬라이드 제목과 내용 추출
-                    title = "청산부동산"
-                    content = f"슬라이드 {i+1}"
-
-                    # 텍스트 그리기
-                    draw.text((100, 200), title, fill='white', font=font_large)
-                    draw.text(
-    (100, 300), content, fill='#F59E0B', font=font_medium)
-
-                    img.save(image_path)
-                    images.append(image_path)
-
-            if progress_tracker:
-                progress_tracker.substep("🎬 모든 슬라이드 변환 완료", 60)
-
-            return images[:6]  # 최대 6개 슬라이드
-
-        except Exception as e:
-            logger.error(f"PPT 이미지 변환 오류: {e}")
-            return []
-
-    def _create_slide_image(self, title: str, content: str) -> str:
-        """단일 슬라이드 이미지 생성"""
-        try:
-            if not PIL_AVAILABLE:
-                return ""
-
-            image_path = f"slide_{int(time.time())}.png"
-            img = Image.new('RGB', (1920, 1080), color='#1E3A8A')
-            draw = ImageDraw.Draw(img)
-
-            try:
-                font_large = ImageFont.truetype("arial.ttf", 80)
-                font_medium = ImageFont.truetype("arial.ttf", 50)
-            except:
-                font_large = ImageFont.load_default()
-                font_medium = ImageFont.load_default()
-
-            # 텍스트 그리기
-            draw.text((100, 300), title, fill='white', font=font_large)
-            draw.text((100, 450), content, fill='#F59E0B', font=font_medium)
-
-            # 브랜드 로고 위치
-            draw.text((100, 900), "청산부동산", fill='#10B981', font=font_medium)
-
-            img.save(image_path)
-            return image_path
-
-        except Exception as e:
-            logger.error(f"슬라이드 이미지 생성 오류: {e}")
-            return ""
-
-    def _combine_images_audio_to_video(self, images: List[str], voice_file: str,
-                                     subtitle_file: str, output_video: str,
-                                     progress_tracker: ProgressTracker = None) -> bool:
-        """이미지들과 오디오를 합쳐서 영상 생성 - 진행률 추적"""
-        try:
-            if not self.ffmpeg_available or not images:
-                return self._create_mock_video(output_video)
-
-            if progress_tracker:
-                progress_tracker.substep("🎬 FFmpeg 영상 합성 시작", 70)
-
-            # 각 슬라이드를 5초씩 표시
-            slide_duration = 5
-
-            # 이미지들을 비디오로 변환
-            image_list_file = f"images_{int(time.time())}.txt"
-            with open(image_list_file, 'w') as f:
-                for img in images:
-                    f.write(f"file '{img}'\n")
-                    f.write(f"duration {slide_duration}\n")
-
-            if progress_tracker:
-                progress_tracker.substep("🎬 FFmpeg 인코딩 실행 중", 85)
-
-            # FFmpeg로 영상 생성
-            cmd = [
-                'ffmpeg', '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', image_list_file,
-                '-i', voice_file,
-                '-c:v', 'libx264',
-                '-c:a', 'aac',
-                '-shortest',
-                '-pix_fmt', 'yuv420p',
-                output_video
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            # 임시 파일 정리
-            os.remove(image_list_file)
-            for img in images:
-                if os.path.exists(img):
-                    os.remove(img)
-
-            if result.returncode == 0:
-                if progress_tracker:
-                    progress_tracker.substep("🎬 영상 생성 완료", 100)
-                logger.info(f"✅ 실제 영상 생성 완료: {output_video}")
-                return True
-            else:
-                logger.error(f"FFmpeg 오류: {result.stderr}")
-                return self._create_mock_video(output_video)
-
-        except Exception as e:
-            logger.error(f"영상 합성 오류: {e}")
-            return self._create_mock_video(output_video)
-
-    def _create_mock_video(self, output_video: str) -> bool:
-        """Mock 영상 파일 생성"""
-        try:
-            # 빈 MP4 파일 생성 (실제로는 최소한의 헤더만)
-            with open(output_video, 'wb') as f:
-                # MP4 기본 헤더 (매우 간단한 버전)
-                mp4_header = b'\x00\x00\x00\x20ftypmp42\x00\x00\x00\x00mp42isom'
-                f.write(mp4_header)
-                f.write(b'\x00' * 1024)  # 더미 데이터
-
-            logger.info(f"Mock 영상 파일 생성: {output_video}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Mock 영상 생성 오류: {e}")
-            return False
-
-
-class YouTubeUploader:
-    """YouTube 자동 업로드 관리자 - 100% 자동화 옵션 추가"""
-
-    def __init__(self):
-        self.youtube_service = None
-        self.credentials = None
-        self.api_available = YOUTUBE_API_AVAILABLE
-        self.auto_upload_mode = False  # 🆕 100% 자동화 모드
-
-    def set_auto_upload_mode(self, enabled: bool):
-        """100% 자동화 모드 설정"""
-        self.auto_upload_mode = enabled
-        logger.info(f"YouTube 자동 업로드 모드: {'활성화' if enabled else '비활성화'}")
-
-    def setup_youtube_auth(
-    self,
-     client_secrets_file: str = "youtube_secrets.json") -> bool:
-        """YouTube API 인증 설정"""
-        try:
-            if not self.api_available:
-                logger.warning("YouTube API 라이브러리가 없습니다.")
-                return False
-
-            if not os.path.exists(client_secrets_file):
-                logger.warning(f"YouTube 인증 파일이 없습니다: {client_secrets_file}")
-                return False
-
-            # OAuth 2.0 스코프 설정
-            SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
-
-            flow = InstalledAppFlow.from_client_secrets_file(
-                client_secrets_file, SCOPES)
-            self.credentials = flow.run_local_server(port=0)
-
-            # YouTube 서비스 빌드
-            self.youtube_service = build('youtube', 'v3',
-                                       credentials=self.credentials)
-
-            logger.info("✅ YouTube API 인증 성공")
-            return True
-
-        except Exception as e:
-            logger.error(f"YouTube 인증 실패: {e}")
-            return False
-
-    def upload_video_with_confirmation(self, video_file: str, title: str,
-                                     description: str, tags: List[str] = None,
-                                     thumbnail_file: str = None,
-                                     progress_tracker: ProgressTracker = None) -> Tuple[bool, str]:
-        """확인 팝업 후 YouTube 업로드 (100% 자동화 옵션 지원)"""
-        try:
-            if progress_tracker:
-                progress_tracker.substep("📺 YouTube 업로드 준비 중", 10)
-
-            # 🆕 100% 자동화 모드에서는 확인 팝업 생략
-            if not self.auto_upload_mode:
-                # 1단계: 업로드 전 확인 팝업
-                if not self._show_upload_confirmation(
-                    video_file, title, description):
-                    return False, "사용자가 업로드를 취소했습니다."
-            else:
-                logger.info("🚀 100% 자동화 모드 - 확인 팝업 생략하고 바로 업로드")
-                if progress_tracker:
-                    progress_tracker.substep("🚀 100% 자동화 모드 - 바로 업로드", 30)
-
-            # 2단계: 실제 업로드
-            if self.youtube_service:
-                return self._upload_to_youtube(video_file, title, description,
-                                             tags, thumbnail_file, progress_tracker)
-            else:
-                return self._mock_upload(video_file, title, progress_tracker)
-
-        except Exception as e:
-            logger.error(f"YouTube 업로드 오류: {e}")
-            return False, str(e)
-
-    def _show_upload_confirmation(self, video_file: str, title: str,
-                                description: str) -> bool:
-        """업로드 확인 팝업창"""
-        try:
-            if not GUI_AVAILABLE:
-                # 콘솔에서 확인
-                print("\n" + "=" * 60)
-                print("🚀 YouTube 업로드 최종 확인")
-                print("=" * 60)
-                print(f"📹 영상 파일: {video_file}")
-                print(f"📝 제목: {title}")
-                print(f"📄 설명: {description[:100]}...")
-                print("=" * 60)
-
-                while True:
-                    response = input("✅ 업로드를 진행하시겠습니까? (y/n): ").lower()
-                    if response in ['y', 'yes', '예']:
-                        return True
-                    elif response in ['n', 'no', '아니오']:
-                        return False
-                    else:
-                        print("y 또는 n을 입력해주세요.")
-
-            else:
-                # GUI 확인 팝업
-                popup = tk.Toplevel()
-                popup.title("🚀 YouTube 업로드 최종 확인")
-                popup.geometry("600x500")
-                popup.transient()
-                popup.grab_set()
-
-                # 메인 프레임
-                main_frame = ttk.Frame(popup, padding="20")
-                main_frame.pack(fill=tk.BOTH, expand=True)
-
-                # 제목
-                title_label = ttk.Label(main_frame, text="🚀 YouTube 업로드 최종 확인",
-                                      font=('Arial', 16, 'bold'))
-                title_label.pack(pady=10)
-
-                # 영상 정보
-                info_frame = ttk.LabelFrame(main_frame, text="📹 업로드할 영상 정보",
-                                          padding="10")
-                info_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-
-                # 정보 표시
-                ttk.Label(info_frame, text=f"📁 파일: {os.path.basename(video_file)}",
-                         font=('Arial', 10)).pack(anchor=tk.W, pady=2)
-                ttk.Label(info_frame, text=f"📝 제목: {title}",
-                         font=('Arial', 10)).pack(anchor=tk.W, pady=2)
-
-                # 설명 (스크롤 가능)
-                desc_label = ttk.Label(info_frame, text="📄 설명:")
-                desc_label.pack(anchor=tk.W, pady=(10, 2))
-
-                desc_text = tk.Text(
-    info_frame, height=8, width=60, wrap=tk.WORD)
-                desc_text.insert(1.0, description)
-                desc_text.config(state=tk.DISABLED)
-                desc_text.pack(fill=tk.BOTH, expand=True, pady=2)
-
-                # 경고 메시지
-                warning_frame = ttk.Frame(main_frame)
-                warning_frame.pack(fill=tk.X, pady=10)
-
-                warning_text = "⚠️ 업로드 후에는 취소할 수 없습니다. 내용을 다시 한 번 확인해주세요."
-                ttk.Label(warning_frame, text=warning_text,
-                         font=('Arial', 9), foreground="red").pack()
-
-                # 버튼들
-                button_frame = ttk.Frame(main_frame)
-                button_frame.pack(fill=tk.X, pady=20)
-
-                result = {'confirmed': False}
-
-                def confirm_upload():
-                    result['confirmed'] = True
-                    popup.destroy()
-
-                def cancel_upload():
-                    result['confirmed'] = False
-                    popup.destroy()
-
-                ttk.Button(button_frame, text="✅ 업로드 진행",
-                          command=confirm_upload).pack(side=tk.LEFT, padx=10)
-                ttk.Button(button_frame, text="❌ 취소",
-                          command=cancel_upload).pack(side=tk.RIGHT, padx=10)
-
-                # 팝업이 닫힐 때까지 대기
-                popup.wait_window()
-
-                return result['confirmed']
-
-        except Exception as e:
-            logger.error(f"확인 팝업 오류: {e}")
-            return False
-
-    def _upload_to_youtube(self, video_file: str, title: str, description: str,
-                          tags: List[str] = None, thumbnail_file: str = None,
-                          progress_tracker: ProgressTracker = None) -> Tuple[bool, str]:
-        """실제 YouTube 업로드 - 진행률 추적"""
-        try:
-            if progress_tracker:
-                progress_tracker.substep("📺 업로드 메타데이터 설정 중", 40)
-
-            # 업로드 메타데이터 설정
-            body = {
-                'snippet': {
-                    'title': title,
-                    'description': description,
-                    'tags': tags or ['부동산', '투자', '청산부동산', '아파트', '시세분석'],
-                    'categoryId': '22'  # People & Blogs
-                },
-                'status': {
-                    'privacyStatus': 'public'  # public, private, unlisted
-                }
-            }
-
-            if progress_tracker:
-                progress_tracker.substep("📺 동영상 업로드 시작", 50)
-
-            # 미디어 파일 업로드
-            media = MediaFileUpload(video_file, chunksize=-1, resumable=True)
-
-            # 업로드 요청
-            insert_request = self.youtube_service.videos().insert(
-                part=','.join(body.keys()),
-                body=body,
-                media_body=media
-            )
-
-            # 업로드 진행
-            response = None
-            while response is None:
-                status, response = insert_request.next_chunk()
-                if status:
-                    upload_progress = int(status.progress() * 100)
-                    if progress_tracker:
-                        progress_tracker.substep(
-                            f"📺 업로드 진행 중: {upload_progress}%", 50 + (upload_progress * 0.3))
-                    logger.info(f"업로드 진행률: {upload_progress}%")
-
-            if 'id' in response:
-                video_id = response['id']
-                youtube_url = f"https://www.youtube.com/watch?v={video_id}"
-
-                if progress_tracker:
-                    progress_tracker.substep("📺 썸네일 업로드 중", 90)
-
-                # 썸네일 업로드 (선택사항)
-                if thumbnail_file and os.path.exists(thumbnail_file):
-                    try:
-                        self.youtube_service.thumbnails().set(
-                            videoId=video_id,
-                            media_body=MediaFileUpload(thumbnail_file)
-                        ).execute()
-                        logger.info("✅ 썸네일 업로드 완료")
-                    except Exception as e:
-                        logger.warning(f"썸네일 업로드 실패: {e}")
-
-                if progress_tracker:
-                    progress_tracker.substep("📺 YouTube 업로드 완료", 100)
-
-                logger.info(f"✅ YouTube 업로드 성공: {youtube_url}")
-                return True, youtube_url
-            else:
-                return False, "업로드 응답에 video ID가 없습니다."
-
-        except HttpError as e:
-            error_msg = f"YouTube API 오류: {e}"
-            logger.error(error_msg)
-            return False, error_msg
-        except Exception as e:
-            error_msg = f"업로드 오류: {e}"
-            logger.error(error_msg)
-            return False, error_msg
-
-    def _mock_upload(self, video_file: str, title: str,
-                     progress_tracker: ProgressTracker = None) -> Tuple[bool, str]:
-        """Mock 업로드 (테스트용) - 진행률 추적"""
-        try:
-            if progress_tracker:
-                progress_tracker.substep("📺 Mock 업로드 시뮬레이션", 50)
-
-            # Mock 업로드 시뮬레이션
-            logger.info("Mock YouTube 업로드 시뮬레이션...")
-            time.sleep(3)  # 업로드 시뮬레이션
-
-            mock_video_id = f"mock_{int(time.time())}"
-            mock_url = f"https://www.youtube.com/watch?v={mock_video_id}"
-
-            if progress_tracker:
-                progress_tracker.substep("📺 Mock 업로드 완료", 100)
-
-            logger.info(f"✅ Mock 업로드 완료: {mock_url}")
-            return True, mock_url
-
-        except Exception as e:
-            return False, str(e)
-
-
-class AutoMonitoringManager:
-    """자동 모니터링 관리자 - 24시간 무인 운영"""
-
-    def __init__(self, automation_system):
-        self.automation = automation_system
-        self.monitoring_thread = None
-        self.is_running = False
-        self.check_interval = 300  # 5분마다 체크
-        self.last_check_time = datetime.now()
-        self.processed_items = set()  # 처리된 항목 추적
-        # 기본 시트 URL 설정
-        self.start_monitoring(
-            "https://docs.google.com/spreadsheets/d/1xXxaMYfdTytn3a28_c9AuAEMU4Uu3PLI99FfWZHbknE/edit?usp=sharing")
-
-    def start_monitoring(self, sheet_url: str = ""):
-        """자동 모니터링 시작"""
-        if self.is_running:
-            logger.warning("자동 모니터링이 이미 실행 중입니다.")
-            return
-
-        self.is_running = True
-        self.sheet_url = sheet_url
-
-        # 백그라운드 스레드 시작
-        self.monitoring_thread = threading.Thread(
-            target=self._monitoring_loop,
-            daemon=True,
-            name="AutoMonitoringThread"
-        )
-        self.monitoring_thread.start()
-
-        logger.info(f"🚀 자동 모니터링 시작 - {self.check_interval}초마다 체크")
-
-    def stop_monitoring(self):
-        """자동 모니터링 중지"""
-        self.is_running = False
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            logger.info("⏹️ 자동 모니터링 중지 중...")
-            # 스레드가 자연스럽게 종료되도록 대기
-            time.sleep(2)
-        logger.info("✅ 자동 모니터링 중지 완료")
-
-    def _monitoring_loop(self):
-        """메인 모니터링 루프"""
-        logger.info("📡 자동 모니터링 루프 시작")
-
-        while self.is_running and not SHUTDOWN_FLAG:
-            try:
-                self._check_and_process_new_items()
-
-                # 체크 간격만큼 대기 (1초씩 나누어서 중지 신호 확인)
-                for _ in range(self.check_interval):
-                    if not self.is_running or SHUTDOWN_FLAG:
-                        break
-                    time.sleep(1)
-
-            except Exception as e:
-                logger.error(f"모니터링 루프 오류: {e}")
-                time.sleep(30)  # 오류 시 30초 대기 후 재시도
-
-        logger.info("📡 자동 모니터링 루프 종료")
-
-    def _check_and_process_new_items(self):
-        """새 항목 체크 및 처리"""
-        try:
-            # 현재 시간 기록
-            current_time = datetime.now()
-            time_str = current_time.strftime("%H:%M:%S")
-            self.last_check_time = current_time
-
-            logger.info(f"🔍 [{time_str}] 구글시트 체크 중...")
-
-            # 구글시트에서 대기중인 항목들 가져오기
-            pending_items = self.automation.sheets_manager.get_property_queue(
-                self.sheet_url)
-
-            if not pending_items:
-                logger.info(f"📭 [{time_str}] 처리할 새 항목 없음")
-                return
-
-            # 새 항목만 필터링 (이전에 처리하지 않은 것들)
-            new_items = []
-            for item in pending_items:
-                item_id = f"{item.get('row_id', '')}_{item.get('address', '')}"
-                if item_id not in self.processed_items:
-                    new_items.append(item)
-
-            if not new_items:
-                logger.info(
-                    f"📝 [{time_str}] 모든 항목이 이미 처리됨 ({len(pending_items)}개)")
-                return
-
-            logger.info(f"🆕 [{time_str}] 새 항목 {len(new_items)}개 발견!")
-
-            # 새 항목들 자동 처리
-            for item in new_items:
-                if not self.is_running or SHUTDOWN_FLAG:
-                    break
-
-                self._process_single_item(item)
-
-        except Exception as e:
-            logger.error(f"새 항목 체크 오류: {e}")
-
-    def _process_single_item(self, item: Dict[str, Any]):
-        """개별 항목 자동 처리 - 구글시트 유의사항 포함"""
-        try:
-            address = item.get('address', '').strip()
-            row_id = item.get('row_id', '')
-            advertising_notice = item.get(
-    'advertising_notice', '')  # 🆕 구글시트 유의사항
-            item_id = f"{row_id}_{address}"
-
-            if not address:
-                logger.warning(f"주소가 없는 항목 건너뜀: 행 {row_id}")
-                self.processed_items.add(item_id)
-                return
-
-            logger.info(f"🎬 자동 처리 시작: {address} (행 {row_id})")
-            if advertising_notice:
-                logger.info(f"📋 구글폼 유의사항: {advertising_notice[:50]}...")
-
-            # 상태를 '처리중'으로 업데이트
-            self.automation.sheets_manager.update_status(row_id, "처리중", "")
-
-            # 🆕 콘텐츠 자동 생성 (구글시트 유의사항 포함)
-            result = self.automation.run_full_automation_with_notice(
-                address,
-                item.get('property_type', '아파트'),
-                advertising_notice,  # 🆕 구글시트에서 받은 유의사항 전달
-                row_id
-            )
-
-            # 결과에 따라 상태 업데이트
-            if result.success:
-                status = "완료"
-                youtube_url = result.youtube_url
-                logger.info(f"✅ 자동 처리 완료: {address}")
-
-                # 완료 알림 (선택적)
-                self._send_completion_notification(address, result)
-
-            else:
-                status = "오류"
-                youtube_url = f"오류: {result.error_message}"
-                logger.error(f"❌ 자동 처리 실패: {address} - {result.error_message}")
-
-            # 최종 상태 업데이트
-            self.automation.sheets_manager.update_status(
-                row_id, status, youtube_url)
-
-            # 처리된 항목으로 기록
-            self.processed_items.add(item_id)
-
-            # 다음 항목 처리 전 잠시 대기 (서버 부하 방지)
-            time.sleep(10)
-
-        except Exception as e:
-            logger.error(f"항목 처리 오류: {e}")
-            # 오류 시에도 처리된 것으로 기록 (무한 재처리 방지)
-            self.processed_items.add(item_id)
-
-            # 오류 상태로 업데이트
-            try:
-                self.automation.sheets_manager.update_status(
-                    item.get('row_id', ''), "오류", f"처리 실패: {str(e)[:100]}"
-                )
-            except:
-                pass
-
-    def _send_completion_notification(
-    self, address: str, result: ContentResult):
-        """완료 알림 발송 (선택적)"""
-        try:
-            # 여기에 이메일, 슬랙, 디스코드 등 알림 기능 추가 가능
-            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            notification_msg = f"""
-🎉 청산부동산 콘텐츠 자동 생성 완료!
-
-📍 주소: {address}
-⏰ 완료 시간: {completion_time}
-📹 YouTube: {result.youtube_url}
-📊 PPT: {result.ppt_file}
-
-🏢 청산부동산 자동화 시스템
-"""
-
-            # 로그에 기록
-            logger.info(f"📢 완료 알림: {address}")
-
-            # TODO: 실제 알림 발송 (이메일, 슬랙 등)
-            # send_email_notification(notification_msg)
-            # send_slack_notification(notification_msg)
-
-        except Exception as e:
-            logger.error(f"알림 발송 오류: {e}")
-
-    def get_status(self) -> Dict[str, Any]:
-        """모니터링 상태 정보"""
-        return {
-            'is_running': self.is_running,
-            'last_check': self.last_check_time.strftime("%Y-%m-%d %H:%M:%S"),
-            'check_interval_minutes': self.check_interval // 60,
-            'processed_count': len(self.processed_items),
-            'sheet_url': getattr(self, 'sheet_url', ''),
-            'thread_alive': self.monitoring_thread.is_alive() if self.monitoring_thread else False
-        }
-
-# 🔧 수정된 구글시트 연동 - 인증 문제 완전 해결
-
-
-class FixedSheetsManager:
-    """수정된 구글시트 연동 관리자 - 인증 문제 완전 해결"""
-
-    def __init__(self):
-        self.client = None
-        self.sheet = None
-        self.data_source = "none"
-        self.last_data = []
-        self.is_connected = False
-
-    def setup_sheets_connection(self, sheet_url: str = ""):
-        """구글시트 연결 설정 - 완전히 수정된 안전한 방식"""
-        logger.info("🔄 구글시트 연결 시작...")
-
-        # 라이브러리 체크
-        if not GSPREAD_AVAILABLE:
-            logger.warning("⚠️ Google Sheets 라이브러리 없음. Mock 모드로 실행")
-            self.data_source = "mock"
-            return False
-
-        # 🔧 수정된 연결 방법들 - 순서 변경 및 개선
-        connection_methods = [
-            ("Service Account (credentials.json)", self._try_service_account_fixed),
-            ("공개 CSV 다운로드", self._try_public_csv_improved),
-            ("Google API v4 (API 키)", self._try_api_key_improved),
-            ("OAuth 플로우", self._try_oauth_flow)
-        ]
-
-        for method_name, method_func in connection_methods:
-            try:
-                logger.info(f"🔄 시도: {method_name}")
-                if method_func(sheet_url):
-                    logger.info(f"✅ 연결 성공: {method_name}")
-                    self.is_connected = True
-                    return True
-            except Exception as e:
-                logger.warning(f"⚠️ {method_name} 실패: {str(e)[:100]}")
-                continue
-
-        logger.warning("⚠️ 모든 연결 방법 실패. Mock 모드로 실행합니다.")
-        self.data_source = "mock"
-        self.is_connected = False
-        return False
-
-
-def _try_service_account_fixed(self, sheet_url: str = "") -> bool:
-        """수정된 서비스 계정 인증 - credentials.json 파일 사용"""
-        try:
-            # 가능한 credentials 파일들 확인
-            credential_files = [
-                "credentials.json",
-                "service_account.json",
-                "complete_automation.json",
-                os.path.join(os.getcwd(), "credentials.json")
-            ]
-
-            credential_file = None
-            for file_path in credential_files:
-                if os.path.exists(file_path):
-                    credential_file = file_path
-                    logger.info(f"📋 credentials 파일 발견: {file_path}")
-                    break
-
-            if not credential_file:
-                logger.info("credentials 파일이 없습니다. Mock 모드로 실행")
-                return False
-
-            logger.info(f"📋 {credential_file} 파일 사용 - Service Account 인증 시도")
-
-            # 최신 google-auth 방식 사용
-            from google.oauth2.service_account import Credentials
-            import gspread
-
-            # 🔧 수정된 스코프 설정
-            SCOPES = [
-                'https://www.googleapis.com/auth/spreadsheets.readonly',
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive.readonly',
-                'https://www.googleapis.com/auth/drive.file'
-            ]
-
-            # credentials 파일에서 인증 정보 로드
-            creds = Credentials.from_service_account_file(
-                credential_file, scopes=SCOPES)
-
-            # gspread 클라이언트 생성
-            self.client = gspread.authorize(creds)
-
-            # 연결 테스트
-            if sheet_url:
-                logger.info(f"📊 시트 연결 테스트: {sheet_url}")
-                self.sheet = self.client.open_by_url(sheet_url).sheet1
-
-                # 실제 데이터 읽기 테스트
-                test_data = self.sheet.get_all_records(head=1)
-                logger.info(f"✅ 테스트 성공 - {len(test_data)}개 행 확인")
-
-                self.data_source = "service_account"
-                return True
-            else:
-                logger.info("✅ Service Account 인증 성공 (시트 URL 없음)")
-                self.data_source = "service_account"
-                return True
-
-        except Exception as e:
-            logger.error(f"Service Account 인증 실패: {e}")
-            logger.info("Mock 모드로 전환됩니다.")
-            return False
-
-            logger.info("📋 credentials.json 파일 발견 - Service Account 인증 시도")
-
-            # 최신 google-auth 방식 사용
-            from google.oauth2.service_account import Credentials
-            import gspread
-
-            # 🔧 수정된 스코프 설정
-            SCOPES = [
-                'https://www.googleapis.com/auth/spreadsheets.readonly',
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive.readonly',
-                'https://www.googleapis.com/auth/drive.file'
-            ]
-
-            # credentials.json에서 인증 정보 로드
-            creds = Credentials.from_service_account_file(
-                "credentials.json", scopes=SCOPES)
-
-            # gspread 클라이언트 생성
-            self.client = gspread.authorize(creds)
-
-            # 연결 테스트
-            if sheet_url:
-                logger.info(f"📊 시트 연결 테스트: {sheet_url}")
-                self.sheet = self.client.open_by_url(sheet_url).sheet1
-
-                # 실제 데이터 읽기 테스트
-                test_data = self.sheet.get_all_records(head=1)
-                logger.info(f"✅ 테스트 성공 - {len(test_data)}개 행 확인")
-
-                self.data_source = "service_account"
-                return True
-            else:
-                logger.info("✅ Service Account 인증 성공 (시트 URL 없음)")
-                self.data_source = "service_account"
-                return True
-
-        except Exception as e:
-            logger.error(f"Service Account 인증 실패: {e}")
-            # 권한 문제인 경우 구체적인 안내
-            if "permission" in str(e).lower() or "access" in str(e).lower():
-                logger.info("""
-🔧 권한 문제 해결 방법:
-1. Google Cloud Console → IAM 및 관리자 → 서비스 계정
-2. 서비스 계정 이메일 복사
-3. Google Sheets에서 해당 이메일에 편집 권한 부여
-4. Google Drive에서도 폴더 권한 확인
-""")
-            return False
-
-
-def _try_public_csv_improved(self, sheet_url: str = "") -> bool:
-        """개선된 공개 CSV 링크 방식"""
-        try:
-            if not sheet_url or not requests:
-                return False
-
-            logger.info("📥 공개 CSV 다운로드 시도")
-
-            # 구글시트 URL을 CSV 다운로드 URL로 변환
-            if "docs.google.com/spreadsheets" in sheet_url:
-                # 🔧 더 정확한 정규식 패턴
-                patterns = [
-                    r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-                    r'spreadsheets/d/([a-zA-Z0-9-_]+)',
-                    r'd/([a-zA-Z0-9-_]+)'
-                ]
-
-                sheet_id = None
-                for pattern in patterns:
-                    match = re.search(pattern, sheet_url)
-                    if match:
-                        sheet_id = match.group(1)
-                        break
-
-                if sheet_id:
-                    # 🔧 여러 CSV URL 패턴 시도
-                    csv_urls = [
-                        f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid=0",
-                        f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv",
-                        f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet=0"
-                    ]
-
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    }
-
-                    for csv_url in csv_urls:
-                        try:
-                            logger.info(f"📥 CSV 다운로드 시도: {csv_url}")
-                            response = requests.get(
-    csv_url, timeout=20, headers=headers)
-
-                            if response.status_code == 200 and len(
-                                response.text) > 100:
-                                logger.info(
-                                    f"✅ CSV 다운로드 성공 ({len(response.text)} bytes)")
-
-                                if pd:
-                                    # pandas 사용 가능한 경우
-                                    df = pd.read_csv(
-                                        io.StringIO(response.text))
-                                    self.last_data = df.to_dict('records')
-                                else:
-                                    # CSV 모듈로 직접 파싱
-                                    csv_reader = csv.DictReader(
-                                        io.StringIO(response.text))
-                                    self.last_data = list(csv_reader)
-
-                                self.data_source = "public_csv"
-                                logger.info(
-                                    f"✅ 공개 CSV로 {len(self.last_data)}개 행 로드")
-                                return True
-                        except Exception as e:
-                            logger.warning(f"CSV URL 실패: {e}")
-                            continue
-
-            return False
-
-        except Exception as e:
-            logger.error(f"공개 CSV 연결 실패: {e}")
-            return False
-
-    def _try_api_key_improved(self, sheet_url: str = "") -> bool:
-        """개선된 Google Sheets API v4 키 방식"""
-        try:
-            if not requests:
-                return False
-                
-            # 환경변수나 설정 파일에서 API 키 확인
-            api_keys = [
-                os.getenv("GOOGLE_API_KEY", ""),
-                os.getenv("GOOGLE_SHEETS_API_KEY", ""),
-            ]
-            
-            # API 키 파일에서도 확인
-            try:
-                if os.path.exists("google_api_key.txt"):
-                    with open("google_api_key.txt", 'r') as f:
-                        api_keys.append(f.read().strip())
-            except:
-                pass
-            
-            api_key = None
-            for key in api_keys:
-                if key and len(key) > 20:
-                    api_key = key
-                    break
-            
-            if not api_key or not sheet_url:
-                logger.info("Google API 키가 없거나 시트 URL이 없습니다.")
-                return False
-            
-            match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', sheet_url)
-            if not match:
-                return False
-            
-            sheet_id = match.group(1)
-            range_name = "A:Z"
-            
-            logger.info(f"🔑 Google Sheets API v4 사용 - Key: {api_key[:10]}...")
-            
-            url = f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}/values/{range_name}"
-            params = {
-                'key': api_key,
-                'majorDimension': 'ROWS'
-            }
-            
-            response = requests.get(url, params=params, timeout=20)
-            
-            if response.status_code == 200:
-                data = response.json()
-                values = data.get('values', [])
-                
-                if values and len(values) > 1:
-                    headers = values[0]
-                    rows = values[1:]
-                    
-                    records = []
-                    for row in rows:
-                        record = {}
-                        for i, header in enumerate(headers):
-                            record[header] = row[i] if i < len(row) else ""
-                        records.append(record)
-                    
-                    self.last_data = records
-                    self.data_source = "api_v4"
-                    logger.info(f"✅ API v4로 {len(records)}개 행 로드")
-                    return True
-            else:
-                logger.warning(f"API 요청 실패: {response.status_code} - {response.text}")
-            
-        except Exception as e:
-            logger.error(f"API 키 방식 실패: {e}")
-            return False
-        
-        return False
-    
-    def _try_oauth_flow(self, sheet_url: str = "") -> bool:
-        """OAuth 플로우 인증"""
-        try:
-            if not os.path.exists('client_secrets.json'):
-                logger.info("client_secrets.json 파일이 없습니다.")
-                return False
-                
-            from google.auth.transport.requests import Request
-            from google.oauth2.credentials import Credentials
-            from google_auth_oauthlib.flow import InstalledAppFlow
-            import gspread
-            
-            SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-            
-            creds = None
-            # 기존 토큰 확인
-            if os.path.exists('token.json'):
-                creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-            
-            # 토큰이 유효하지 않으면 새로 인증
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    try:
-                        creds.refresh(Request())
-                    except:
-                        creds = None
-                
-                if not creds:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        'client_secrets.json', SCOPES)
-                    creds = flow.run_local_server(port=0, timeout_seconds=60)
-                
-                # 토큰 저장
-                with open('token.json', 'w') as token:
-                    token.write(creds.to_json())
-            
-            self.client = gspread.authorize(creds)
-            
-            if sheet_url:
-                self.sheet = self.client.open_by_url(sheet_url).sheet1
-                test_data = self.sheet.get_all_records(head=1)
-                self.data_source = "oauth"
-                return True
-                
-        except Exception as e:
-            logger.error(f"OAuth 인증 실패: {e}")
-            return False
-        
-        return False
-    
-    def get_property_queue(self, sheet_url: str = "") -> List[Dict[str, Any]]:
-        """대기열에서 부동산 데이터 가져오기 - 광고시 유의사항 필드 포함"""
-        try:
-            # 연결이 안 되어 있으면 다시 시도
-            if self.data_source == "none":
-                self.setup_sheets_connection(sheet_url)
-            
-            # 연결 방식에 따라 데이터 가져오기
-            if self.data_source in ["service_account", "oauth"] and self.sheet:
-                try:
-                    logger.info("📊 실제 구글시트에서 데이터 읽기")
-                    records = self.sheet.get_all_records()
-                    logger.info(f"✅ {len(records)}개 행 로드됨")
-                except Exception as e:
-                    logger.warning(f"시트 읽기 실패: {e}")
-                    records = []
-            elif self.data_source in ["public_csv", "api_v4"]:
-                records = self.last_data
-                logger.info(f"📊 캐시된 데이터 사용: {len(records)}개 행")
-            else:
-                logger.info("📊 구글시트 연결 재시도")
-                records = []
-            
-            # 대기중인 항목만 필터링
-            pending_items = []
-            for idx, record in enumerate(records):
-                try:
-                    # 🔧 다양한 컬럼명 지원 (한글/영어 모두)
-                    status_fields = ['status', '상태', 'Status', '처리상태', '진행상태']
-                    address_fields = ['address', '주소', 'Address', '부동산주소', '매물주소']
-                    type_fields = ['property_type', '매물유형', 'Type', '부동산유형', 'PropertyType']
-                    # 🆕 광고시 유의사항 필드 추가
-                    notice_fields = ['광고시유의사항', '광고시 유의사항', 'advertising_notice', '유의사항', 'notice', 'Advertising Notice', '주의사항']
-                    
-                    status = ""
-                    address = ""
-                    property_type = "아파트"
-                    advertising_notice = ""  # 🆕 구글시트에서 읽어올 유의사항
-                    
-                    # 상태 필드 찾기
-                    for field in status_fields:
-                        if field in record and record[field]:
-                            status = str(record[field]).lower().strip()
-                            break
-                    
-                    # 주소 필드 찾기
-                    for field in address_fields:
-                        if field in record and record[field]:
-                            address = str(record[field]).strip()
-                            break
-                    
-                    # 매물유형 필드 찾기
-                    for field in type_fields:
-                        if field in record and record[field]:
-                            property_type = str(record[field]).strip()
-                            break
-                    
-                    # 🆕 광고시 유의사항 필드 찾기 (구글폼 마지막 항목)
-                    for field in notice_fields:
-                        if field in record and record[field]:
-                            advertising_notice = str(record[field]).strip()
-                            logger.info(f"📋 광고시 유의사항 발견: {advertising_notice[:50]}...")
-                            break
-                    
-                    # 기본 유의사항 (시트에 없는 경우)
-                    if not advertising_notice:
-                        advertising_notice = "본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다. 부동산 투자 시 신중한 검토가 필요합니다."
-                    
-                    # 대기중인 항목인지 확인
-                    waiting_keywords = ['대기', 'pending', '처리전', '신규', 'new', '']
-                    is_pending = any(keyword in status for keyword in waiting_keywords) or status == ''
-                    
-                    if is_pending and address:
-                        item = {
-                            'row_id': idx + 2,  # 헤더 행 제외
-                            'address': address,
-                            'property_type': property_type,
-                            'status': record.get('status', record.get('상태', '대기중')),
-                            'priority': record.get('priority', record.get('우선순위', record.get('Priority', 'medium'))),
-                            'created_date': record.get('created_date', record.get('등록일', 
-                                                     datetime.now().strftime('%Y-%m-%d'))),
-                            'advertising_notice': advertising_notice  # 🆕 구글시트에서 읽어온 유의사항
-                        }
-                        pending_items.append(item)
-                        
-                except Exception as e:
-                    logger.warning(f"행 {idx} 처리 오류: {e}")
-                    continue
-            
-            logger.info(f"📋 대기열에서 {len(pending_items)}개 항목을 가져왔습니다.")
-            return pending_items
-            
-        except Exception as e:
-            logger.error(f"대기열 가져오기 오류: {e}")
-            return self._get_mock_data()
-    
-    def _get_mock_data(self) -> List[Dict[str, Any]]:
-        """안전한 Mock 데이터 반환 - 유의사항 포함"""
-        return [
-            {
-                'row_id': 1,
-                'address': '서울시 강남구 대치동 아파트',
-                'property_type': '아파트',
-                'status': '대기중',
-                'priority': 'high',
-                'created_date': datetime.now().strftime('%Y-%m-%d'),
-                'advertising_notice': '본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다. 부동산 투자 시 신중한 검토가 필요합니다.'
-            },
-            {
-                'row_id': 2,
-                'address': '서울시 서초구 반포동 오피스텔',
-                'property_type': '오피스텔',
-                'status': '대기중',
-                'priority': 'medium',
-                'created_date': datetime.now().strftime('%Y-%m-%d'),
-                'advertising_notice': '투자에는 리스크가 따르며, 투자 결과에 대한 책임은 투자자 본인에게 있습니다. 전문가와 상담 후 결정하시기 바랍니다.'
-            }
-        ]
-    
-    def update_status(self, row_id: int, status: str, video_url: str = ""):
-        """상태 업데이트 - 안전한 방식"""
-        try:
-            if not self.is_connected:
-                logger.info(f"Mock: 행 {row_id} 상태를 '{status}'로 업데이트")
-                return
-                
-            if self.data_source in ["service_account", "oauth"] and self.sheet:
-                try:
-                    logger.info(f"📊 구글시트 상태 업데이트 시도: 행 {row_id}")
-                    
-                    # 헤더 행 가져오기
-                    headers = self.sheet.row_values(1)
-                    status_col = None
-                    url_col = None
-                    
-                    # 🔧 다양한 컬럼 이름 지원
-                    status_headers = ['status', '상태', 'Status', '처리상태']
-                    url_headers = ['url', '링크', 'link', 'youtube', 'YouTube', 'video_url', '동영상링크']
-                    
-                    # 컬럼 찾기
-                    for i, header in enumerate(headers):
-                        header_lower = header.lower().strip()
-                        
-                        # 상태 컬럼 찾기
-                        if any(keyword.lower() in header_lower for keyword in status_headers):
-                            status_col = i + 1
-                        
-                        # URL 컬럼 찾기
-                        if any(keyword.lower() in header_lower for keyword in url_headers):
-                            url_col = i + 1
-                    
-                    # 상태 업데이트
-                    if status_col:
-                        self.sheet.update_cell(row_id, status_col, status)
-                        logger.info(f"✅ 행 {row_id} 상태 업데이트: {status}")
-                    else:
-                        logger.warning("상태 컬럼을 찾을 수 없습니다.")
-                    
-                    # URL 업데이트
-                    if url_col and video_url:
-                        self.sheet.update_cell(row_id, url_col, video_url)
-                        logger.info(f"✅ 행 {row_id} URL 업데이트: {video_url}")
-                    elif video_url:
-                        logger.warning("URL 컬럼을 찾을 수 없습니다.")
-                    
-                except Exception as update_error:
-                    logger.warning(f"⚠️ 시트 업데이트 실패: {update_error}")
-                    logger.info(f"Mock: 행 {row_id} 상태를 '{status}'로 업데이트")
-            else:
-                logger.info(f"Mock: 행 {row_id} 상태를 '{status}'로 업데이트")
-                
-        except Exception as e:
-            logger.error(f"상태 업데이트 오류: {e}")
-            logger.info(f"Mock: 행 {row_id} 상태를 '{status}'로 업데이트")
-
-class CheongsanBrandingManager:
-    """청산부동산 브랜딩 관리자 - 광고시 유의사항 포함"""
-    
-    @staticmethod
-    def get_brand_colors() -> Dict[str, str]:
-        """브랜드 컬러 팔레트"""
-        return {
-            'primary': '#1E3A8A',      # 진한 파란색
-            'secondary': '#F59E0B',    # 주황색
-            'accent': '#10B981',       # 초록색
-            'text': '#1F2937',         # 진한 회색
-            'background': '#F9FAFB'    # 연한 회색
-        }
-    
-    @staticmethod
-    def get_brand_intro() -> str:
-        """브랜드 인트로 멘트"""
-        return """안녕하세요! 부동산 전문가 청산부동산입니다. 
-오늘도 여러분께 정확하고 신뢰할 수 있는 부동산 정보를 전해드리겠습니다."""
-    
-    @staticmethod
-    def get_brand_outro() -> str:
-        """브랜드 아웃트로 멘트"""
-        return """지금까지 청산부동산이었습니다. 
-부동산 투자나 매매에 대한 문의사항이 있으시면 언제든 연락주세요.
-전화: 02-1234-5678
-구독과 좋아요, 알림설정도 잊지 마세요! 감사합니다."""
-    
-    @staticmethod
-    def get_advertising_notice() -> str:
-        """🆕 광고시 유의사항"""
-        return """⚠️ 광고시 유의사항:
-본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다.
-부동산 투자 시에는 시장 상황, 개인의 재정 상태, 투자 목적 등을 종합적으로 고려하여 신중하게 결정하시기 바랍니다.
-모든 투자에는 리스크가 따르며, 투자 결과에 대한 책임은 투자자 본인에게 있습니다.
-정확한 정보는 공인중개사 및 관련 전문가와 상담 후 확인하시기 바랍니다."""
-    
-    @staticmethod
-    def create_branded_title(property_address: str, property_type: str) -> str:
-        """브랜드 타이틀 생성"""
-        titles = [
-            f"🏠 {property_address} {property_type} 완벽 분석 | 청산부동산",
-            f"📈 지금 사야 할까? {property_address} 시세 분석 | 청산부동산 전문가",
-            f"💰 {property_address} {property_type} 투자 포인트 3가지 | 청산부동산",
-            f"🔥 핫한 {property_address} 부동산 시장 분석 | 청산부동산",
-            f"⚡ {property_address} {property_type} 급등 예상? 전문가 분석 | 청산부동산"
-        ]
-        return titles[hash(property_address) % len(titles)]
-
-class EnhancedMockAPIHandler:
-    """향상된 Mock API 핸들러 - 구글시트 유의사항 사용"""
-    
-    @staticmethod
-    def mock_property_data(address: str, advertising_notice: str = "") -> PropertyData:
-        """부동산 Mock 데이터 - 구글시트에서 받은 유의사항 사용"""
-        import random
-        
-        price_base = random.randint(30000, 80000)  # 3억~8억
-        recent_prices = [
-            f"{price_base + random.randint(-500, 500)}만원",
-            f"{price_base + random.randint(-300, 300)}만원",
-            f"{price_base + random.randint(-200, 200)}만원"
-        ]
-        
-        trends = ['상승', '보합', '하락']
-        trend = random.choice(trends)
-        
-        # 🆕 구글시트에서 받은 유의사항이 없으면 기본값 사용
-        if not advertising_notice:
-            advertising_notice = CheongsanBrandingManager.get_advertising_notice()
-        
-        return PropertyData(
-            address=address,
-            property_type="아파트",
-            average_price=f"{price_base}만원",
-            recent_trades=recent_prices,
-            price_trend=trend,
-            market_analysis=f"최근 3개월간 거래량이 증가하고 있으며, {trend} 추세를 보이고 있습니다. "
-                          f"주변 재개발 계획과 교통 호재로 인해 중장기적으로 안정적인 투자처로 평가됩니다.",
-            school_info="초등학교 도보 5분, 중학교 도보 8분, 고등학교 도보 12분",
-            transport_info="지하철 2호선 도보 10분, 버스정류장 3분, 고속도로 진입 15분",
-            advertising_notice=advertising_notice  # 🆕 구글시트에서 받은 유의사항 사용
-        )
-
-class CompleteAutomationSystem:
-    """완전 자동화 시스템 - 모든 기능 통합 및 개선"""
-    
-    def __init__(self):
-        self.sheets_manager = FixedSheetsManager()
-        self.branding = CheongsanBrandingManager()
-        self.mock_handler = EnhancedMockAPIHandler()
-        self.tts_engine = RealTTSEngine()
-        self.video_editor = RealVideoEditor()
-        self.youtube_uploader = YouTubeUploader()
-        self.auto_monitor = AutoMonitoringManager(self)
-        self.progress_callback = None
-        self.progress_tracker = None
-        
-    def set_progress_callback(self, callback):
-        """진행상황 콜백 설정"""
-        self.progress_callback = callback
-
-    def _get_output_folder(self) -> str:
-        """바탕화면 완성 폴더 경로 반환"""
-        try:
-            desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-            output_folder = os.path.join(desktop, "완성")
-            if not os.path.exists(output_folder):
-                os.makedirs(output_folder)
-                logger.info(f"📁 완성 폴더 생성: {output_folder}")
-            return output_folder
-        except Exception as e:
-            logger.warning(f"완성 폴더 생성 실패: {e}")
-            return os.getcwd()
-
-    def update_progress(self, message: str, percent: int = 0):
-        """진행상황 업데이트"""
-        logger.info(message)
-        if self.progress_callback:
-            try:
-                self.progress_callback(message, percent)
-            except Exception as e:
-                logger.warning(f"진행률 콜백 오류: {e}")
-    
-    def set_auto_upload_mode(self, enabled: bool):
-        """🆕 100% 자동화 모드 설정"""
-        self.youtube_uploader.set_auto_upload_mode(enabled)
-    
-    def start_auto_monitoring(self, sheet_url: str = ""):
-        """자동 모니터링 시작"""
-        try:
-            self.auto_monitor.start_monitoring(sheet_url)
-            return True
-        except Exception as e:
-            logger.error(f"자동 모니터링 시작 오류: {e}")
-            return False
-    
-    def stop_auto_monitoring(self):
-        """자동 모니터링 중지"""
-        try:
-            self.auto_monitor.stop_monitoring()
-            return True
-        except Exception as e:
-            logger.error(f"자동 모니터링 중지 오류: {e}")
-            return False
-    
-    def get_monitoring_status(self) -> Dict:
-        """모니터링 상태 확인"""
-        return self.auto_monitor.get_status()
-    
-    def run_full_automation(self, property_address: str, property_type="아파트", 
-                           sheets_row_id: Optional[int] = None) -> ContentResult:
-        """완전 자동화 실행 - 기본 유의사항 사용"""
-        return self.run_full_automation_with_notice(property_address, property_type, "", sheets_row_id)
-    
-    def run_full_automation_with_notice(self, property_address: str, property_type="아파트", 
-                                      advertising_notice: str = "", 
-                                      sheets_row_id: Optional[int] = None) -> ContentResult:
-        """🆕 완전 자동화 실행 - 구글시트 유의사항 포함"""
-        try:
-            # 🆕 진행률 추적 시스템 초기화
-            self.progress_tracker = ProgressTracker(self.update_progress)
-            
-            self.progress_tracker.update(0, "🚀 청산부동산 완전 자동화 시작...")
-            
-            # 1단계: 부동산 데이터 수집 (구글시트 유의사항 포함)
-            self.progress_tracker.update(1, "🏠 부동산 데이터 수집 중...")
-            property_data = self.mock_handler.mock_property_data(property_address, advertising_notice)
-            
-            # 2단계: 브랜디드 스크립트 생성 (구글시트 유의사항 포함)
-            self.progress_tracker.update(2, "✍️ AI 스크립트 생성 중...")
-            script_data = self._generate_branded_script_with_notice(property_data)
-            
-            # 3단계: PPT 생성 (구글시트 유의사항 포함)
-            self.progress_tracker.update(3, "📊 브랜디드 PPT 생성 중...")
-            ppt_file = self._create_branded_ppt_with_notice(script_data, property_data)
-            
-            # 4단계: 썸네일 생성
-            self.progress_tracker.update(4, "🎨 썸네일 생성 중...")
-            thumbnail_file = self._create_thumbnail(property_data, script_data)
-            
-            # 5단계: 실제 음성 생성
-            self.progress_tracker.update(5, "🎙️ 음성 생성 중...")
-            voice_file, subtitle_file = self._generate_real_voice_and_subtitles(script_data)
-            
-            # 6단계: 자막 파일 생성
-            self.progress_tracker.update(6, "📝 자막 파일 생성 중...")
-            # 이미 위에서 처리됨
-            
-            # 7단계: 실제 영상 생성
-            self.progress_tracker.update(7, "🎬 영상 편집 중...")
-            video_file = self._create_real_video(ppt_file, voice_file, 
-                                               subtitle_file, thumbnail_file)
-            
-            # 8단계: YouTube 업로드
-            self.progress_tracker.update(8, "📺 YouTube 업로드 중...")
-            youtube_url = self._upload_to_youtube_with_confirmation(
-                video_file, property_data, script_data['full_script'])
-            
-            # 9단계: 구글시트 상태 업데이트
-            self.progress_tracker.update(9, "✅ 최종 완료 및 상태 업데이트...")
-            if sheets_row_id:
-                self.sheets_manager.update_status(sheets_row_id, "완료", youtube_url)
-            
-            result = ContentResult(
-                video_file=video_file,
-                script=script_data['full_script'],
-                ppt_file=ppt_file,
-                voice_file=voice_file,
-                subtitle_file=subtitle_file,
-                thumbnail_file=thumbnail_file,
-                youtube_url=youtube_url,
-                success=True,
-                sheets_row_id=sheets_row_id
-            )
-            
-            self.progress_tracker.update(9, "🎉 완전 자동화 100% 완료!", 100)
-            return result
-            
-        except Exception as e:
-            logger.error(f"완전 자동화 오류: {e}")
-            if sheets_row_id:
-                self.sheets_manager.update_status(sheets_row_id, "오류", "")
-            
-            return ContentResult(
-                video_file="",
-                script="",
-                ppt_file="",
-                voice_file="",
-                subtitle_file="",
-                thumbnail_file="",
-                youtube_url="",
-                success=False,
-                error_message=str(e),
-                sheets_row_id=sheets_row_id
-            )
-    
-    def _generate_branded_script_with_notice(self, property_data: PropertyData) -> Dict[str, Any]:
-        """🆕 광고시 유의사항이 포함된 브랜디드 스크립트 생성"""
-        intro = self.branding.get_brand_intro()
-        outro = self.branding.get_brand_outro()
-        advertising_notice = property_data.advertising_notice
-        
-        main_script = f"""
-{intro}
-
-오늘은 {property_data.address} 지역의 {property_data.property_type} 시장을 전문가의 시각으로 분석해보겠습니다.
-
-현재 이 지역 평균 시세는 {property_data.average_price}입니다. 최근 실거래가를 살펴보면, {', '.join(property_data.recent_trades[:3])}에 거래가 성사되었습니다.
-
-시장 동향을 보면 현재 {property_data.price_trend} 추세를 보이고 있습니다. {property_data.market_analysis}
-
-교육 환경을 살펴보겠습니다. {property_data.school_info}로 자녀 교육에 매우 유리한 조건입니다. 교통 접근성도 {property_data.transport_info}로 출퇴근과 생활에 편리합니다.
-
-투자 관점에서 보면, 이 지역은 다음과 같은 장점이 있습니다. 첫째, 우수한 학군으로 인한 수요 안정성. 둘째, 교통 호재로 인한 접근성 개선. 셋째, 주변 개발 계획으로 인한 미래 가치 상승 기대입니다.
-
-청산부동산의 전문가 의견으로는, 현재 시점에서 이 지역은 안정적인 투자처로 추천드립니다. 특히 장기 보유를 고려하신다면 더욱 유리할 것으로 판단됩니다.
-
-🆕 {advertising_notice}
-
-{outro}
-"""
-        
-        return {
-            'full_script': main_script,
-            'duration': '6분',
-            'word_count': len(main_script.split()),
-            'advertising_notice': advertising_notice
-        }
-    
-    def _create_branded_ppt_with_notice(self, script_data: Dict[str, Any], property_data: PropertyData) -> str:
-        """🆕 광고시 유의사항이 포함된 브랜디드 PPT 생성"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        ppt_filename = os.path.join(self._get_output_folder(), f"청산부동산_분석_{timestamp}.pptx")
-        
-        if PPTX_AVAILABLE:
-            try:
-                prs = Presentation()
-                
-                # 제목 슬라이드
-                slide_layout = prs.slide_layouts[0]
-                slide = prs.slides.add_slide(slide_layout)
-                title = slide.shapes.title
-                subtitle = slide.placeholders[1]
-                
-                title.text = "청산부동산 전문가 분석"
-                subtitle.text = f"{property_data.address}\n{property_data.property_type} 투자 분석 리포트"
-                
-                # 시세 분석 슬라이드
-                slide_layout = prs.slide_layouts[1]
-                slide = prs.slides.add_slide(slide_layout)
-                title = slide.shapes.title
-                content = slide.placeholders[1]
-                title.text = "💰 현재 시세 분석"
-                content.text = f"""
-📍 평균 시세: {property_data.average_price}
-📈 최근 거래가: {', '.join(property_data.recent_trades)}
-📊 시장 트렌드: {property_data.price_trend}
-
-전문가 분석:
-{property_data.market_analysis[:150]}..."""
-                
-                # 입지 분석 슬라이드
-                slide_layout = prs.slide_layouts[1]
-                slide = prs.slides.add_slide(slide_layout)
-                title = slide.shapes.title
-                content = slide.placeholders[1]
-                title.text = "🏫 입지 및 교통 분석"
-                content.text = f"""
-🎓 교육 환경: {property_data.school_info}
-🚇 교통 접근성: {property_data.transport_info}
-🏪 생활 편의시설: 대형마트, 병원, 공원 인근
-
-청산부동산 평가: ⭐⭐⭐⭐⭐"""
-                
-                # 🆕 광고시 유의사항 슬라이드 추가
-                slide_layout = prs.slide_layouts[1]
-                slide = prs.slides.add_slide(slide_layout)
-                title = slide.shapes.title
-                content = slide.placeholders[1]
-                title.text = "⚠️ 광고시 유의사항"
-                content.text = property_data.advertising_notice
-                
-                prs.save(ppt_filename)
-                return ppt_filename
-                
-            except Exception as e:
-                logger.error(f"PPT 생성 오류: {e}")
-        
-        # 텍스트 버전 생성
-        txt_filename = ppt_filename.replace('.pptx', '.txt')
-        with open(txt_filename, 'w', encoding='utf-8') as f:
-            f.write(f"청산부동산 분석 - {property_data.address}\n")
-            f.write(f"평균 시세: {property_data.average_price}\n")
-            f.write(f"시장 트렌드: {property_data.price_trend}\n")
-            f.write(f"광고시 유의사항: {property_data.advertising_notice}\n")
-        
-        return txt_filename
-    
-    def _create_thumbnail(self, property_data: PropertyData, script_data: Dict[str, Any]) -> str:
-        """썸네일 생성"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        thumbnail_filename = os.path.join(self._get_output_folder(), f"thumbnail_{timestamp}.png")
-        
-        if PIL_AVAILABLE:
-            try:
-                width, height = 1280, 720
-                img = Image.new('RGB', (width, height), color='#1E3A8A')
-                draw = ImageDraw.Draw(img)
-                
-                try:
-                    font_large = ImageFont.truetype("arial.ttf", 60)
-                    font_medium = ImageFont.truetype("arial.ttf", 40)
-                    font_small = ImageFont.truetype("arial.ttf", 30)
-                except:
-                    font_large = ImageFont.load_default()
-                    font_medium = ImageFont.load_default()
-                    font_small = ImageFont.load_default()
-                
-                # 텍스트 그리기
-                title_text = f"{property_data.address}"
-                draw.text((50, 100), title_text, fill='white', font=font_large)
-                
-                price_text = f"평균 {property_data.average_price}"
-                draw.text((50, 200), price_text, fill='#F59E0B', font=font_medium)
-                
-                trend_text = f"시장 트렌드: {property_data.price_trend}"
-                draw.text((50, 260), trend_text, fill='#10B981', font=font_small)
-                
-                brand_text = "청산부동산"
-                draw.text((50, height-120), brand_text, fill='white', font=font_medium)
-                
-                # 🆕 유의사항 표시
-                notice_text = "투자 전 전문가 상담 필수"
-                draw.text((50, height-80), notice_text, fill='#EF4444', font=font_small)
-                
-                img.save(thumbnail_filename)
-                return thumbnail_filename
-                
-            except Exception as e:
-                logger.error(f"썸네일 생성 오류: {e}")
-        
-        # HTML 버전 생성
-        html_filename = thumbnail_filename.replace('.png', '.html')
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>청산부동산 썸네일</title>
-    <style>
-        body {{
-            background: #1E3A8A;
-            color: white;
-            font-family: Arial;
-            padding: 50px;
-            width: 1280px;
-            height: 720px;
-        }}
-        .title {{ font-size: 60px; }}
-        .price {{ color: #F59E0B; font-size: 40px; }}
-        .brand {{ color: #10B981; font-size: 40px; }}
-        .notice {{ color: #EF4444; font-size: 20px; }}
-    </style>
-</head>
-<body>
-    <div class="title">{property_data.address}</div>
-    <div class="price">평균 {property_data.average_price}</div>
-    <div class="brand">청산부동산</div>
-    <div class="notice">투자 전 전문가 상담 필수</div>
-</body>
-</html>"""
-        
-        with open(html_filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return html_filename
-    
-    def _generate_real_voice_and_subtitles(self, script_data: Dict[str, Any]) -> Tuple[str, str]:
-        """실제 음성 및 자막 생성 - 진행률 추적"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        voice_file = os.path.join(self._get_output_folder(), f"narration_{timestamp}.wav")
-        subtitle_file = os.path.join(self._get_output_folder(), f"subtitles_{timestamp}.srt")
-        
-        # 실제 음성 생성
-        success = self.tts_engine.generate_voice(script_data['full_script'], voice_file, self.progress_tracker)
-        if not success:
-            logger.warning("음성 생성 실패. Mock 파일 사용")
-        
-        # 자막 생성
-        self._create_subtitle_file(script_data['full_script'], subtitle_file)
-        
-        return voice_file, subtitle_file
-    
-    def _create_subtitle_file(self, script: str, filename: str):
-        """SRT 자막 파일 생성"""
-        sentences = [s.strip() for s in script.split('.') if s.strip()]
-        subtitle_content = ""
-        
-        for i, sentence in enumerate(sentences[:20]):
-            start_time = i * 10
-            end_time = (i + 1) * 10
-            
-            subtitle_content += f"{i+1}\n"
-            subtitle_content += f"{self._format_time(start_time)} --> {self._format_time(end_time)}\n"
-            subtitle_content += f"{sentence}\n\n"
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(subtitle_content)
-        except Exception as e:
-            logger.error(f"자막 파일 생성 오류: {e}")
-    
-    def _format_time(self, seconds: int) -> str:
-        """시간 포맷 변환 (SRT 형식)"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},000"
-    
-    def _create_real_video(self, ppt_file: str, voice_file: str, 
-                          subtitle_file: str, thumbnail_file: str):
-        """실제 영상 생성 - 진행률 추적"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        video_file = os.path.join(self._get_output_folder(), f"청산부동산_영상_{timestamp}.mp4")
-        
-        # 실제 영상 편집
-        success = self.video_editor.create_video_from_ppt(
-            ppt_file, voice_file, subtitle_file, video_file, self.progress_tracker)
-        
-        if not success:
-            logger.warning("영상 생성 실패. Mock 파일 사용")
-        
-        return video_file
-    
-    def _upload_to_youtube_with_confirmation(self, video_file: str, 
-                                           property_data: PropertyData, script: str):
-        """확인 팝업 후 YouTube 업로드 - 광고시 유의사항 포함"""
-        try:
-            # YouTube 제목 및 설명 생성
-            title = self.branding.create_branded_title(
-                property_data.address, property_data.property_type)
-            
-            description = f"""
-🏠 {property_data.address} {property_data.property_type} 전문가 분석
-
-📊 주요 정보:
-• 평균 시세: {property_data.average_price}
-• 시장 트렌드: {property_data.price_trend}
-• 교육 환경: {property_data.school_info}
-• 교통 접근성: {property_data.transport_info}
-
-📈 전문가 분석:
-{property_data.market_analysis}
-
-⚠️ 광고시 유의사항:
-{property_data.advertising_notice}
-
-📞 문의: {property_data.contact_info}
-🏢 {property_data.brand_message}
-
-#부동산 #투자 #청산부동산 #아파트 #시세분석
-"""
-            
-            # YouTube 업로드 (확인 팝업 포함 또는 100% 자동화)
-            success, youtube_url = self.youtube_uploader.upload_video_with_confirmation(
-                video_file, title, description, 
-                tags=['부동산', '투자', '청산부동산', '아파트', '시세분석'],
-                progress_tracker=self.progress_tracker)
-            
-            if success:
-                return youtube_url
-            else:
-                logger.error(f"YouTube 업로드 실패: {youtube_url}")
-                return f"업로드 실패: {youtube_url}"
-                
-        except Exception as e:
-            logger.error(f"YouTube 업로드 오류: {e}")
-            return f"업로드 오류: {str(e)}"
-
-# 콘솔 모드 함수들
-def safe_main_console():
-    """안전한 콘솔 모드 메인 함수 - v3.0 업그레이드"""
-    print("🏢 청산부동산 완전 자동화 시스템 v3.0 🚀")
-    print("=" * 70)
-    print("🔧 v3.0 업그레이드 완료:")
-    print("• Google Sheets 인증 문제 완전 해결")
-    print("• 실시간 진행률 바 + 10단계 세부 상태 표시")
-    print("• 광고시 유의사항 구글폼 연동 (접수폼 마지막 항목)")
-    print("• 100% 완전 자동화 달성")
-    print("=" * 70)
-    
-    # 라이브러리 상태 확인
-    automation = CompleteAutomationSystem()
-    
-    print(f"🎙️ TTS 엔진: {'✅ ' + TTS_ENGINE if TTS_ENGINE else '❌ 없음'}")
-    print(f"🎬 FFmpeg: {'✅ 사용 가능' if automation.video_editor.ffmpeg_available else '❌ 없음'}")
-    print(f"📺 YouTube API: {'✅ 사용 가능' if YOUTUBE_API_AVAILABLE else '❌ 없음'}")
-    print(f"📋 Google Sheets: {'✅ 사용 가능' if GSPREAD_AVAILABLE else '❌ 없음'}")
-    
-    # 🔧 인증 파일 상태 확인
-    print("\n📋 인증 파일 상태:")
-    print(f"📄 credentials.json: {'✅ 발견' if os.path.exists('credentials.json') else '❌ 없음'}")
-    print(f"📄 youtube_secrets.json: {'✅ 발견' if os.path.exists('youtube_secrets.json') else '❌ 없음'}")
-    print()
-    
-    while True:
-        print("\n📋 메뉴를 선택하세요:")
-        print("1. 🚀 24시간 자동 모니터링 시작 (100% 무인 운영)")
-        print("2. ⏹️ 자동 모니터링 중지")
-        print("3. 📊 모니터링 상태 확인")
-        print("4. 🎬 단일 완전 자동화 (YouTube 업로드 포함)")
-        print("5. 🔧 시스템 상태 확인")
-        print("6. 📺 YouTube 인증 설정")
-        print("7. 📋 구글시트 연결 테스트")
-        print("8. 🎯 100% 자동화 모드 설정")
-        print("9. ❌ 종료")
-        
-        try:
-            choice = input("\n선택 (1-9): ").strip()
-            
-            if choice == "1":
-                print("\n🚀 24시간 자동 모니터링 시작")
-                sheet_url = input("구글시트 URL (엔터시 기본값): ").strip()
-                if not sheet_url:
-                    sheet_url = "https://docs.google.com/spreadsheets/d/1xXxaMYfdTytn3a28_c9AuAEMU4Uu3PLI99FfWZHbknE/edit?usp=sharing"
-                
-                auto_mode_input = input("100% 자동화 모드 사용? (y/n, 기본값: n): ").strip().lower()
-                auto_mode = auto_mode_input in ['y', 'yes', '예']
-                automation.set_auto_upload_mode(auto_mode)
-                
-                if automation.start_auto_monitoring(sheet_url):
-                    mode_text = "100% 자동화" if auto_mode else "확인 팝업 포함"
-                    print(f"✅ 자동 모니터링이 시작되었습니다! (모드: {mode_text})")
-                    print("📡 5분마다 구글시트를 체크하여 새 항목을 완전 자동화 처리합니다.")
-                    print("🎬 스크립트 → PPT → 음성 → 영상 → YouTube 업로드까지 완전 자동화!")
-                    if auto_mode:
-                        print("🎯 100% 자동화: 확인 팝업 없이 바로 업로드")
-                    print("⚠️ 이 프로그램을 종료하지 마세요. (24시간 무인 운영)")
-                else:
-                    print("❌ 자동 모니터링 시작 실패")
-                    
-            elif choice == "2":
-                print("\n⏹️ 자동 모니터링 중지")
-                if automation.stop_auto_monitoring():
-                    print("✅ 자동 모니터링이 중지되었습니다.")
-                else:
-                    print("❌ 자동 모니터링 중지 실패")
-                    
-            elif choice == "3":
-                print("\n📊 모니터링 상태 확인")
-                status = automation.get_monitoring_status()
-                print(f"🔄 실행 중: {'예' if status['is_running'] else '아니오'}")
-                print(f"📅 마지막 체크: {status['last_check']}")
-                print(f"⏰ 체크 간격: {status['check_interval_minutes']}분")
-                print(f"📋 처리된 항목: {status['processed_count']}개")
-                print(f"🔗 시트 URL: {status['sheet_url']}")
-                print(f"🧵 스레드 상태: {'활성' if status['thread_alive'] else '비활성'}")
-                
-            elif choice == "4":
-                print("\n🎬 단일 완전 자동화 실행")
-                address = input("부동산 주소: ").strip() or "서울시 강남구 대치동 아파트"
-                property_type = input("매물 유형 (기본: 아파트): ").strip() or "아파트"
-                
-                auto_mode_input = input("100% 자동화 모드 사용? (y/n, 기본값: n): ").strip().lower()
-                auto_mode = auto_mode_input in ['y', 'yes', '예']
-                automation.set_auto_upload_mode(auto_mode)
-                
-                mode_text = "100% 자동화" if auto_mode else "확인 팝업 포함"
-                print(f"\n🚀 {address} 완전 자동화 시작... (모드: {mode_text})")
-                print("📋 스크립트 생성 → 📊 PPT 제작 → 🎙️ 음성 생성 → 🎬 영상 편집 → 📺 YouTube 업로드")
-                print("🆕 구글폼 '광고시 유의사항' 필드가 자동으로 연동됩니다.")
-                
-                result = automation.run_full_automation(address, property_type)
-                
-                if result.success:
-                    print(f"\n🎉 완전 자동화 v3.0 성공!")
-                    print(f"📹 영상: {result.video_file}")
-                    print(f"📊 PPT: {result.ppt_file}")
-                    print(f"🎨 썸네일: {result.thumbnail_file}")
-                    print(f"🎙️ 음성: {result.voice_file}")
-                    print(f"📝 자막: {result.subtitle_file}")
-                    print(f"📺 YouTube: {result.youtube_url}")
-                    print(f"⚠️ 광고시 유의사항이 구글폼 연동으로 자동 포함되었습니다.")
-                    print(f"\n✨ 모든 과정이 완료되었습니다!")
-                else:
-                    print(f"\n❌ 완전 자동화 실패: {result.error_message}")
-                    
-            elif choice == "5":
-                print("\n🔧 시스템 상태 확인")
-                print(f"🎙️ TTS 엔진: {'✅ ' + TTS_ENGINE if TTS_ENGINE else '❌ 설치 필요: pip install pyttsx3 gTTS'}")
-                print(f"🎬 FFmpeg: {'✅ 사용 가능' if automation.video_editor.ffmpeg_available else '❌ 설치 필요: https://ffmpeg.org/download.html'}")
-                print(f"📺 YouTube API: {'✅ 사용 가능' if YOUTUBE_API_AVAILABLE else '❌ 설치 필요: pip install google-api-python-client'}")
-                print(f"📋 Google Sheets: {'✅ 사용 가능' if GSPREAD_AVAILABLE else '❌ 설치 필요: pip install gspread google-auth'}")
-                print(f"🖼️ 이미지 처리: {'✅ 사용 가능' if PIL_AVAILABLE else '❌ 설치 필요: pip install Pillow'}")
-                print(f"📊 PPT 생성: {'✅ 사용 가능' if PPTX_AVAILABLE else '❌ 설치 필요: pip install python-pptx'}")
-                print(f"📈 데이터 처리: {'✅ 사용 가능' if pd else '❌ 설치 필요: pip install pandas'}")
-                
-                # 🔧 인증 파일 상태
-                print(f"\n📋 인증 파일:")
-                print(f"📄 credentials.json: {'✅ 발견' if os.path.exists('credentials.json') else '❌ 없음'}")
-                print(f"📄 youtube_secrets.json: {'✅ 발견' if os.path.exists('youtube_secrets.json') else '❌ 없음'}")
-                
-                automation_level = 0
-                if TTS_ENGINE: automation_level += 20
-                if automation.video_editor.ffmpeg_available: automation_level += 25
-                if YOUTUBE_API_AVAILABLE: automation_level += 20
-                if GSPREAD_AVAILABLE: automation_level += 20
-                if PIL_AVAILABLE: automation_level += 10
-                if PPTX_AVAILABLE: automation_level += 5
-                
-                print(f"\n📊 전체 자동화 수준: {automation_level}%")
-                if automation_level >= 95:
-                    print("🎉 100% 완전 자동화 가능!")
-                elif automation_level >= 80:
-                    print("⚡ 거의 완전 자동화 가능")
-                elif automation_level >= 60:
-                    print("⚠️ 일부 수동 작업 필요")
-                else:
-                    print("❌ 많은 라이브러리 설치 필요")
-                    
-            elif choice == "6":
-                print("\n📺 YouTube 인증 설정")
-                print("YouTube 자동 업로드를 위해 다음이 필요합니다:")
-                print("1. Google Cloud Console에서 YouTube Data API v3 활성화")
-                print("2. OAuth 2.0 클라이언트 ID 생성 (데스크톱 애플리케이션)")
-                print("3. JSON 파일을 youtube_secrets.json으로 저장")
-                print()
-                
-                if input("인증을 시도하시겠습니까? (y/n): ").lower() == 'y':
-                    if automation.youtube_uploader.setup_youtube_auth():
-                        print("✅ YouTube 인증 성공!")
-                    else:
-                        print("❌ YouTube 인증 실패. youtube_secrets.json 파일을 확인해주세요.")
-                        
-            elif choice == "7":
-                print("\n📋 구글시트 연결 테스트")
-                sheet_url = input("테스트할 시트 URL (엔터시 기본값): ").strip()
-                if not sheet_url:
-                    sheet_url = "https://docs.google.com/spreadsheets/d/1xXxaMYfdTytn3a28_c9AuAEMU4Uu3PLI99FfWZHbknE/edit?usp=sharing"
-                
-                print("🔄 구글시트 연결 테스트 중...")
-                if automation.sheets_manager.setup_sheets_connection(sheet_url):
-                    print(f"✅ 구글시트 연결 성공! (방식: {automation.sheets_manager.data_source})")
-                    
-                    # 데이터 읽기 테스트
-                    items = automation.sheets_manager.get_property_queue(sheet_url)
-                    print(f"📊 읽어온 데이터: {len(items)}개 항목")
-                    
-                    if items:
-                        print("\n📋 대기중인 항목들:")
-                        for item in items[:5]:
-                            print(f"• {item.get('address', 'N/A')} ({item.get('property_type', 'N/A')})")
-                            # 🆕 광고시 유의사항 표시
-                            notice = item.get('advertising_notice', '')
-                            if notice:
-                                print(f"  📋 유의사항: {notice[:50]}...")
-                else:
-                    print("❌ 구글시트 연결 실패")
-                    print("💡 해결 방법:")
-                    print("1. credentials.json 파일 확인")
-                    print("2. 시트에 서비스 계정 이메일 편집 권한 부여")
-                    print("3. 시트를 '링크가 있는 모든 사용자'로 공개 설정")
-                    
-            elif choice == "8":
-                print("\n🎯 100% 자동화 모드 설정")
-                current_mode = automation.youtube_uploader.auto_upload_mode
-                print(f"현재 모드: {'100% 자동화' if current_mode else '확인 팝업 포함'}")
-                
-                new_mode_input = input("100% 자동화 모드로 변경? (y/n): ").strip().lower()
-                new_mode = new_mode_input in ['y', 'yes', '예']
-                
-                automation.set_auto_upload_mode(new_mode)
-                mode_text = "100% 자동화" if new_mode else "확인 팝업 포함"
-                print(f"✅ 모드가 '{mode_text}'로 설정되었습니다.")
-                
-            elif choice == "9":
-                print("\n⏹️ 프로그램 종료 중...")
-                
-                # 자동 모니터링 중지
-                if automation.get_monitoring_status()['is_running']:
-                    print("🔄 자동 모니터링 중지 중...")
-                    automation.stop_auto_monitoring()
-                
-                print("👋 청산부동산 완전 자동화 시스템 v3.0을 종료합니다.")
-                break
-                
-            else:
-                print("❌ 잘못된 선택입니다. 1-9 중에서 선택해주세요.")
-                
-        except KeyboardInterrupt:
-            print("\n\n⏹️ 사용자가 중단했습니다.")
-            
-            # 자동 모니터링 중지
-            if automation.get_monitoring_status()['is_running']:
-                print("🔄 자동 모니터링 중지 중...")
-                automation.stop_auto_monitoring()
-            break
-        except Exception as e:
-            print(f"\n❌ 오류 발생: {e}")
-            logger.error(f"콘솔 실행 오류: {e}")
-
-# 신호 핸들러
-def signal_handler(signum, frame):
-    """안전한 종료 처리"""
-    global SHUTDOWN_FLAG, MONITORING_ACTIVE
-    
-    print("\n⏹️ 종료 신호 감지됨...")
-    SHUTDOWN_FLAG = True
-    MONITORING_ACTIVE = False
-    
-    # 정리 시간
-    time.sleep(2)
-    
-    print("👋 안전하게 종료되었습니다.")
-    sys.exit(0)
-
-# 메인 실행 함수
-def main():
-    """메인 실행 함수 - v3.0 완전 업그레이드 버전"""
-    # 신호 핸들러 등록
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
-    print("🏢 청산부동산 완전 자동화 시스템 v3.0 🚀")
-    print("=" * 60)
-    print("🎉 v3.0 업그레이드 완료!")
-    print("✅ Google Sheets 인증 수정 | 📊 진행률 개선")
-    print("✅ 광고시 유의사항 구글폼 연동 | 🎯 100% 자동화 달성")
-    print("=" * 60)
-    
-    # 모드 선택
-    if len(sys.argv) > 1 and sys.argv[1] == "--console":
-        safe_main_console()
-    else:
-        print("⚠️ GUI 기능은 최종 코드에서 제외되었습니다. 콘솔 모드로 실행합니다.")
-        safe_main_console()
-
-if __name__ == "__main__":
-    try:
-        main()
-    except Exception as e:
-        logger.error(f"프로그램 실행 오류: {e}")
-        print(f"❌ 심각한 오류 발생: {e}")
-        print("\n🔧 필요한 라이브러리 설치:")
-        print("pip install pandas requests python-pptx pillow gspread google-auth")
-        print("pip install pyttsx3 gTTS google-api-python-client google-auth-oauthlib")
-        print("\n📺 YouTube 업로드를 위해서는:")
-        print("1. Google Cloud Console에서 YouTube Data API v3 활성화")
-        print("2. OAuth 2.0 클라이언트 ID 생성")
-        print("3. JSON 파일을 youtube_secrets.json으로 저장")
-        print("\n🎬 영상 편집을 위해서는:")
-        print("FFmpeg 설치: https://ffmpeg.org/download.html")
-        print("\n📋 구글시트 연동을 위해서는:")
-        print("1. credentials.json 파일 준비")
-        print("2. 시트에 서비스 계정 편집 권한 부여")
-    finally:
-        # 최종 정리
-        SHUTDOWN_FLAG = True
-        print("🔄 프로그램 종료 중...")
-
+# 청산부동산 유튜브 완전 자동화 시스템 v3.0 - 업그레이드 완료
+# 🔧 수정사항:
+# 1. Google Sheets 인증 문제 완전 해결 (Mock 모드 탈출)
+# 2. 실시간 진행률 바 + 단계별 상태 표시 강화
+# 3. "광고시 유의사항" 필드 추가 (PPT, 스크립트, YouTube 설명에 포함)
+# 4. 완전 자동화 100% 달성 (선택적 확인 팝업)
+# 5. 🆕 모든 오류 수정 완료 - 바로 작동 가능!
+
+# 기본 라이브러리
+import json
+import functools
+import hashlib
+import os
+import time
+import threading
+import logging
+import urllib.parse
+import csv
+import io
+import itertools
+import importlib.util
+import signal
+import sys
+import subprocess
+import shutil
+import re
+from collections import deque
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple, Any
+import tempfile
+import platform
+import weakref
+import wave
+import zlib
+
+# 안전한 import with 예외처리
+try:
+    import requests
+except ImportError:
+    print("⚠️ requests 라이브러리가 없습니다. pip install requests")
+    requests = None
+
+# pandas는 import 비용이 커서 (수백 ms) 첫 사용 시점으로 지연
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+pd = None  # _ensure_pandas()가 첫 사용 시 채움
+if not PANDAS_AVAILABLE:
+    print("⚠️ pandas 라이브러리가 없습니다. pip install pandas")
+
+
+def _ensure_pandas():
+    """pandas 지연 import - 메뉴/상태 확인 경로는 import 비용을 내지 않음"""
+    global pd
+    if pd is None and PANDAS_AVAILABLE:
+        import pandas
+        pd = pandas
+    return pd
+
+# GUI 라이브러리 안전 import
+try:
+    import tkinter as tk
+    from tkinter import messagebox, ttk, filedialog
+    from tkinter import scrolledtext
+    GUI_AVAILABLE = True
+except ImportError:
+    print("⚠️ tkinter GUI를 사용할 수 없습니다.")
+    GUI_AVAILABLE = False
+    tk = None
+
+# PPT 라이브러리 - python-pptx도 import가 무거워 사용 함수 안에서 지연 import
+PPTX_AVAILABLE = importlib.util.find_spec("pptx") is not None
+if not PPTX_AVAILABLE:
+    print("ℹ️ python-pptx 없음. PPT 기능은 Mock으로 동작합니다.")
+
+# 이미지 처리 라이브러리
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    print("ℹ️ Pillow 없음. 썸네일 기능은 Mock으로 동작합니다.")
+    PIL_AVAILABLE = False
+
+# 수치 연산 라이브러리 (슬라이드 합성 가속)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    print("ℹ️ numpy 없음. 슬라이드 합성은 PIL로 동작합니다.")
+    NUMPY_AVAILABLE = False
+    np = None
+
+# TTS 라이브러리 (여러 옵션 지원)
+TTS_ENGINE = None
+try:
+    import pyttsx3
+    TTS_ENGINE = "pyttsx3"
+    print("✅ pyttsx3 TTS 엔진 사용 가능")
+except ImportError:
+    try:
+        import gtts
+        TTS_ENGINE = "gtts"
+        print("✅ Google TTS 엔진 사용 가능")
+    except ImportError:
+        print("ℹ️ TTS 라이브러리 없음. Mock 모드로 동작합니다.")
+        print("설치: pip install pyttsx3 gTTS")
+
+# 🔧 수정된 구글시트 라이브러리들 - 인증 문제 완전 해결
+GSPREAD_AVAILABLE = False
+try:
+    import gspread
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.oauth2.service_account import Credentials as ServiceAccountCredentials
+    GSPREAD_AVAILABLE = True
+    print("✅ 최신 Google Sheets API 사용 가능")
+except ImportError:
+    print("ℹ️ Google Sheets API 없음. Mock 모드로 동작합니다.")
+    print("설치: pip install gspread google-auth google-auth-oauthlib google-auth-httplib2")
+
+# YouTube API 라이브러리 - googleapiclient는 import가 느려 인증 시점으로 지연
+YOUTUBE_API_AVAILABLE = (
+    importlib.util.find_spec("googleapiclient") is not None
+    and importlib.util.find_spec("google_auth_oauthlib") is not None)
+build = None
+HttpError = None
+MediaFileUpload = None
+if not GSPREAD_AVAILABLE:
+    # gspread 블록에서 import되지 않았을 때만 자리표시자 필요
+    InstalledAppFlow = None
+    Request = None
+if YOUTUBE_API_AVAILABLE:
+    print("✅ YouTube API 사용 가능")
+else:
+    print("ℹ️ YouTube API 없음. Mock 모드로 동작합니다.")
+    print("설치: pip install google-api-python-client google-auth-httplib2 google-auth-oauthlib")
+
+
+def _ensure_youtube_api() -> bool:
+    """googleapiclient 지연 import - 실제 인증/업로드 직전에만 로드"""
+    global build, HttpError, MediaFileUpload, InstalledAppFlow, Request
+    if not YOUTUBE_API_AVAILABLE:
+        return False
+    if build is None:
+        from googleapiclient.discovery import build as _build
+        from googleapiclient.errors import HttpError as _HttpError
+        from googleapiclient.http import MediaFileUpload as _MediaFileUpload
+        from google_auth_oauthlib.flow import InstalledAppFlow as _Flow
+        from google.auth.transport.requests import Request as _Request
+        build, HttpError, MediaFileUpload = _build, _HttpError, _MediaFileUpload
+        InstalledAppFlow, Request = _Flow, _Request
+    return True
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+     format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# 전역 설정
+SAFE_MODE = not all([requests is not None, PANDAS_AVAILABLE])
+
+# 공유 HTTP 세션 - keep-alive로 짧은 호출마다 드는 TLS 핸드셰이크 제거
+_HTTP_SESSION = None
+if requests:
+    _HTTP_SESSION = requests.Session()
+    try:
+        from requests.adapters import HTTPAdapter
+        _adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        _HTTP_SESSION.mount('https://', _adapter)
+        _HTTP_SESSION.mount('http://', _adapter)
+    except Exception:
+        pass
+
+# 구글시트 URL에서 시트 ID 추출 - 임포트 시 1회만 컴파일
+_SHEET_ID_RE = re.compile(r'/d/([a-zA-Z0-9-_]+)')
+
+# SRT 자막용 문장 분리 - '.' 단독 분리는 가격 소수점에서 끊기므로 종결부호+공백 기준
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]\s+')
+
+# Mock 업로드 시뮬레이션 지연 (초) - 테스트/CI에서는 MOCK_UPLOAD_DELAY=0
+_MOCK_DELAY = float(os.getenv('MOCK_UPLOAD_DELAY', '3'))
+
+@functools.lru_cache(maxsize=16)
+def _load_font(path: str, size: int):
+    """TTF 폰트 핸들 캐시 - 같은 (경로, 크기)는 디스크에서 1회만 파싱"""
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+# 디렉토리 생성 메모 - 같은 경로의 stat/mkdir 시스템콜을 프로세스당 1회로 제한
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path) -> None:
+    """경로 1회만 생성 확인 - 반복 호출 시 syscall 생략"""
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        os.makedirs(key, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+# FFmpeg concat 합성 공통 인자 - 파이프라인은 항상 동일한 입력 형식을 사용
+FFMPEG_CONCAT_ARGS = ['-y', '-f', 'concat', '-safe', '0']
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_bin() -> str:
+    """FFmpeg 실행 파일 경로 - FFMPEG_BIN 환경변수 우선, PATH 탐색은 1회만"""
+    return os.getenv('FFMPEG_BIN', '') or shutil.which('ffmpeg') or ''
+MONITORING_ACTIVE = False
+SHUTDOWN_FLAG = False
+# 🆕 모니터링 스레드가 정리를 마치면 세트 - 종료 시 고정 sleep 대신 대기
+SHUTDOWN_DONE = threading.Event()
+SHUTDOWN_DONE.set()  # 모니터링 미가동 시에는 즉시 종료 가능
+# 🆕 신호 핸들러가 wait(300) 중인 모니터 스레드를 즉시 깨울 수 있도록 등록
+_ACTIVE_MONITORS = weakref.WeakSet()
+
+
+@dataclass
+class PropertyData:
+    """부동산 데이터 클래스 - 광고시 유의사항 필드 추가"""
+    address: str
+    property_type: str
+    average_price: str
+    recent_trades: List[str]
+    price_trend: str
+    market_analysis: str
+    school_info: str
+    transport_info: str
+    advertising_notice: str = "본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다. 부동산 투자 시 신중한 검토가 필요합니다."  # 🆕 추가
+    contact_info: str = "청산부동산 02-1234-5678"
+    brand_message: str = "신뢰할 수 있는 부동산 전문가, 청산부동산과 함께하세요"
+
+    def __post_init__(self):
+        # 스크립트/PPT/설명이 같은 데이터를 반복 join하지 않도록 1회 선계산
+        self.recent_trades_top3_str = ', '.join(self.recent_trades[:3])
+        self.recent_trades_str = ', '.join(self.recent_trades)
+
+
+@dataclass(slots=True)
+class PendingItem:
+    """대기열 항목 - dict 대비 메모리 ~30% 절감 (슬롯 고정)
+
+    기존 호출부와의 호환을 위해 dict 스타일 get() 접근도 지원한다.
+    """
+    row_id: int
+    address: str
+    property_type: str = '아파트'
+    status: str = '대기중'
+    priority: str = 'medium'
+    created_date: str = ''
+    advertising_notice: str = ''
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+@dataclass
+class ContentResult:
+    """콘텐츠 생성 결과 클래스"""
+    video_file: str
+    script: str
+    ppt_file: str
+    voice_file: str
+    subtitle_file: str
+    thumbnail_file: str
+    youtube_url: str
+    success: bool
+    error_message: Optional[str] = None
+    sheets_row_id: Optional[int] = None
+
+# 🆕 진행률 추적 클래스 추가
+
+
+class ProgressTracker:
+    """실시간 진행률 추적 시스템"""
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.current_step = 0
+        self.total_steps = 10
+        self.step_details = {
+            0: "🚀 자동화 시스템 초기화",
+            1: "🏠 부동산 데이터 수집 중",
+            2: "✍️ AI 스크립트 생성 중",
+            3: "📊 브랜디드 PPT 생성 중",
+            4: "🎨 썸네일 및 이미지 생성 중",
+            5: "🎙️ 음성 나레이션 생성 중",
+            6: "📝 자막 파일 생성 중",
+            7: "🎬 영상 편집 및 합성 중",
+            8: "📺 YouTube 업로드 준비 중",
+            9: "✅ 최종 완료 및 상태 업데이트"
+        }
+
+    def update(self, step: int, message: str = "", sub_progress: int = 0):
+        """진행률 업데이트"""
+        self.current_step = step
+
+        # 전체 진행률 계산 (0-100%)
+        overall_progress = int((step / self.total_steps) * 100)
+
+        # 단계별 세부 진행률 추가
+        if sub_progress > 0:
+            step_increment = (1 / self.total_steps) * (sub_progress / 100)
+            overall_progress = int(
+    ((step + step_increment) / self.total_steps) * 100)
+
+        # 기본 메시지가 없으면 단계별 기본 메시지 사용
+        if not message:
+            message = self.step_details.get(step, f"단계 {step + 1} 처리 중")
+
+        # 로그 출력
+        logger.info("[%d%%] %s", overall_progress, message)
+
+        # 콜백 호출
+        if self.callback:
+            try:
+                self.callback(message, overall_progress)
+            except Exception as e:
+                logger.warning(f"진행률 콜백 오류: {e}")
+
+    def substep(self, message: str, sub_progress: int):
+        """현재 단계 내 세부 진행률"""
+        self.update(self.current_step, message, sub_progress)
+
+
+class RealTTSEngine:
+    """실제 TTS 음성 생성 엔진"""
+
+    def __init__(self):
+        self.engine_type = TTS_ENGINE
+        # 🆕 pyttsx3는 단일 엔진 인스턴스가 스레드 안전하지 않으므로 스레드별 엔진 보관
+        self._thread_engines = threading.local()
+        # 🆕 동일 문구 재합성 방지용 디스크 캐시 (브랜드 멘트/유의사항 등 반복 문구)
+        self.cache_dir = Path(tempfile.gettempdir()) / "tts_cache"
+        self.cache_ttl_seconds = 7 * 24 * 3600  # 7일 지난 캐시는 무시
+        try:
+            _ensure_dir(self.cache_dir)
+        except Exception as e:
+            logger.warning(f"TTS 캐시 폴더 생성 실패: {e}")
+
+    def _get_thread_engine(self):
+        """스레드별 pyttsx3 엔진 반환 - 각 스레드가 독립된 SAPI 엔진을 구동"""
+        if self.engine_type != "pyttsx3":
+            return None
+
+        engine = getattr(self._thread_engines, 'engine', None)
+        if engine is None:
+            # Windows SAPI는 스레드별 COM 아파트 초기화가 필요
+            try:
+                import pythoncom
+                pythoncom.CoInitialize()
+            except ImportError:
+                pass
+
+            try:
+                import pyttsx3
+                engine = pyttsx3.init()
+                engine.setProperty('rate', 150)  # 속도 조절
+                engine.setProperty('volume', 0.9)  # 볼륨 조절
+            except:
+                engine = None
+            self._thread_engines.engine = engine
+        return engine
+
+    def _cache_path(self, script: str) -> Path:
+        """스크립트+엔진 설정을 SHA-256으로 해싱한 캐시 파일 경로"""
+        key = hashlib.sha256(
+            f"{self.engine_type}|150|0.9|ko|{script}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.wav"
+
+    def _cache_lookup(self, script: str) -> Optional[Path]:
+        """유효한(만료 전) 캐시 파일이 있으면 경로 반환"""
+        try:
+            cached = self._cache_path(script)
+            if cached.exists():
+                if time.time() - cached.stat().st_mtime < self.cache_ttl_seconds:
+                    return cached
+                cached.unlink()  # 만료된 캐시 제거
+        except Exception as e:
+            logger.warning(f"TTS 캐시 조회 실패: {e}")
+        return None
+
+    def _cache_store(self, script: str, output_file: str):
+        """합성 결과를 캐시에 원자적으로 저장 (temp 파일 후 os.replace)"""
+        try:
+            cached = self._cache_path(script)
+            tmp_path = cached.with_suffix('.tmp')
+            shutil.copyfile(output_file, tmp_path)
+            os.replace(tmp_path, cached)
+        except Exception as e:
+            logger.warning(f"TTS 캐시 저장 실패: {e}")
+
+    def generate_voice(self, script: str, output_file: str,
+                       progress_tracker: ProgressTracker = None) -> bool:
+        """실제 음성 생성 - 진행률 추적 추가"""
+        try:
+            if progress_tracker:
+                progress_tracker.substep("🎙️ 음성 엔진 초기화 중", 10)
+
+            # 🆕 동일 문구는 재합성 대신 캐시 파일 복사 (반복 브랜드 멘트 대응)
+            if self.engine_type:
+                cached = self._cache_lookup(script)
+                if cached:
+                    shutil.copyfile(cached, output_file)
+                    if progress_tracker:
+                        progress_tracker.substep("🎙️ 캐시된 음성 재사용", 100)
+                    logger.info("✅ TTS 캐시 적중: %s", output_file)
+                    return True
+
+            if self.engine_type == "pyttsx3":
+                if progress_tracker:
+                    progress_tracker.substep("🎙️ pyttsx3 음성 생성 중", 50)
+
+                # pyttsx3 사용 - 호출 스레드 전용 엔진으로 합성
+                engine = self._get_thread_engine()
+                if not engine:
+                    return self._create_mock_voice(script, output_file)
+
+                engine.save_to_file(script, output_file)
+                engine.runAndWait()
+
+                self._cache_store(script, output_file)
+
+                if progress_tracker:
+                    progress_tracker.substep("🎙️ 음성 파일 저장 완료", 100)
+                return True
+
+            elif self.engine_type == "gtts":
+                if progress_tracker:
+                    progress_tracker.substep("🎙️ Google TTS 음성 생성 중", 50)
+
+                # Google TTS 사용
+                from gtts import gTTS
+
+                # 임시 mp3 파일 생성
+                temp_mp3 = output_file.replace('.wav', '.mp3')
+                tts = gTTS(text=script, lang='ko')
+                tts.save(temp_mp3)
+
+                if progress_tracker:
+                    progress_tracker.substep("🎙️ 오디오 포맷 변환 중", 80)
+
+                # mp3를 wav로 변환 (필요시)
+                if output_file.endswith('.wav'):
+                    self._convert_mp3_to_wav(temp_mp3, output_file)
+                    os.remove(temp_mp3)
+                else:
+                    os.rename(temp_mp3, output_file)
+
+                self._cache_store(script, output_file)
+
+                if progress_tracker:
+                    progress_tracker.substep("🎙️ 음성 파일 저장 완료", 100)
+                return True
+
+            else:
+                # Mock 음성 파일 생성
+                if progress_tracker:
+                    progress_tracker.substep("🎙️ Mock 음성 파일 생성 중", 50)
+
+                result = self._create_mock_voice(script, output_file)
+
+                if progress_tracker:
+                    progress_tracker.substep("🎙️ Mock 음성 파일 생성 완료", 100)
+                return result
+
+        except Exception as e:
+            logger.error(f"음성 생성 오류: {e}")
+            if progress_tracker:
+                progress_tracker.substep("❌ 음성 생성 실패, Mock 파일 생성 중", 80)
+            return self._create_mock_voice(script, output_file)
+
+    def _convert_mp3_to_wav(self, mp3_file: str, wav_file: str):
+        """MP3를 WAV로 변환"""
+        try:
+            # FFmpeg 사용 (설치되어 있는 경우)
+            subprocess.run([
+                _ffmpeg_bin() or 'ffmpeg', '-i', mp3_file,
+                '-acodec', 'pcm_s16le', '-ar', '44100', wav_file
+            ], check=True, capture_output=True)
+        except:
+            # FFmpeg 없으면 그냥 복사
+            shutil.copy2(mp3_file, wav_file)
+
+    def _create_mock_voice(self, script: str, output_file: str) -> bool:
+        """Mock 음성 파일 생성 - 재생 가능한 무음 WAV"""
+        try:
+            # 한국어 나레이션 대략 초당 5음절 기준으로 길이 추정
+            duration = max(len(script) / 5.0, 1.0)
+            n_samples = int(duration * 44100)
+
+            # 실제 data 청크가 있어야 FFmpeg 등 다운스트림에서 입력으로 쓸 수 있음
+            if NUMPY_AVAILABLE:
+                silence = np.zeros(n_samples, dtype=np.int16).tobytes()
+            else:
+                silence = b'\x00\x00' * n_samples
+
+            with wave.open(output_file, 'wb') as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(44100)
+                w.writeframes(silence)
+
+            logger.info(f"Mock 음성 파일 생성: {output_file}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Mock 음성 생성 오류: {e}")
+            return False
+
+
+_FFMPEG_CAPS_FILE = Path('.ffmpeg_caps.json')
+
+
+def _ffmpeg_caps_key(ffmpeg_path: str) -> str:
+    """바이너리 경로+수정시각 기반 캐시 키 - 교체/업데이트 시 자동 무효화"""
+    try:
+        mtime = int(os.stat(ffmpeg_path).st_mtime)
+    except OSError:
+        mtime = 0
+    return f"{ffmpeg_path}:{mtime}"
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """FFmpeg 설치 여부 확인 - 프로세스당 1회만 프로브"""
+    # 경로 해석이 프로세스 실행보다 훨씬 싸므로 먼저 확인
+    ffmpeg_path = _ffmpeg_bin()
+    if not ffmpeg_path:
+        logger.warning("⚠️ FFmpeg 없음. Mock 영상 생성합니다.")
+        return False
+
+    # 🆕 디스크 캐시 - spawn 워커/재실행이 -version 프로브를 반복하지 않도록
+    caps_key = _ffmpeg_caps_key(ffmpeg_path)
+    try:
+        caps = json.loads(_FFMPEG_CAPS_FILE.read_text(encoding='utf-8'))
+        if caps.get('key') == caps_key:
+            return bool(caps.get('available'))
+    except (OSError, ValueError):
+        pass
+
+    try:
+        # Windows에서 콘솔 창이 뜨지 않도록 플래그 설정
+        creationflags = 0
+        if platform.system() == 'Windows':
+            creationflags = subprocess.CREATE_NO_WINDOW
+
+        result = subprocess.run(
+            [ffmpeg_path, '-version'], capture_output=True, timeout=10,
+            creationflags=creationflags)
+        if result.returncode == 0:
+            logger.info("✅ FFmpeg 사용 가능")
+            _save_ffmpeg_caps(caps_key, True)
+            return True
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+
+    logger.warning("⚠️ FFmpeg 없음. Mock 영상 생성합니다.")
+    _save_ffmpeg_caps(caps_key, False)
+    return False
+
+
+def _retry_backoff(call, what: str, attempts: int = 5):
+    """일시적 API 오류(429/5xx)에 지수 백오프+지터로 재시도
+
+    쿼터 경계에서 429 한 번에 전체 배치가 중단되지 않도록, 일시 오류는
+    1~30초 수준의 대기 후 다시 시도하고 그 외 오류는 그대로 올린다.
+    """
+    import random
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            # gspread APIError는 .response(requests), googleapiclient는 .resp
+            code = getattr(getattr(e, 'response', None), 'status_code', None)
+            if code is None:
+                code = getattr(getattr(e, 'resp', None), 'status', None)
+            if code not in (429, 500, 502, 503, 504) or attempt == attempts - 1:
+                raise
+            wait = min(30, 2 ** attempt) + random.random()
+            logger.warning("⏳ %s 일시 오류 %s, %.1f초 후 재시도", what, code, wait)
+            time.sleep(wait)
+
+
+def _save_ffmpeg_caps(caps_key: str, available: bool):
+    """프로브 결과를 디스크에 저장 (실패해도 무시)"""
+    try:
+        _FFMPEG_CAPS_FILE.write_text(
+            json.dumps({'key': caps_key, 'available': available}),
+            encoding='utf-8')
+    except OSError:
+        pass
+
+
+class RealVideoEditor:
+    """실제 영상 편집 엔진 - 진행률 추적 개선"""
+
+    # 배경/팔레트 구성이 바뀌면 버전을 올려 슬라이드 캐시를 무효화
+    PALETTE_VERSION = "v1"
+
+    def __init__(self):
+        self.ffmpeg_available = _ffmpeg_available()
+        # 🆕 동일 텍스트 슬라이드는 재실행 시 다시 렌더링하지 않도록 디스크 캐시
+        self.slide_cache = Path(tempfile.gettempdir()) / "slide_cache"
+        try:
+            _ensure_dir(self.slide_cache)
+        except Exception as e:
+            logger.warning(f"슬라이드 캐시 폴더 생성 실패: {e}")
+        # 🆕 슬라이드마다 배경/폰트를 다시 만들지 않도록 한 번만 준비해서 재사용
+        self._font_cache = {}
+        self._bg_template = None
+        self._hw_encoder_args = None
+        self._presentation_cache = {}
+        self._bg_np = None
+        # (문자, 크기, 색) → uint8 배열. 고정 브랜드 어휘는 1회만 래스터라이즈
+        self._glyph_atlas = {}
+
+    def _get_bg_array(self):
+        """브랜드 배경 템플릿의 NumPy 배열 캐시 (프레임당 memcpy 1회로 합성)"""
+        if self._bg_np is None:
+            self._bg_np = np.asarray(self._get_brand_template(), dtype=np.uint8)
+        return self._bg_np
+
+    def _open_presentation(self, ppt_file: str):
+        """PPT 파일 열기 - (경로, mtime) 기준으로 파싱 결과 재사용"""
+        mtime = os.path.getmtime(ppt_file)
+        cached = self._presentation_cache.get(ppt_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        from pptx import Presentation
+        prs = Presentation(ppt_file)
+        self._presentation_cache[ppt_file] = (mtime, prs)
+        return prs
+
+    def _slide_cache_path(self, title: str, content: str) -> Path:
+        """슬라이드 텍스트+팔레트 버전을 해싱한 캐시 PNG 경로"""
+        key = hashlib.blake2b(
+            f"{title}|{content}|{self.PALETTE_VERSION}".encode('utf-8'),
+            digest_size=12).hexdigest()
+        return self.slide_cache / f"{key}.png"
+
+    def _get_font(self, size: int):
+        """폰트 핸들 캐시 - TTF 로드는 슬라이드마다 반복할 필요 없음"""
+        font = self._font_cache.get(size)
+        if font is None:
+            try:
+                font = ImageFont.truetype("arial.ttf", size)
+            except:
+                font = ImageFont.load_default()
+            self._font_cache[size] = font
+        return font
+
+    def _get_brand_template(self):
+        """브랜드 배경 템플릿 반환 - 공통 배경+브랜드 문구는 최초 1회만 렌더링"""
+        if self._bg_template is None:
+            template = Image.new('RGB', (1920, 1080), color='#1E3A8A')
+            draw = ImageDraw.Draw(template)
+            draw.text((100, 900), "청산부동산", fill='#10B981',
+                      font=self._get_font(50))
+            self._bg_template = template
+        return self._bg_template.copy()
+
+    # CPU 기본 인코딩 (정지 슬라이드에 맞게 튜닝) - 하드웨어 실패 시 강등 대상
+    _CPU_ENCODER_ARGS = ('libx264', '-preset', 'veryfast', '-tune', 'stillimage')
+
+    def _detect_hw_encoder(self) -> List[str]:
+        """사용 가능한 하드웨어 H.264 인코더 감지 - 최초 1회만 프로브"""
+        if self._hw_encoder_args is not None:
+            return self._hw_encoder_args
+
+        encoder_args = list(self._CPU_ENCODER_ARGS)
+
+        try:
+            result = subprocess.run(
+                [_ffmpeg_bin() or 'ffmpeg', '-hide_banner', '-encoders'],
+                capture_output=True, text=True, timeout=10)
+
+            # 우선순위 순서대로 하드웨어 인코더 확인
+            hw_encoders = [
+                ('h264_nvenc', ['h264_nvenc', '-preset', 'p1', '-rc', 'vbr', '-cq', '23']),
+                ('h264_qsv', ['h264_qsv', '-preset', 'veryfast']),
+                ('h264_videotoolbox', ['h264_videotoolbox']),
+                ('h264_amf', ['h264_amf']),
+            ]
+            for name, args in hw_encoders:
+                if name in result.stdout:
+                    logger.info(f"✅ 하드웨어 인코더 사용: {name}")
+                    encoder_args = args
+                    break
+        except Exception as e:
+            logger.warning(f"인코더 감지 실패, libx264 사용: {e}")
+
+        self._hw_encoder_args = encoder_args
+        return encoder_args
+
+    def _demote_to_cpu_encoder(self) -> bool:
+        """하드웨어 인코더 런타임 실패 시 libx264로 강등 - 강등했으면 True
+
+        -encoders 목록은 빌드에 컴파일됐다는 뜻일 뿐이라 GPU가 없는 장비에서도
+        h264_nvenc 등이 잡힐 수 있다. 실제 인코딩이 실패하면 CPU로 전환한다.
+        """
+        if self._hw_encoder_args and self._hw_encoder_args[0] != 'libx264':
+            logger.warning(
+                "⚠️ 하드웨어 인코더 %s 실행 실패 - libx264로 전환",
+                self._hw_encoder_args[0])
+            self._hw_encoder_args = list(self._CPU_ENCODER_ARGS)
+            return True
+        return False
+
+    def create_video_from_ppt(self, ppt_file: str, voice_file: str,
+                             subtitle_file: str, output_video: str,
+                             progress_tracker: ProgressTracker = None) -> bool:
+        """PPT + 음성 + 자막으로 영상 생성 - 진행률 추적 추가"""
+        try:
+            if progress_tracker:
+                progress_tracker.substep("🎬 영상 편집 시스템 초기화", 10)
+
+            if self.ffmpeg_available:
+                return self._create_real_video(ppt_file, voice_file,
+                                             subtitle_file, output_video, progress_tracker)
+            else:
+                if progress_tracker:
+                    progress_tracker.substep("🎬 Mock 영상 생성 중", 50)
+                result = self._create_mock_video(output_video)
+                if progress_tracker:
+                    progress_tracker.substep("🎬 Mock 영상 생성 완료", 100)
+                return result
+
+        except Exception as e:
+            logger.error(f"영상 생성 오류: {e}")
+            if progress_tracker:
+                progress_tracker.substep("❌ 영상 생성 실패, Mock 파일 생성", 80)
+            return self._create_mock_video(output_video)
+
+    def _create_real_video(self, ppt_file: str, voice_file: str,
+                          subtitle_file: str, output_video: str,
+                          progress_tracker: ProgressTracker = None) -> bool:
+        """실제 영상 생성 (FFmpeg 사용) - 진행률 추적"""
+        try:
+            if progress_tracker:
+                progress_tracker.substep("🎬 PPT 슬라이드 변환 중", 20)
+
+            # 1단계: PPT를 이미지로 변환 (파싱은 한 번만)
+            if PPTX_AVAILABLE and ppt_file.endswith('.pptx'):
+                prs = self._open_presentation(ppt_file)
+
+                # NumPy가 있으면 PNG 인코딩/디코딩을 건너뛰고 바로 인코더로 파이프
+                if NUMPY_AVAILABLE and PIL_AVAILABLE and self.ffmpeg_available:
+                    total_slides = min(len(prs.slides), 6)
+                    frames = [self._render_slide_array(i)
+                              for i in range(total_slides)]
+                    if frames and self._pipe_frames_to_video(
+                            frames, voice_file, output_video, progress_tracker):
+                        if progress_tracker:
+                            progress_tracker.substep("🎬 영상 생성 완료", 100)
+                        return True
+
+                images = self._convert_ppt_to_images(
+                    prs, progress_tracker)
+            else:
+                # 단일 이미지 생성
+                images = [self._create_slide_image(f"청산부동산 분석",
+                                                 "부동산 전문가의 시장 분석")]
+
+            if progress_tracker:
+                progress_tracker.substep("🎬 이미지와 오디오 합성 중", 60)
+
+            # 2단계: 이미지들로 영상 생성
+            if images:
+                return self._combine_images_audio_to_video(
+                    images, voice_file, subtitle_file, output_video, progress_tracker)
+            else:
+                if progress_tracker:
+                    progress_tracker.substep("🎬 Mock 영상 생성으로 대체", 90)
+                return self._create_mock_video(output_video)
+
+        except Exception as e:
+            logger.error(f"실제 영상 생성 오류: {e}")
+            return self._create_mock_video(output_video)
+
+    def _convert_ppt_to_images(
+    self,
+    prs,
+     progress_tracker: ProgressTracker = None) -> List[str]:
+        """열린 Presentation 객체를 이미지로 변환 - 슬라이드별 병렬 렌더링"""
+        try:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
+            total_slides = len(prs.slides)
+
+            if progress_tracker:
+                progress_tracker.substep(f"🎬 {total_slides}개 슬라이드 처리 시작", 30)
+
+            if not PIL_AVAILABLE or total_slides == 0:
+                return []
+
+            # Pillow는 렌더링/저장 중 GIL을 놓으므로 슬라이드별 스레드 병렬화
+            images = [""] * total_slides
+            max_workers = min(6, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_map = {
+                    executor.submit(self._render_one_slide, i): i
+                    for i in range(total_slides)
+                }
+
+                done = 0
+                for future in as_completed(future_map):
+                    i = future_map[future]
+                    try:
+                        images[i] = future.result()
+                    except Exception as e:
+                        logger.error(f"슬라이드 {i+1} 렌더링 오류: {e}")
+
+                    # 진행률은 메인 스레드에서 완료 개수 기준으로 보고 (30-60% 범위)
+                    done += 1
+                    if progress_tracker:
+                        progress_tracker.substep(
+                            f"🎬 슬라이드 {done}/{total_slides} 변환 완료",
+                            30 + int((done / total_slides) * 30))
+
+            # 렌더링 실패한 슬라이드는 제외하고 원래 순서 유지
+            images = [img for img in images if img]
+
+            if progress_tracker:
+                progress_tracker.substep("🎬 모든 슬라이드 변환 완료", 60)
+
+            return images[:6]  # 최대 6개 슬라이드
+
+        except Exception as e:
+            logger.error(f"PPT 이미지 변환 오류: {e}")
+            return []
+
+    def _render_one_slide(self, i: int) -> str:
+        """단일 슬라이드를 PNG 이미지로 렌더링"""
+        image_path = f"slide_{i+1}_{int(time.time())}.png"
+
+        # 슬라이드 제목과 내용 추출
+        title = "청산부동산"
+        content = f"슬라이드 {i+1}"
+
+        # 내용이 같으면 이전 실행에서 렌더링한 PNG 재사용
+        cached = self._slide_cache_path(title, content)
+        if cached.exists():
+            shutil.copyfile(cached, image_path)
+            return image_path
+
+        if NUMPY_AVAILABLE:
+            frame = self._render_slide_array(i)
+
+            # FFmpeg가 곧바로 다시 읽으므로 PNG 압축에 CPU를 쓸 이유가 없음
+            Image.fromarray(frame).save(
+                image_path, optimize=False, compress_level=1)
+        else:
+            # NumPy 없으면 기존 PIL 경로
+            img = self._get_brand_template()
+            draw = ImageDraw.Draw(img)
+
+            # 텍스트 그리기
+            draw.text((100, 200), title, fill='white', font=self._get_font(60))
+            draw.text((100, 300), content, fill='#F59E0B', font=self._get_font(40))
+
+            img.save(image_path)
+
+        try:
+            shutil.copyfile(image_path, cached)
+        except Exception as e:
+            logger.warning(f"슬라이드 캐시 저장 실패: {e}")
+
+        return image_path
+
+    def _rasterize_glyph(self, ch: str, size: int, fill: str):
+        """단일 글리프를 배경색 타일 위에 래스터라이즈해 uint8 배열로 반환"""
+        font = self._get_font(size)
+        try:
+            bbox = font.getbbox(ch)
+            glyph_w = max(bbox[2], 1)
+            glyph_h = max(bbox[3], 1)
+        except Exception:
+            glyph_w, glyph_h = size, size
+
+        tile = Image.new('RGB', (glyph_w + 2, glyph_h + 2), color='#1E3A8A')
+        ImageDraw.Draw(tile).text((0, 0), ch, fill=fill, font=font)
+        return np.asarray(tile, dtype=np.uint8)
+
+    def _blit_text(self, frame, text: str, x: int, y: int, size: int, fill: str):
+        """글리프 아틀라스에서 문자 단위로 블릿 - FreeType 셰이핑을 글자당 1회로 축소"""
+        height, width = frame.shape[:2]
+        for ch in text:
+            key = (ch, size, fill)
+            glyph = self._glyph_atlas.get(key)
+            if glyph is None:
+                glyph = self._rasterize_glyph(ch, size, fill)
+                self._glyph_atlas[key] = glyph
+
+            glyph_h, glyph_w = glyph.shape[:2]
+            if x + glyph_w > width or y + glyph_h > height:
+                break
+            frame[y:y + glyph_h, x:x + glyph_w] = glyph
+            x += glyph_w
+
+    def _render_slide_array(self, i: int):
+        """단일 슬라이드를 NumPy 프레임(1080x1920x3 uint8)으로 렌더링"""
+        # 배경은 memcpy 1회, 텍스트는 사전 래스터라이즈된 글리프 블릿으로 합성
+        frame = self._get_bg_array().copy()
+
+        self._blit_text(frame, "청산부동산", 100, 200, 60, 'white')
+        self._blit_text(frame, f"슬라이드 {i+1}", 100, 300, 40, '#F59E0B')
+
+        return frame
+
+    def _pipe_frames_to_video(self, frames: List, voice_file: str,
+                              output_video: str,
+                              progress_tracker: ProgressTracker = None) -> bool:
+        """NumPy 프레임을 PNG 중간 파일 없이 FFmpeg rawvideo 입력으로 직접 전달"""
+        try:
+            slide_duration = 5
+
+            def run_encode() -> int:
+                cmd = [
+                    _ffmpeg_bin() or 'ffmpeg', '-y',
+                    '-f', 'rawvideo',
+                    '-pix_fmt', 'rgb24',
+                    '-s', '1920x1080',
+                    '-framerate', f'1/{slide_duration}',
+                    '-i', 'pipe:0',
+                    '-i', voice_file,
+                    '-c:v'] + self._detect_hw_encoder() + [
+                    '-c:a', 'aac',
+                    '-shortest',
+                    '-pix_fmt', 'yuv420p',
+                    '-r', '30',
+                    output_video
+                ]
+
+                process = subprocess.Popen(
+                    cmd, stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+                # 인코더 초기화 실패로 ffmpeg가 먼저 죽으면 write가
+                # BrokenPipeError를 던짐 - 종료코드로 바꿔서 재시도 경로로 연결
+                try:
+                    total = len(frames)
+                    for idx, frame in enumerate(frames):
+                        process.stdin.write(frame.tobytes())
+                        if progress_tracker:
+                            progress_tracker.substep(
+                                f"🎬 프레임 {idx+1}/{total} 인코더 전송",
+                                70 + int(((idx + 1) / total) * 25))
+
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+                return process.wait()
+
+            returncode = run_encode()
+            # 하드웨어 인코더가 런타임에 실패하면 libx264로 1회 재시도
+            if returncode != 0 and self._demote_to_cpu_encoder():
+                returncode = run_encode()
+
+            if returncode == 0:
+                logger.info(f"✅ rawvideo 파이프 영상 생성 완료: {output_video}")
+                return True
+
+            logger.error(f"FFmpeg rawvideo 파이프 오류: 종료 코드 {returncode}")
+            return False
+
+        except Exception as e:
+            logger.error(f"rawvideo 파이프 합성 오류: {e}")
+            return False
+
+    def _create_slide_image(self, title: str, content: str) -> str:
+        """단일 슬라이드 이미지 생성"""
+        try:
+            if not PIL_AVAILABLE:
+                return ""
+
+            image_path = f"slide_{int(time.time())}.png"
+
+            # 브랜드 배경 템플릿 복사 후 가변 텍스트만 그리기
+            img = self._get_brand_template()
+            draw = ImageDraw.Draw(img)
+
+            font_large = self._get_font(80)
+            font_medium = self._get_font(50)
+
+            # 텍스트 그리기
+            draw.text((100, 300), title, fill='white', font=font_large)
+            draw.text((100, 450), content, fill='#F59E0B', font=font_medium)
+
+            img.save(image_path)
+            return image_path
+
+        except Exception as e:
+            logger.error(f"슬라이드 이미지 생성 오류: {e}")
+            return ""
+
+    def _combine_images_audio_to_video(self, images: List[str], voice_file: str,
+                                     subtitle_file: str, output_video: str,
+                                     progress_tracker: ProgressTracker = None) -> bool:
+        """이미지들과 오디오를 합쳐서 영상 생성 - 진행률 추적"""
+        try:
+            if not self.ffmpeg_available or not images:
+                return self._create_mock_video(output_video)
+
+            if progress_tracker:
+                progress_tracker.substep("🎬 FFmpeg 영상 합성 시작", 70)
+
+            # 각 슬라이드를 5초씩 표시
+            slide_duration = 5
+
+            # 이미지들을 비디오로 변환 (concat 목록은 한 번에 생성해서 단일 write)
+            image_list_file = f"images_{int(time.time())}.txt"
+            concat_spec = "\n".join(
+                f"file '{img}'\nduration {slide_duration}" for img in images)
+            with open(image_list_file, 'w') as f:
+                f.write(concat_spec + "\n")
+
+            if progress_tracker:
+                progress_tracker.substep("🎬 FFmpeg 인코딩 실행 중", 85)
+
+            # stderr를 통째로 버퍼링하면 긴 인코딩에서 파이프 버퍼가 가득 차
+            # FFmpeg가 멈출 수 있으므로, -progress 출력을 스트리밍하며 실시간 진행률로 변환
+            total_duration_ms = len(images) * slide_duration * 1000
+
+            def run_encode() -> int:
+                # FFmpeg로 영상 생성 (가능하면 하드웨어 인코더 사용)
+                cmd = [_ffmpeg_bin() or 'ffmpeg'] + FFMPEG_CONCAT_ARGS + [
+                    '-i', image_list_file,
+                    '-i', voice_file,
+                    '-c:v'] + self._detect_hw_encoder() + [
+                    '-c:a', 'aac',
+                    '-shortest',
+                    '-pix_fmt', 'yuv420p',
+                    output_video
+                ]
+
+                process = subprocess.Popen(
+                    cmd + ['-progress', 'pipe:1', '-nostats'],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1)
+
+                for line in process.stdout:
+                    line = line.strip()
+                    if line.startswith('out_time_ms=') and total_duration_ms > 0:
+                        try:
+                            # out_time_ms는 마이크로초 단위
+                            out_ms = int(line.split('=', 1)[1]) / 1000
+                            encode_percent = min(
+                                int((out_ms / total_duration_ms) * 100), 100)
+                            if progress_tracker:
+                                progress_tracker.substep(
+                                    f"🎬 FFmpeg 인코딩 {encode_percent}%",
+                                    70 + int(encode_percent * 0.3))
+                        except ValueError:
+                            continue
+
+                return process.wait()
+
+            returncode = run_encode()
+            # 하드웨어 인코더가 런타임에 실패하면 libx264로 1회 재시도
+            if returncode != 0 and self._demote_to_cpu_encoder():
+                returncode = run_encode()
+
+            # 임시 파일 정리
+            os.remove(image_list_file)
+            for img in images:
+                if os.path.exists(img):
+                    os.remove(img)
+
+            if returncode == 0:
+                if progress_tracker:
+                    progress_tracker.substep("🎬 영상 생성 완료", 100)
+                logger.info(f"✅ 실제 영상 생성 완료: {output_video}")
+                return True
+            else:
+                logger.error(f"FFmpeg 오류: 종료 코드 {returncode}")
+                return self._create_mock_video(output_video)
+
+        except Exception as e:
+            logger.error(f"영상 합성 오류: {e}")
+            return self._create_mock_video(output_video)
+
+    def _create_mock_video(self, output_video: str) -> bool:
+        """Mock 영상 파일 생성"""
+        try:
+            # 빈 MP4 파일 생성 (실제로는 최소한의 헤더만)
+            with open(output_video, 'wb') as f:
+                # MP4 기본 헤더 (매우 간단한 버전)
+                mp4_header = b'\x00\x00\x00\x20ftypmp42\x00\x00\x00\x00mp42isom'
+                f.write(mp4_header)
+                f.write(b'\x00' * 1024)  # 더미 데이터
+
+            logger.info(f"Mock 영상 파일 생성: {output_video}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Mock 영상 생성 오류: {e}")
+            return False
+
+
+class YouTubeUploader:
+    """YouTube 자동 업로드 관리자 - 100% 자동화 옵션 추가"""
+
+    def __init__(self):
+        self.youtube_service = None
+        self.credentials = None
+        self.api_available = YOUTUBE_API_AVAILABLE
+        self.auto_upload_mode = False  # 🆕 100% 자동화 모드
+        self._tk_root = None  # 🆕 확인 팝업용 숨김 루트 (Tk 초기화 1회)
+
+    def _get_tk_root(self):
+        """숨김 Tk 루트 반환 - 팝업마다 Tk를 새로 초기화하지 않도록 재사용"""
+        if self._tk_root is None:
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+        return self._tk_root
+
+    def set_auto_upload_mode(self, enabled: bool):
+        """100% 자동화 모드 설정"""
+        self.auto_upload_mode = enabled
+        logger.info(f"YouTube 자동 업로드 모드: {'활성화' if enabled else '비활성화'}")
+
+    def setup_youtube_auth(
+    self,
+     client_secrets_file: str = "youtube_secrets.json") -> bool:
+        """YouTube API 인증 설정"""
+        try:
+            if not self.api_available or not _ensure_youtube_api():
+                logger.warning("YouTube API 라이브러리가 없습니다.")
+                return False
+
+            if not os.path.exists(client_secrets_file):
+                logger.warning(f"YouTube 인증 파일이 없습니다: {client_secrets_file}")
+                return False
+
+            # OAuth 2.0 스코프 설정
+            SCOPES = ['https://www.googleapis.com/auth/youtube.upload']
+
+            flow = InstalledAppFlow.from_client_secrets_file(
+                client_secrets_file, SCOPES)
+            self.credentials = flow.run_local_server(port=0)
+
+            # YouTube 서비스 빌드
+            # 🆕 인증된 Http 객체 1개를 공유 - 호출마다 TLS 핸드셰이크 반복 방지
+            try:
+                import httplib2
+                import google_auth_httplib2
+                authed_http = google_auth_httplib2.AuthorizedHttp(
+                    self.credentials, http=httplib2.Http(cache=".http_cache"))
+                self.youtube_service = build('youtube', 'v3', http=authed_http)
+            except ImportError:
+                self.youtube_service = build('youtube', 'v3',
+                                           credentials=self.credentials)
+
+            logger.info("✅ YouTube API 인증 성공")
+            return True
+
+        except Exception as e:
+            logger.error(f"YouTube 인증 실패: {e}")
+            return False
+
+    def upload_video_with_confirmation(self, video_file: str, title: str,
+                                     description: str, tags: List[str] = None,
+                                     thumbnail_file: str = None,
+                                     progress_tracker: ProgressTracker = None) -> Tuple[bool, str]:
+        """확인 팝업 후 YouTube 업로드 (100% 자동화 옵션 지원)"""
+        try:
+            if progress_tracker:
+                progress_tracker.substep("📺 YouTube 업로드 준비 중", 10)
+
+            # 🆕 100% 자동화 모드에서는 확인 팝업 생략
+            if not self.auto_upload_mode:
+                # 1단계: 업로드 전 확인 팝업
+                if not self._show_upload_confirmation(
+                    video_file, title, description):
+                    return False, "사용자가 업로드를 취소했습니다."
+            else:
+                logger.info("🚀 100% 자동화 모드 - 확인 팝업 생략하고 바로 업로드")
+                if progress_tracker:
+                    progress_tracker.substep("🚀 100% 자동화 모드 - 바로 업로드", 30)
+
+            # 2단계: 실제 업로드
+            if self.youtube_service:
+                return self._upload_to_youtube(video_file, title, description,
+                                             tags, thumbnail_file, progress_tracker)
+            else:
+                return self._mock_upload(video_file, title, progress_tracker)
+
+        except Exception as e:
+            logger.error(f"YouTube 업로드 오류: {e}")
+            return False, str(e)
+
+    def _show_upload_confirmation(self, video_file: str, title: str,
+                                description: str) -> bool:
+        """업로드 확인 팝업창"""
+        try:
+            # 🆕 풀 워커에서는 stdin이 devnull이고 Tk도 띄울 수 없어
+            #    사용자 확인을 받을 방법이 없음 - 임의 승인하지 않고 보류
+            #    (확인 모드 작업은 모니터가 워커로 보내지 않는 것이 정상 경로)
+            import multiprocessing
+            if multiprocessing.parent_process() is not None:
+                logger.warning("📦 워커 프로세스에서는 확인 팝업 불가 - 업로드 보류")
+                return False
+
+            if not GUI_AVAILABLE:
+                # 콘솔에서 확인
+                print("\n" + "=" * 60)
+                print("🚀 YouTube 업로드 최종 확인")
+                print("=" * 60)
+                print(f"📹 영상 파일: {video_file}")
+                print(f"📝 제목: {title}")
+                print(f"📄 설명: {description[:100]}...")
+                print("=" * 60)
+
+                while True:
+                    response = input("✅ 업로드를 진행하시겠습니까? (y/n): ").lower()
+                    if response in ['y', 'yes', '예']:
+                        return True
+                    elif response in ['n', 'no', '아니오']:
+                        return False
+                    else:
+                        print("y 또는 n을 입력해주세요.")
+
+            else:
+                # GUI 확인 팝업 (숨김 루트 재사용 - Tk 초기화 비용 1회만)
+                popup = tk.Toplevel(self._get_tk_root())
+                popup.title("🚀 YouTube 업로드 최종 확인")
+                popup.geometry("600x500")
+                popup.transient()
+                popup.grab_set()
+
+                # 메인 프레임
+                main_frame = ttk.Frame(popup, padding="20")
+                main_frame.pack(fill=tk.BOTH, expand=True)
+
+                # 제목
+                title_label = ttk.Label(main_frame, text="🚀 YouTube 업로드 최종 확인",
+                                      font=('Arial', 16, 'bold'))
+                title_label.pack(pady=10)
+
+                # 영상 정보
+                info_frame = ttk.LabelFrame(main_frame, text="📹 업로드할 영상 정보",
+                                          padding="10")
+                info_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+
+                # 정보 표시
+                ttk.Label(info_frame, text=f"📁 파일: {os.path.basename(video_file)}",
+                         font=('Arial', 10)).pack(anchor=tk.W, pady=2)
+                ttk.Label(info_frame, text=f"📝 제목: {title}",
+                         font=('Arial', 10)).pack(anchor=tk.W, pady=2)
+
+                # 설명 (스크롤 가능)
+                desc_label = ttk.Label(info_frame, text="📄 설명:")
+                desc_label.pack(anchor=tk.W, pady=(10, 2))
+
+                desc_text = tk.Text(
+    info_frame, height=8, width=60, wrap=tk.WORD)
+                desc_text.pack(fill=tk.BOTH, expand=True, pady=2)
+
+                # 🆕 긴 설명 삽입은 idle 이후로 미뤄서 팝업이 먼저 그려지게 함
+                def fill_description():
+                    desc_text.insert(1.0, description)
+                    desc_text.config(state=tk.DISABLED)
+
+                popup.after(10, fill_description)
+
+                # 경고 메시지
+                warning_frame = ttk.Frame(main_frame)
+                warning_frame.pack(fill=tk.X, pady=10)
+
+                warning_text = "⚠️ 업로드 후에는 취소할 수 없습니다. 내용을 다시 한 번 확인해주세요."
+                ttk.Label(warning_frame, text=warning_text,
+                         font=('Arial', 9), foreground="red").pack()
+
+                # 버튼들
+                button_frame = ttk.Frame(main_frame)
+                button_frame.pack(fill=tk.X, pady=20)
+
+                result = {'confirmed': False}
+
+                def confirm_upload():
+                    result['confirmed'] = True
+                    popup.destroy()
+
+                def cancel_upload():
+                    result['confirmed'] = False
+                    popup.destroy()
+
+                ttk.Button(button_frame, text="✅ 업로드 진행",
+                          command=confirm_upload).pack(side=tk.LEFT, padx=10)
+                ttk.Button(button_frame, text="❌ 취소",
+                          command=cancel_upload).pack(side=tk.RIGHT, padx=10)
+
+                # 팝업이 닫힐 때까지 대기
+                popup.wait_window()
+
+                return result['confirmed']
+
+        except Exception as e:
+            logger.error(f"확인 팝업 오류: {e}")
+            return False
+
+    def _upload_to_youtube(self, video_file: str, title: str, description: str,
+                          tags: List[str] = None, thumbnail_file: str = None,
+                          progress_tracker: ProgressTracker = None) -> Tuple[bool, str]:
+        """실제 YouTube 업로드 - 진행률 추적"""
+        try:
+            if progress_tracker:
+                progress_tracker.substep("📺 업로드 메타데이터 설정 중", 40)
+
+            # 업로드 메타데이터 설정
+            body = {
+                'snippet': {
+                    'title': title,
+                    'description': description,
+                    'tags': tags or ['부동산', '투자', '청산부동산', '아파트', '시세분석'],
+                    'categoryId': '22'  # People & Blogs
+                },
+                'status': {
+                    'privacyStatus': 'public'  # public, private, unlisted
+                }
+            }
+
+            if progress_tracker:
+                progress_tracker.substep("📺 동영상 업로드 시작", 50)
+
+            # 미디어 파일 업로드 - 8MiB 청크로 중간 진행률 확보 + 재시도 단위 축소
+            media = MediaFileUpload(
+                video_file, chunksize=8 * 1024 * 1024, resumable=True)
+
+            # 업로드 요청
+            insert_request = self.youtube_service.videos().insert(
+                part=','.join(body.keys()),
+                body=body,
+                media_body=media
+            )
+
+            # 업로드 진행 (일시적 오류는 지수 백오프 후 재시도)
+            import random
+            response = None
+            retry_count = 0
+            while response is None:
+                try:
+                    status, response = insert_request.next_chunk()
+                    retry_count = 0
+                except HttpError as e:
+                    if e.resp.status in [429, 500, 502, 503, 504] and retry_count < 5:
+                        retry_count += 1
+                        wait_time = (2 ** retry_count) + random.random()
+                        logger.warning(
+                            f"업로드 일시 오류 {e.resp.status}, {wait_time:.1f}초 후 재시도")
+                        time.sleep(wait_time)
+                        continue
+                    raise
+                if status:
+                    upload_progress = int(status.progress() * 100)
+                    if progress_tracker:
+                        progress_tracker.substep(
+                            f"📺 업로드 진행 중: {upload_progress}%", 50 + (upload_progress * 0.3))
+                    logger.info("업로드 진행률: %d%%", upload_progress)
+
+            if 'id' in response:
+                video_id = response['id']
+                youtube_url = f"https://www.youtube.com/watch?v={video_id}"
+
+                if progress_tracker:
+                    progress_tracker.substep("📺 썸네일 업로드 중", 90)
+
+                # 썸네일 업로드 (선택사항)
+                if thumbnail_file and os.path.exists(thumbnail_file):
+                    try:
+                        self.youtube_service.thumbnails().set(
+                            videoId=video_id,
+                            media_body=MediaFileUpload(thumbnail_file)
+                        ).execute()
+                        logger.info("✅ 썸네일 업로드 완료")
+                    except Exception as e:
+                        logger.warning(f"썸네일 업로드 실패: {e}")
+
+                if progress_tracker:
+                    progress_tracker.substep("📺 YouTube 업로드 완료", 100)
+
+                logger.info(f"✅ YouTube 업로드 성공: {youtube_url}")
+                return True, youtube_url
+            else:
+                return False, "업로드 응답에 video ID가 없습니다."
+
+        except HttpError as e:
+            error_msg = f"YouTube API 오류: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            error_msg = f"업로드 오류: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+
+    def _mock_upload(self, video_file: str, title: str,
+                     progress_tracker: ProgressTracker = None) -> Tuple[bool, str]:
+        """Mock 업로드 (테스트용) - 진행률 추적"""
+        try:
+            if progress_tracker:
+                progress_tracker.substep("📺 Mock 업로드 시뮬레이션", 50)
+
+            # Mock 업로드 시뮬레이션 (MOCK_UPLOAD_DELAY=0 으로 테스트에서 생략 가능)
+            logger.info("Mock YouTube 업로드 시뮬레이션...")
+            if _MOCK_DELAY > 0:
+                time.sleep(_MOCK_DELAY)
+
+            mock_video_id = f"mock_{time.monotonic_ns()}"
+            mock_url = f"https://www.youtube.com/watch?v={mock_video_id}"
+
+            if progress_tracker:
+                progress_tracker.substep("📺 Mock 업로드 완료", 100)
+
+            logger.info(f"✅ Mock 업로드 완료: {mock_url}")
+            return True, mock_url
+
+        except Exception as e:
+            return False, str(e)
+
+
+class AutoMonitoringManager:
+    """자동 모니터링 관리자 - 24시간 무인 운영"""
+
+    # 기본 시트 URL - 환경변수로 재정의 가능
+    DEFAULT_SHEET_URL = os.getenv(
+        'SHEETS_URL',
+        "https://docs.google.com/spreadsheets/d/1xXxaMYfdTytn3a28_c9AuAEMU4Uu3PLI99FfWZHbknE/edit?usp=sharing")
+
+    def __init__(self, automation_system, auto_start: bool = True):
+        self.automation = automation_system
+        self.monitoring_thread = None
+        self.is_running = False
+        self._stop_event = threading.Event()  # 🆕 폴링 없는 대기/즉시 종료용
+        self.check_interval = 300  # 5분마다 체크
+        self.last_check_time = datetime.now()
+        self.processed_rows = 0  # 처리된 행 추적 (row_id 비트셋)
+        self._processed_sig = {}  # row_id → 내용 해시 (행 재사용 감지)
+        _ACTIVE_MONITORS.add(self)  # signal_handler가 종료 시 깨울 수 있게 등록
+        # 🆕 재시작 시 전체 재검사 방지 - 처리 기록을 append-only 로그로 유지
+        self._processed_log = Path(".processed.log")
+        self._load_processed_log()
+        # 🆕 시트 쓰기 타임스탬프 (슬라이딩 윈도우 레이트 리미터)
+        self._rate = deque()
+        # 🆕 생성과 시작 분리 - 테스트/단발 실행은 auto_start=False
+        if auto_start:
+            self.start_monitoring(self.DEFAULT_SHEET_URL)
+
+    def start_monitoring(self, sheet_url: str = ""):
+        """자동 모니터링 시작"""
+        if self.is_running:
+            logger.warning("자동 모니터링이 이미 실행 중입니다.")
+            return
+
+        self.is_running = True
+        self._stop_event.clear()
+        self.sheet_url = sheet_url
+
+        # 백그라운드 스레드 시작
+        self.monitoring_thread = threading.Thread(
+            target=self._monitoring_loop,
+            daemon=True,
+            name="AutoMonitoringThread"
+        )
+        self.monitoring_thread.start()
+
+        logger.info(f"🚀 자동 모니터링 시작 - {self.check_interval}초마다 체크")
+
+    def stop_monitoring(self):
+        """자동 모니터링 중지"""
+        self.is_running = False
+        self._stop_event.set()  # 대기 중인 wait()를 즉시 깨움
+        if self.monitoring_thread and self.monitoring_thread.is_alive():
+            logger.info("⏹️ 자동 모니터링 중지 중...")
+            self.monitoring_thread.join(timeout=5)
+        logger.info("✅ 자동 모니터링 중지 완료")
+
+    @staticmethod
+    def _content_sig(address: str) -> str:
+        """행 내용(주소) 해시 - 같은 행이 새 매물로 재사용됐는지 판별용"""
+        return hashlib.blake2b(
+            (address or '').strip().encode('utf-8'), digest_size=8).hexdigest()
+
+    def _is_processed(self, row_id, address: str = '') -> bool:
+        """row_id가 이미 처리됐는지 O(1) 확인
+
+        비트가 서 있어도 주소가 기록 당시와 다르면 행이 새 매물로 재사용된
+        것이므로 비트를 지우고 False를 반환한다 (재사용 행 영구 누락 방지).
+        """
+        try:
+            row_id = int(row_id)
+        except (TypeError, ValueError):
+            return False
+        if not (self.processed_rows >> row_id) & 1:
+            return False
+        recorded = self._processed_sig.get(row_id)
+        # 구형 로그(해시 없음)는 recorded가 None - 비교를 건너뛰어
+        # 기존 완료 행이 한 번씩 재처리되는 일을 막는다
+        if address and recorded is not None and recorded != self._content_sig(address):
+            logger.info("🔄 행 %d 재사용 감지 - 처리 기록 초기화", row_id)
+            self.processed_rows &= ~(1 << row_id)
+            self._processed_sig.pop(row_id, None)
+            return False
+        return True
+
+    def _mark_processed(self, row_id, address: str = ''):
+        """row_id를 처리 완료로 기록 (append-only 로그로 영속화)"""
+        try:
+            row_id = int(row_id)
+        except (TypeError, ValueError):
+            return
+        sig = self._content_sig(address)
+        self.processed_rows |= 1 << row_id
+        self._processed_sig[row_id] = sig
+        try:
+            with open(self._processed_log, 'a', encoding='utf-8') as f:
+                f.write(f"{row_id}:{sig}\n")
+        except Exception as e:
+            logger.warning(f"처리 기록 저장 실패: {e}")
+
+    def _load_processed_log(self):
+        """재시작 시 처리 기록 복원 + 1000건 초과 시 로그 압축"""
+        try:
+            if not self._processed_log.exists():
+                return
+            count = 0
+            with open(self._processed_log, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    # 신형 "row_id:sig" / 구형 "row_id" 모두 지원
+                    row_part, _, sig = line.partition(':')
+                    if row_part.isdigit():
+                        row_id = int(row_part)
+                        self.processed_rows |= 1 << row_id
+                        # 구형 줄은 해시를 모름 → None 유지 (빈 주소 해시로
+                        # 채우면 실제 주소와 절대 일치하지 않아 전부 재처리됨)
+                        self._processed_sig[row_id] = sig or None
+                        count += 1
+            if count > 1000:
+                # 중복 줄 제거해서 한 번에 다시 쓰기
+                entries = [f"{i}:{self._processed_sig[i]}"
+                           if self._processed_sig.get(i) else str(i)
+                           for i in range(self.processed_rows.bit_length())
+                           if (self.processed_rows >> i) & 1]
+                tmp_path = self._processed_log.with_suffix('.log.tmp')
+                tmp_path.write_text("\n".join(entries) + "\n", encoding='utf-8')
+                os.replace(tmp_path, self._processed_log)
+            if count:
+                logger.info(f"📋 처리 기록 {self.processed_rows.bit_count()}건 복원")
+        except Exception as e:
+            logger.warning(f"처리 기록 복원 실패: {e}")
+
+    def _throttle_sheet_writes(self):
+        """Sheets 쓰기 쿼터(분당 60회) 기준 슬라이딩 윈도우 대기
+
+        무조건 10초 쉬는 대신 최근 60초간 쓰기 횟수가 한도(여유분 포함 55회)에
+        도달했을 때만 가장 오래된 기록이 윈도우를 벗어날 때까지 기다린다.
+        """
+        now = time.monotonic()
+        while self._rate and now - self._rate[0] > 60:
+            self._rate.popleft()
+        if len(self._rate) >= 55:
+            self._stop_event.wait(60 - (now - self._rate[0]))
+        self._rate.append(time.monotonic())
+
+    def _monitoring_loop(self):
+        """메인 모니터링 루프"""
+        logger.info("📡 자동 모니터링 루프 시작")
+        SHUTDOWN_DONE.clear()
+
+        try:
+            while self.is_running and not SHUTDOWN_FLAG:
+                try:
+                    self._check_and_process_new_items()
+
+                    # 체크 간격만큼 대기 - stop_monitoring이 이벤트를 세트하면 즉시 반환
+                    if self._stop_event.wait(timeout=self.check_interval):
+                        break
+
+                except Exception as e:
+                    logger.error(f"모니터링 루프 오류: {e}")
+                    self._stop_event.wait(30)  # 오류 시 30초 대기 후 재시도
+        finally:
+            SHUTDOWN_DONE.set()  # signal_handler가 대기 중이면 즉시 깨움
+
+        logger.info("📡 자동 모니터링 루프 종료")
+
+    def _check_and_process_new_items(self):
+        """새 항목 체크 및 처리"""
+        try:
+            # 현재 시간 기록
+            current_time = datetime.now()
+            time_str = current_time.strftime("%H:%M:%S")
+            self.last_check_time = current_time
+
+            logger.info("🔍 [%s] 구글시트 체크 중...", time_str)
+
+            # 구글시트에서 대기중인 항목들 가져오기
+            pending_items = self.automation.sheets_manager.get_property_queue(
+                self.sheet_url)
+
+            if not pending_items:
+                logger.info("📭 [%s] 처리할 새 항목 없음", time_str)
+                return
+
+            # 새 항목만 필터링 (row_id는 시트 내에서 유일하므로 비트셋으로 충분)
+            new_items = [item for item in pending_items
+                         if not self._is_processed(item.get('row_id'),
+                                                   item.get('address', ''))]
+
+            if not new_items:
+                logger.info(
+                    "📝 [%s] 모든 항목이 이미 처리됨 (%d개)", time_str, len(pending_items))
+                return
+
+            logger.info("🆕 [%s] 새 항목 %d개 발견!", time_str, len(new_items))
+
+            # 🆕 '처리중' 표시는 행 수와 무관하게 API 1회 호출로 일괄 반영
+            if len(new_items) > 1:
+                self.automation.sheets_manager.update_statuses_batch(
+                    [(item.row_id, "처리중") for item in new_items])
+
+                # 워커 프로세스는 부모의 OAuth 세션을 물려받지 못한다 -
+                # 실제 YouTube 인증이 있거나 확인 팝업 모드면 워커가 Mock
+                # 업로드/무단 승인으로 흘러가므로 현재 프로세스에서 순차 처리
+                uploader = self.automation.youtube_uploader
+                if uploader.youtube_service is None and uploader.auto_upload_mode:
+                    # 🆕 업로드가 어차피 Mock인 무인 모드에서만 워커 풀 병렬 실행
+                    results = self.automation.run_batch_automation(new_items)
+                    for item, result in zip(new_items, results):
+                        if result.success:
+                            self.automation.sheets_manager.update_status(
+                                item.row_id, "완료", result.youtube_url)
+                            self._send_completion_notification(item.address, result)
+                        else:
+                            self.automation.sheets_manager.update_status(
+                                item.row_id, "오류",
+                                f"처리 실패: {str(result.error_message)[:100]}")
+                        self._mark_processed(item.row_id, item.address)
+                    return
+
+                for item in new_items:
+                    if not self.is_running or SHUTDOWN_FLAG:
+                        break
+                    self._process_single_item(item, status_marked=True)
+                return
+
+            # 단건은 기존 경로로 처리
+            for item in new_items:
+                if not self.is_running or SHUTDOWN_FLAG:
+                    break
+
+                self._process_single_item(item)
+
+        except Exception as e:
+            logger.error(f"새 항목 체크 오류: {e}")
+
+    def _process_single_item(self, item: PendingItem, status_marked: bool = False):
+        """개별 항목 자동 처리 - 구글시트 유의사항 포함
+
+        status_marked=True면 호출 측에서 이미 '처리중'을 일괄 반영한 상태.
+        """
+        try:
+            address = item.address.strip()
+            row_id = item.row_id
+            advertising_notice = item.advertising_notice  # 🆕 구글시트 유의사항
+
+            if not address:
+                logger.warning(f"주소가 없는 항목 건너뜀: 행 {row_id}")
+                self._mark_processed(row_id)
+                return
+
+            logger.info("🎬 자동 처리 시작: %s (행 %s)", address, row_id)
+            if advertising_notice:
+                logger.info("📋 구글폼 유의사항: %s...", advertising_notice[:50])
+
+            # 상태를 '처리중'으로 업데이트 (일괄 반영된 경우 생략)
+            if not status_marked:
+                self.automation.sheets_manager.update_status(row_id, "처리중", "")
+
+            # 🆕 콘텐츠 자동 생성 (구글시트 유의사항 포함)
+            result = self.automation.run_full_automation_with_notice(
+                address,
+                item.property_type or '아파트',
+                advertising_notice,  # 🆕 구글시트에서 받은 유의사항 전달
+                row_id
+            )
+
+            # 결과에 따라 상태 업데이트
+            if result.success:
+                status = "완료"
+                youtube_url = result.youtube_url
+                logger.info("✅ 자동 처리 완료: %s", address)
+
+                # 완료 알림 (선택적)
+                self._send_completion_notification(address, result)
+
+            else:
+                status = "오류"
+                youtube_url = f"오류: {result.error_message}"
+                logger.error(f"❌ 자동 처리 실패: {address} - {result.error_message}")
+
+            # 최종 상태 업데이트
+            self.automation.sheets_manager.update_status(
+                row_id, status, youtube_url)
+
+            # 처리된 항목으로 기록
+            self._mark_processed(row_id, address)
+
+            # 실제 쿼터(분당 60회 쓰기)에 맞춘 페이싱 - 한도 내에서는 즉시 진행
+            self._throttle_sheet_writes()
+
+        except Exception as e:
+            logger.error(f"항목 처리 오류: {e}")
+            # 오류 시에도 처리된 것으로 기록 (무한 재처리 방지)
+            self._mark_processed(item.get('row_id'), item.get('address', ''))
+
+            # 오류 상태로 업데이트
+            try:
+                self.automation.sheets_manager.update_status(
+                    item.get('row_id', ''), "오류", f"처리 실패: {str(e)[:100]}"
+                )
+            except:
+                pass
+
+    def _send_completion_notification(
+    self, address: str, result: ContentResult):
+        """완료 알림 발송 (선택적)"""
+        try:
+            # 여기에 이메일, 슬랙, 디스코드 등 알림 기능 추가 가능
+            completion_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            notification_msg = f"""
+🎉 청산부동산 콘텐츠 자동 생성 완료!
+
+📍 주소: {address}
+⏰ 완료 시간: {completion_time}
+📹 YouTube: {result.youtube_url}
+📊 PPT: {result.ppt_file}
+
+🏢 청산부동산 자동화 시스템
+"""
+
+            # 로그에 기록
+            logger.info(f"📢 완료 알림: {address}")
+
+            # TODO: 실제 알림 발송 (이메일, 슬랙 등)
+            # send_email_notification(notification_msg)
+            # send_slack_notification(notification_msg)
+
+        except Exception as e:
+            logger.error(f"알림 발송 오류: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """모니터링 상태 정보"""
+        return {
+            'is_running': self.is_running,
+            'last_check': self.last_check_time.strftime("%Y-%m-%d %H:%M:%S"),
+            'check_interval_minutes': self.check_interval // 60,
+            'processed_count': self.processed_rows.bit_count(),
+            'sheet_url': getattr(self, 'sheet_url', ''),
+            'thread_alive': self.monitoring_thread.is_alive() if self.monitoring_thread else False
+        }
+
+# 구글시트 컬럼명 표준화 맵 (한글/영어 별칭 → 내부 필드명)
+_COLUMN_ALIASES = {
+    '상태': 'status', 'Status': 'status', '처리상태': 'status', '진행상태': 'status',
+    '주소': 'address', 'Address': 'address', '부동산주소': 'address', '매물주소': 'address',
+    '매물유형': 'property_type', 'Type': 'property_type',
+    '부동산유형': 'property_type', 'PropertyType': 'property_type',
+    '광고시유의사항': 'advertising_notice', '광고시 유의사항': 'advertising_notice',
+    '유의사항': 'advertising_notice', 'notice': 'advertising_notice',
+    'Advertising Notice': 'advertising_notice', '주의사항': 'advertising_notice',
+    '우선순위': 'priority', 'Priority': 'priority',
+    '등록일': 'created_date',
+}
+
+# 기본 광고시 유의사항 (시트에 값이 없을 때)
+_DEFAULT_NOTICE = "본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다. 부동산 투자 시 신중한 검토가 필요합니다."
+
+# 🔧 다양한 컬럼명 지원 (한글/영어 모두) - 행마다 재생성하지 않도록 모듈 수준으로 호이스팅
+_STATUS_FIELDS = ('status', '상태', 'Status', '처리상태', '진행상태')
+_ADDRESS_FIELDS = ('address', '주소', 'Address', '부동산주소', '매물주소')
+_TYPE_FIELDS = ('property_type', '매물유형', 'Type', '부동산유형', 'PropertyType')
+_NOTICE_FIELDS = ('광고시유의사항', '광고시 유의사항', 'advertising_notice',
+                  '유의사항', 'notice', 'Advertising Notice', '주의사항')
+_WAITING_KEYWORDS = ('대기', 'pending', '처리전', '신규', 'new')
+
+# update_status용 헤더 → 역할 매핑 (소문자 정규화 후 dict 1회 조회)
+_HEADER_ROLE = {}
+for _h in ('status', '상태', '처리상태', '진행상태'):
+    _HEADER_ROLE[_h] = 'status'
+for _h in ('url', '링크', 'link', 'youtube', 'video_url', '동영상링크'):
+    _HEADER_ROLE[_h] = 'url'
+del _h
+
+# 정확히 일치하지 않는 헤더("YouTube URL", "동영상 링크" 등)용 부분 일치 키워드
+_HEADER_ROLE_SUBSTR = (
+    ('status', ('상태', 'status')),
+    ('url', ('url', '링크', 'link', 'youtube')),
+)
+
+
+def _header_role(header: str):
+    """헤더 문자열 → 'status'/'url'/None - 정확 일치 후 부분 일치 순서로 판별"""
+    key = header.strip().lower()
+    role = _HEADER_ROLE.get(key)
+    if role:
+        return role
+    for role, keywords in _HEADER_ROLE_SUBSTR:
+        if any(kw in key for kw in keywords):
+            return role
+    return None
+
+
+# 🔧 수정된 구글시트 연동 - 인증 문제 완전 해결
+
+
+class FixedSheetsManager:
+    """수정된 구글시트 연동 관리자 - 인증 문제 완전 해결"""
+
+    def __init__(self):
+        self.client = None
+        self.sheet = None
+        self.data_source = "none"
+        self.last_data = []
+        self.last_df = None  # pandas 경로에서 벡터화 필터에 사용
+        self.is_connected = False
+        # 🆕 연결 핸들 재사용용 캐시 (같은 URL이면 재인증/재오픈 생략)
+        self._cached_url = None
+        # 🆕 헤더 컬럼 해석 캐시 (헤더는 실행 중 불변)
+        self._status_col = None
+        self._url_col = None
+        self._ncols = 0  # 헤더 행 컬럼 수 - 읽기 범위 산출용
+        self._headers_cached = False
+        # 🆕 CSV 조건부 요청용 캐시 검증자 (ETag / Last-Modified)
+        self._etag = None
+        self._last_modified = None
+        # 🆕 시트 HTTP 호출 전용 세션 - keep-alive + 429/5xx 자동 재시도
+        self._http = _HTTP_SESSION
+        if requests:
+            try:
+                from requests.adapters import HTTPAdapter, Retry
+
+                session = requests.Session()
+                session.headers.update({
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+                })
+                adapter = HTTPAdapter(
+                    pool_connections=2, pool_maxsize=4,
+                    max_retries=Retry(
+                        total=2, backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504]))
+                session.mount('https://', adapter)
+                self._http = session
+            except Exception as e:
+                logger.warning(f"시트 HTTP 세션 구성 실패: {e}")
+
+    def setup_sheets_connection(self, sheet_url: str = ""):
+        """구글시트 연결 설정 - 완전히 수정된 안전한 방식"""
+        # 🆕 이미 같은 URL로 연결돼 있으면 인증/시트 오픈을 반복하지 않음
+        if self.is_connected and self._cached_url == sheet_url:
+            logger.info("♻️ 기존 구글시트 연결 재사용")
+            return True
+
+        logger.info("🔄 구글시트 연결 시작...")
+
+        # 재연결 시 헤더 캐시 무효화
+        self._headers_cached = False
+        self._status_col = None
+        self._url_col = None
+        self._ncols = 0
+
+        # 라이브러리 체크
+        if not GSPREAD_AVAILABLE:
+            logger.warning("⚠️ Google Sheets 라이브러리 없음. Mock 모드로 실행")
+            self.data_source = "mock"
+            return False
+
+        # 🔧 수정된 연결 방법들 - 순서 변경 및 개선
+        # 🆕 선행조건(파일/환경변수 존재)으로 확실히 실패할 방법은 건너뜀
+        connection_methods = [
+            ("Service Account (credentials.json)", self._try_service_account_fixed,
+             lambda: any(os.path.exists(f) for f in (
+                 "credentials.json", "service_account.json", "complete_automation.json"))),
+            ("공개 CSV 다운로드", self._try_public_csv_improved,
+             lambda: bool(sheet_url) and requests is not None),
+            ("Google API v4 (API 키)", self._try_api_key_improved,
+             lambda: bool(sheet_url) and requests is not None and (
+                 bool(os.getenv("GOOGLE_API_KEY", ""))
+                 or bool(os.getenv("GOOGLE_SHEETS_API_KEY", ""))
+                 or os.path.exists("google_api_key.txt"))),
+            ("OAuth 플로우", self._try_oauth_flow,
+             lambda: os.path.exists('client_secrets.json'))
+        ]
+
+        for method_name, method_func, precondition in connection_methods:
+            if not precondition():
+                logger.info(f"⏭️ 건너뜀 (선행조건 미충족): {method_name}")
+                continue
+            try:
+                logger.info(f"🔄 시도: {method_name}")
+                if method_func(sheet_url):
+                    logger.info(f"✅ 연결 성공: {method_name}")
+                    self.is_connected = True
+                    self._cached_url = sheet_url
+                    return True
+            except Exception as e:
+                logger.warning(f"⚠️ {method_name} 실패: {str(e)[:100]}")
+                continue
+
+        logger.warning("⚠️ 모든 연결 방법 실패. Mock 모드로 실행합니다.")
+        self.data_source = "mock"
+        self.is_connected = False
+        return False
+
+    def refresh_sheets_connection(self, sheet_url: str = ""):
+        """연결 캐시를 무효화하고 다시 연결 (명시적 갱신용)"""
+        self._cached_url = None
+        self.is_connected = False
+        return self.setup_sheets_connection(sheet_url)
+
+    def _try_service_account_fixed(self, sheet_url: str = "") -> bool:
+        """수정된 서비스 계정 인증 - credentials.json 파일 사용"""
+        try:
+            # 가능한 credentials 파일들 확인
+            credential_files = [
+                "credentials.json",
+                "service_account.json",
+                "complete_automation.json",
+                os.path.join(os.getcwd(), "credentials.json")
+            ]
+
+            credential_file = None
+            for file_path in credential_files:
+                if os.path.exists(file_path):
+                    credential_file = file_path
+                    logger.info(f"📋 credentials 파일 발견: {file_path}")
+                    break
+
+            if not credential_file:
+                logger.info("credentials 파일이 없습니다. Mock 모드로 실행")
+                return False
+
+            logger.info(f"📋 {credential_file} 파일 사용 - Service Account 인증 시도")
+
+            # 최신 google-auth 방식 사용
+            from google.oauth2.service_account import Credentials
+            import gspread
+
+            # 🔧 수정된 스코프 설정
+            SCOPES = [
+                'https://www.googleapis.com/auth/spreadsheets.readonly',
+                'https://www.googleapis.com/auth/spreadsheets',
+                'https://www.googleapis.com/auth/drive.readonly',
+                'https://www.googleapis.com/auth/drive.file'
+            ]
+
+            # credentials 파일에서 인증 정보 로드
+            creds = Credentials.from_service_account_file(
+                credential_file, scopes=SCOPES)
+
+            # gspread 클라이언트 생성
+            self.client = gspread.authorize(creds)
+
+            # 연결 테스트
+            if sheet_url:
+                logger.info(f"📊 시트 연결 테스트: {sheet_url}")
+                self.sheet = self.client.open_by_url(sheet_url).sheet1
+
+                # 연결 확인은 단일 셀 읽기로 충분 (전체 시트 fetch 불필요)
+                _ = self.sheet.acell('A1').value
+                logger.info(f"✅ 테스트 성공 - 시트 접근 확인 ({self.sheet.row_count}행)")
+
+                self.data_source = "service_account"
+                return True
+            else:
+                logger.info("✅ Service Account 인증 성공 (시트 URL 없음)")
+                self.data_source = "service_account"
+                return True
+
+        except Exception as e:
+            logger.error(f"Service Account 인증 실패: {e}")
+            # 권한 문제인 경우 구체적인 안내
+            if "permission" in str(e).lower() or "access" in str(e).lower():
+                logger.info("""
+🔧 권한 문제 해결 방법:
+1. Google Cloud Console → IAM 및 관리자 → 서비스 계정
+2. 서비스 계정 이메일 복사
+3. Google Sheets에서 해당 이메일에 편집 권한 부여
+4. Google Drive에서도 폴더 권한 확인
+""")
+            logger.info("Mock 모드로 전환됩니다.")
+            return False
+
+
+    def _try_public_csv_improved(self, sheet_url: str = "") -> bool:
+        """개선된 공개 CSV 링크 방식"""
+        try:
+            if not sheet_url or not requests:
+                return False
+
+            logger.info("📥 공개 CSV 다운로드 시도")
+
+            # 구글시트 URL을 CSV 다운로드 URL로 변환
+            if "docs.google.com/spreadsheets" in sheet_url:
+                match = _SHEET_ID_RE.search(sheet_url)
+                sheet_id = match.group(1) if match else None
+
+                if sheet_id:
+                    # 🔧 여러 CSV URL 패턴 시도
+                    csv_urls = [
+                        f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid=0",
+                        f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv",
+                        f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet=0"
+                    ]
+
+                    # 🆕 조건부 요청 - 시트가 안 바뀌었으면 304로 파싱 생략
+                    conditional_headers = {}
+                    if self.last_data and self._etag:
+                        conditional_headers['If-None-Match'] = self._etag
+                    if self.last_data and self._last_modified:
+                        conditional_headers['If-Modified-Since'] = self._last_modified
+
+                    for csv_url in csv_urls:
+                        try:
+                            logger.info(f"📥 CSV 다운로드 시도: {csv_url}")
+                            response = self._http.get(
+                                csv_url, timeout=20,
+                                headers=conditional_headers or None)
+
+                            if response.status_code == 304:
+                                logger.info(
+                                    f"✅ 시트 변경 없음(304) - 캐시된 {len(self.last_data)}개 행 재사용")
+                                self.data_source = "public_csv"
+                                return True
+
+                            if response.status_code == 200 and len(
+                                response.content) > 100:
+                                logger.info(
+                                    f"✅ CSV 다운로드 성공 ({len(response.content)} bytes)")
+
+                                if _ensure_pandas() is not None:
+                                    # 🔧 바이트를 바로 파싱 - str 디코딩 1회 생략, 메모리 절반
+                                    df = pd.read_csv(
+                                        io.BytesIO(response.content),
+                                        encoding='utf-8', engine='c',
+                                        dtype=str)
+                                    self.last_df = df
+                                    self.last_data = df.to_dict('records')
+                                else:
+                                    # CSV 모듈로 직접 파싱
+                                    csv_reader = csv.DictReader(
+                                        io.TextIOWrapper(
+                                            io.BytesIO(response.content),
+                                            encoding='utf-8'))
+                                    self.last_data = list(csv_reader)
+
+                                # 다음 폴링의 조건부 요청에 쓸 검증자 저장
+                                self._etag = response.headers.get('ETag')
+                                self._last_modified = response.headers.get(
+                                    'Last-Modified')
+
+                                self.data_source = "public_csv"
+                                logger.info(
+                                    f"✅ 공개 CSV로 {len(self.last_data)}개 행 로드")
+                                return True
+                        except Exception as e:
+                            logger.warning(f"CSV URL 실패: {e}")
+                            continue
+
+            return False
+
+        except Exception as e:
+            logger.error(f"공개 CSV 연결 실패: {e}")
+            return False
+
+    def _try_api_key_improved(self, sheet_url: str = "") -> bool:
+        """개선된 Google Sheets API v4 키 방식"""
+        try:
+            if not requests:
+                return False
+                
+            # 환경변수나 설정 파일에서 API 키 확인
+            api_keys = [
+                os.getenv("GOOGLE_API_KEY", ""),
+                os.getenv("GOOGLE_SHEETS_API_KEY", ""),
+            ]
+            
+            # API 키 파일에서도 확인
+            try:
+                if os.path.exists("google_api_key.txt"):
+                    with open("google_api_key.txt", 'r') as f:
+                        api_keys.append(f.read().strip())
+            except:
+                pass
+            
+            api_key = None
+            for key in api_keys:
+                if key and len(key) > 20:
+                    api_key = key
+                    break
+            
+            if not api_key or not sheet_url:
+                logger.info("Google API 키가 없거나 시트 URL이 없습니다.")
+                return False
+            
+            match = _SHEET_ID_RE.search(sheet_url)
+            if not match:
+                return False
+            
+            sheet_id = match.group(1)
+            range_name = "A:Z"
+            
+            logger.info(f"🔑 Google Sheets API v4 사용 - Key: {api_key[:10]}...")
+            
+            url = f"https://sheets.googleapis.com/v4/spreadsheets/{sheet_id}/values/{range_name}"
+            params = {
+                'key': api_key,
+                'majorDimension': 'ROWS'
+            }
+            
+            response = self._http.get(url, params=params, timeout=20)
+            
+            if response.status_code == 200:
+                data = response.json()
+                values = data.get('values', [])
+                
+                if values and len(values) > 1:
+                    headers = values[0]
+                    rows = values[1:]
+                    
+                    records = []
+                    for row in rows:
+                        record = {}
+                        for i, header in enumerate(headers):
+                            record[header] = row[i] if i < len(row) else ""
+                        records.append(record)
+                    
+                    self.last_data = records
+                    self.data_source = "api_v4"
+                    logger.info(f"✅ API v4로 {len(records)}개 행 로드")
+                    return True
+            else:
+                logger.warning(f"API 요청 실패: {response.status_code} - {response.text}")
+            
+        except Exception as e:
+            logger.error(f"API 키 방식 실패: {e}")
+            return False
+        
+        return False
+    
+    def _try_oauth_flow(self, sheet_url: str = "") -> bool:
+        """OAuth 플로우 인증"""
+        try:
+            if not os.path.exists('client_secrets.json'):
+                logger.info("client_secrets.json 파일이 없습니다.")
+                return False
+                
+            from google.auth.transport.requests import Request
+            from google.oauth2.credentials import Credentials
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            import gspread
+            
+            SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+            
+            creds = None
+            # 기존 토큰 확인
+            if os.path.exists('token.json'):
+                creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+            
+            # 토큰이 유효하지 않으면 새로 인증
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    try:
+                        creds.refresh(Request())
+                    except:
+                        creds = None
+                
+                if not creds:
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        'client_secrets.json', SCOPES)
+                    creds = flow.run_local_server(port=0, timeout_seconds=60)
+                
+                # 토큰 저장
+                with open('token.json', 'w') as token:
+                    token.write(creds.to_json())
+            
+            self.client = gspread.authorize(creds)
+            
+            if sheet_url:
+                self.sheet = self.client.open_by_url(sheet_url).sheet1
+                _ = self.sheet.acell('A1').value  # 단일 셀로 연결 확인
+                self.data_source = "oauth"
+                return True
+                
+        except Exception as e:
+            logger.error(f"OAuth 인증 실패: {e}")
+            return False
+        
+        return False
+    
+    def get_property_queue(self, sheet_url: str = "") -> List[Dict[str, Any]]:
+        """대기열에서 부동산 데이터 가져오기 - 광고시 유의사항 필드 포함"""
+        try:
+            # 연결이 안 되어 있으면 다시 시도
+            if self.data_source == "none":
+                self.setup_sheets_connection(sheet_url)
+            
+            # 연결 방식에 따라 데이터 가져오기
+            if self.data_source in ["service_account", "oauth"] and self.sheet:
+                try:
+                    logger.info("📊 실제 구글시트에서 데이터 읽기")
+                    # 🔧 필요한 컬럼 범위만 읽기 - 전체 셀 fetch 대비 전송량 절감
+                    #    범위 폭은 헤더 행 길이에서 산출 (고정 A:G는 폼 연동
+                    #    시트처럼 H 이후에 놓인 유의사항 컬럼을 잘라먹음)
+                    self._resolve_header_columns()
+                    read_range = 'A1:G10000'
+                    if self._ncols:
+                        last_cell = gspread.utils.rowcol_to_a1(10000, self._ncols)
+                        read_range = f'A1:{last_cell}'
+                    values = _retry_backoff(
+                        lambda: self.sheet.get(read_range), "시트 읽기")
+                    if values:
+                        headers = [str(h).strip() for h in values[0]]
+                        records = [
+                            dict(zip(headers, row + [''] * (len(headers) - len(row))))
+                            for row in values[1:]
+                        ]
+                    else:
+                        records = []
+                    logger.info("✅ %d개 행 로드됨", len(records))
+                except Exception as e:
+                    logger.warning(f"시트 읽기 실패: {e}")
+                    records = []
+            elif self.data_source in ["public_csv", "api_v4"]:
+                # pandas DataFrame이 있으면 행 단위 루프 대신 벡터화 필터 사용
+                if pd is not None and self.last_df is not None:
+                    return self._filter_pending_vectorized(self.last_df)
+                records = self.last_data
+                logger.info("📊 캐시된 데이터 사용: %d개 행", len(records))
+            else:
+                logger.info("📊 구글시트 연결 재시도")
+                records = []
+            
+            # 첫 행 헤더에서 필드명을 1회만 해석한 뒤 모든 행은 직접 키 접근
+            status_key = address_key = type_key = notice_key = None
+            if records:
+                first = records[0]
+                status_key = next(
+                    (f for f in _STATUS_FIELDS if f in first), None)
+                address_key = next(
+                    (f for f in _ADDRESS_FIELDS if f in first), None)
+                type_key = next((f for f in _TYPE_FIELDS if f in first), None)
+                notice_key = next(
+                    (f for f in _NOTICE_FIELDS if f in first), None)
+
+            # 대기중인 항목만 필터링
+            _today = datetime.now().strftime('%Y-%m-%d')  # 루프 밖에서 1회만 계산
+            pending_items = []
+            for idx, record in enumerate(records):
+                try:
+                    status = str(record.get(status_key) or '').lower().strip() \
+                        if status_key else ''
+                    address = str(record.get(address_key) or '').strip() \
+                        if address_key else ''
+                    property_type = (str(record.get(type_key) or '').strip()
+                                     if type_key else '') or '아파트'
+
+                    # 🆕 광고시 유의사항 (구글폼 마지막 항목)
+                    advertising_notice = str(record.get(notice_key) or '').strip() \
+                        if notice_key else ''
+                    if advertising_notice:
+                        logger.info("📋 광고시 유의사항 발견: %s...", advertising_notice[:50])
+                    else:
+                        # 기본 유의사항 (시트에 없는 경우)
+                        advertising_notice = _DEFAULT_NOTICE
+
+                    # 대기중인 항목인지 확인
+                    is_pending = status == '' or any(
+                        keyword in status for keyword in _WAITING_KEYWORDS)
+                    
+                    if is_pending and address:
+                        item = PendingItem(
+                            row_id=idx + 2,  # 헤더 행 제외
+                            address=address,
+                            property_type=property_type,
+                            status=record.get('status', record.get('상태', '대기중')),
+                            priority=record.get('priority', record.get('우선순위', record.get('Priority', 'medium'))),
+                            created_date=record.get('created_date', record.get('등록일', _today)),
+                            advertising_notice=advertising_notice  # 🆕 구글시트에서 읽어온 유의사항
+                        )
+                        pending_items.append(item)
+                        
+                except Exception as e:
+                    logger.warning(f"행 {idx} 처리 오류: {e}")
+                    continue
+            
+            logger.info("📋 대기열에서 %d개 항목을 가져왔습니다.", len(pending_items))
+            return pending_items
+            
+        except Exception as e:
+            logger.error(f"대기열 가져오기 오류: {e}")
+            return self._get_mock_data()
+    
+    def _filter_pending_vectorized(self, df) -> List[Dict[str, Any]]:
+        """pandas 벡터 연산으로 대기중 항목 필터링 - 행 단위 Python 루프 제거"""
+        try:
+            df = df.rename(columns=_COLUMN_ALIASES)
+            # 별칭 충돌로 생긴 중복 컬럼은 첫 번째 것만 사용
+            df = df.loc[:, ~df.columns.duplicated()]
+
+            if 'address' not in df.columns:
+                return []
+
+            if 'status' in df.columns:
+                status = df['status'].fillna('').astype(str).str.lower().str.strip()
+            else:
+                status = pd.Series('', index=df.index)
+
+            address = df['address'].fillna('').astype(str).str.strip()
+
+            # 대기 키워드 포함 또는 빈 상태 + 주소가 있는 행만
+            waiting_pattern = '대기|pending|처리전|신규|new'
+            mask = ((status == '') | status.str.contains(
+                waiting_pattern, regex=True)) & (address != '')
+
+            pending = df[mask].fillna('')
+            today = datetime.now().strftime('%Y-%m-%d')
+
+            pending_items = []
+            for idx, row in zip(pending.index, pending.to_dict('records')):
+                pending_items.append(PendingItem(
+                    row_id=idx + 2,  # 헤더 행 제외
+                    address=str(row.get('address', '')).strip(),
+                    property_type=str(row.get('property_type') or '아파트').strip(),
+                    status=str(row.get('status') or '대기중'),
+                    priority=str(row.get('priority') or 'medium'),
+                    created_date=str(row.get('created_date') or today),
+                    advertising_notice=str(
+                        row.get('advertising_notice') or _DEFAULT_NOTICE).strip(),
+                ))
+
+            logger.info("📋 대기열에서 %d개 항목을 가져왔습니다. (pandas)", len(pending_items))
+            return pending_items
+
+        except Exception as e:
+            logger.error(f"pandas 대기열 필터링 오류: {e}")
+            return []
+
+    def _get_mock_data(self) -> List[PendingItem]:
+        """안전한 Mock 데이터 반환 - 유의사항 포함"""
+        _today = datetime.now().strftime('%Y-%m-%d')
+        return [
+            PendingItem(
+                row_id=1,
+                address='서울시 강남구 대치동 아파트',
+                property_type='아파트',
+                status='대기중',
+                priority='high',
+                created_date=_today,
+                advertising_notice='본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다. 부동산 투자 시 신중한 검토가 필요합니다.'
+            ),
+            PendingItem(
+                row_id=2,
+                address='서울시 서초구 반포동 오피스텔',
+                property_type='오피스텔',
+                status='대기중',
+                priority='medium',
+                created_date=_today,
+                advertising_notice='투자에는 리스크가 따르며, 투자 결과에 대한 책임은 투자자 본인에게 있습니다. 전문가와 상담 후 결정하시기 바랍니다.'
+            )
+        ]
+    
+    def _resolve_header_columns(self):
+        """헤더 행에서 상태/URL 컬럼 위치 해석 - 연결당 1회만 수행"""
+        if self._headers_cached:
+            return
+        headers = self.sheet.row_values(1)
+        self._ncols = len(headers)
+
+        # 🔧 다양한 컬럼 이름 지원 - 별칭 dict 조회 후 부분 일치 보조
+        for i, header in enumerate(headers):
+            role = _header_role(header)
+            if role == 'status':
+                self._status_col = i + 1
+            elif role == 'url':
+                self._url_col = i + 1
+
+        self._headers_cached = True
+
+    def update_statuses_batch(self, updates: List[Tuple[int, str]]):
+        """여러 행의 상태를 API 1회 호출로 반영
+
+        updates: (row_id, status) 목록. 행 수와 무관하게 batch_update
+        라운드트립 한 번만 발생한다.
+        """
+        if not updates:
+            return
+        try:
+            if not self.is_connected or \
+                    self.data_source not in ["service_account", "oauth"] or \
+                    not self.sheet:
+                for row_id, status in updates:
+                    logger.info("Mock: 행 %s 상태를 '%s'로 업데이트", row_id, status)
+                return
+
+            self._resolve_header_columns()
+            if not self._status_col:
+                logger.warning("상태 컬럼을 찾을 수 없습니다.")
+                return
+
+            data = [{
+                'range': gspread.utils.rowcol_to_a1(row_id, self._status_col),
+                'values': [[status]]
+            } for row_id, status in updates]
+            _retry_backoff(
+                lambda: self.sheet.batch_update(data, value_input_option='RAW'),
+                "상태 일괄 업데이트")
+            logger.info("✅ 상태 일괄 업데이트: %d개 행 (API 1회)", len(data))
+
+        except Exception as e:
+            logger.error(f"상태 일괄 업데이트 오류: {e}")
+
+    def update_status(self, row_id: int, status: str, video_url: str = ""):
+        """상태 업데이트 - 안전한 방식"""
+        try:
+            if not self.is_connected:
+                logger.info("Mock: 행 %s 상태를 '%s'로 업데이트", row_id, status)
+                return
+                
+            if self.data_source in ["service_account", "oauth"] and self.sheet:
+                try:
+                    logger.info("📊 구글시트 상태 업데이트 시도: 행 %s", row_id)
+                    
+                    # 헤더 행 읽기/컬럼 해석은 연결당 1회만 수행
+                    self._resolve_header_columns()
+
+                    status_col = self._status_col
+                    url_col = self._url_col
+                    
+                    # 상태 + URL을 batch_update 1회 호출로 묶어서 반영
+                    updates = []
+                    if status_col:
+                        updates.append({
+                            'range': gspread.utils.rowcol_to_a1(row_id, status_col),
+                            'values': [[status]]
+                        })
+                    else:
+                        logger.warning("상태 컬럼을 찾을 수 없습니다.")
+
+                    if url_col and video_url:
+                        updates.append({
+                            'range': gspread.utils.rowcol_to_a1(row_id, url_col),
+                            'values': [[video_url]]
+                        })
+                    elif video_url:
+                        logger.warning("URL 컬럼을 찾을 수 없습니다.")
+
+                    if updates:
+                        _retry_backoff(
+                            lambda: self.sheet.batch_update(
+                                updates, value_input_option='RAW'),
+                            "상태 업데이트")
+                        logger.info(
+                            f"✅ 행 {row_id} 일괄 업데이트: {status} ({len(updates)}개 셀)")
+                    
+                except Exception as update_error:
+                    logger.warning(f"⚠️ 시트 업데이트 실패: {update_error}")
+                    logger.info("Mock: 행 %s 상태를 '%s'로 업데이트", row_id, status)
+            else:
+                logger.info("Mock: 행 %s 상태를 '%s'로 업데이트", row_id, status)
+                
+        except Exception as e:
+            logger.error(f"상태 업데이트 오류: {e}")
+            logger.info("Mock: 행 %s 상태를 '%s'로 업데이트", row_id, status)
+
+# 브랜드 불변 텍스트/팔레트 - 호출마다 재할당하지 않도록 모듈 상수화
+_BRAND_COLORS = MappingProxyType({
+    'primary': '#1E3A8A',      # 진한 파란색
+    'secondary': '#F59E0B',    # 주황색
+    'accent': '#10B981',       # 초록색
+    'text': '#1F2937',         # 진한 회색
+    'background': '#F9FAFB'    # 연한 회색
+})
+
+_BRAND_INTRO = """안녕하세요! 부동산 전문가 청산부동산입니다.
+오늘도 여러분께 정확하고 신뢰할 수 있는 부동산 정보를 전해드리겠습니다."""
+
+_BRAND_OUTRO = """지금까지 청산부동산이었습니다.
+부동산 투자나 매매에 대한 문의사항이 있으시면 언제든 연락주세요.
+전화: 02-1234-5678
+구독과 좋아요, 알림설정도 잊지 마세요! 감사합니다."""
+
+# 브랜디드 스크립트 템플릿 - 호출 시에는 값 치환만 수행
+_SCRIPT_TMPL = """
+{intro}
+
+오늘은 {address} 지역의 {property_type} 시장을 전문가의 시각으로 분석해보겠습니다.
+
+현재 이 지역 평균 시세는 {average_price}입니다. 최근 실거래가를 살펴보면, {recent_trades_top3_str}에 거래가 성사되었습니다.
+
+시장 동향을 보면 현재 {price_trend} 추세를 보이고 있습니다. {market_analysis}
+
+교육 환경을 살펴보겠습니다. {school_info}로 자녀 교육에 매우 유리한 조건입니다. 교통 접근성도 {transport_info}로 출퇴근과 생활에 편리합니다.
+
+투자 관점에서 보면, 이 지역은 다음과 같은 장점이 있습니다. 첫째, 우수한 학군으로 인한 수요 안정성. 둘째, 교통 호재로 인한 접근성 개선. 셋째, 주변 개발 계획으로 인한 미래 가치 상승 기대입니다.
+
+청산부동산의 전문가 의견으로는, 현재 시점에서 이 지역은 안정적인 투자처로 추천드립니다. 특히 장기 보유를 고려하신다면 더욱 유리할 것으로 판단됩니다.
+
+🆕 {advertising_notice}
+
+{outro}
+"""
+
+# YouTube 설명 템플릿 - 호출마다 대형 f-string을 재조립하지 않도록 모듈 상수화
+_YT_DESC_TMPL = """
+🏠 {address} {property_type} 전문가 분석
+
+📊 주요 정보:
+• 평균 시세: {average_price}
+• 시장 트렌드: {price_trend}
+• 교육 환경: {school_info}
+• 교통 접근성: {transport_info}
+
+📈 전문가 분석:
+{market_analysis}
+
+⚠️ 광고시 유의사항:
+{advertising_notice}
+
+📞 문의: {contact_info}
+🏢 {brand_message}
+
+#부동산 #투자 #청산부동산 #아파트 #시세분석
+"""
+
+_ADVERTISING_NOTICE = """⚠️ 광고시 유의사항:
+본 영상은 정보 제공 목적으로 제작되었으며, 투자 권유가 아닙니다.
+부동산 투자 시에는 시장 상황, 개인의 재정 상태, 투자 목적 등을 종합적으로 고려하여 신중하게 결정하시기 바랍니다.
+모든 투자에는 리스크가 따르며, 투자 결과에 대한 책임은 투자자 본인에게 있습니다.
+정확한 정보는 공인중개사 및 관련 전문가와 상담 후 확인하시기 바랍니다."""
+
+
+class CheongsanBrandingManager:
+    """청산부동산 브랜딩 관리자 - 광고시 유의사항 포함"""
+
+    @staticmethod
+    def get_brand_colors() -> Dict[str, str]:
+        """브랜드 컬러 팔레트 (읽기 전용 뷰)"""
+        return _BRAND_COLORS
+
+    @staticmethod
+    def get_brand_intro() -> str:
+        """브랜드 인트로 멘트"""
+        return _BRAND_INTRO
+
+    @staticmethod
+    def get_brand_outro() -> str:
+        """브랜드 아웃트로 멘트"""
+        return _BRAND_OUTRO
+
+    @staticmethod
+    def get_advertising_notice() -> str:
+        """🆕 광고시 유의사항"""
+        return _ADVERTISING_NOTICE
+    
+    # 타이틀 템플릿 - 호출마다 리스트/f-string 5개를 새로 만들지 않도록 클래스 상수화
+    _TITLE_TEMPLATES = (
+        "🏠 {a} {t} 완벽 분석 | 청산부동산",
+        "📈 지금 사야 할까? {a} 시세 분석 | 청산부동산 전문가",
+        "💰 {a} {t} 투자 포인트 3가지 | 청산부동산",
+        "🔥 핫한 {a} 부동산 시장 분석 | 청산부동산",
+        "⚡ {a} {t} 급등 예상? 전문가 분석 | 청산부동산"
+    )
+
+    @classmethod
+    def create_branded_title(cls, property_address: str, property_type: str) -> str:
+        """브랜드 타이틀 생성 - crc32 기반이라 실행 간에도 같은 주소면 같은 제목"""
+        idx = zlib.crc32(property_address.encode('utf-8')) % len(cls._TITLE_TEMPLATES)
+        return cls._TITLE_TEMPLATES[idx].format(a=property_address, t=property_type)
+
+class EnhancedMockAPIHandler:
+    """향상된 Mock API 핸들러 - 구글시트 유의사항 사용"""
+    
+    @staticmethod
+    def mock_property_data(address: str, advertising_notice: str = "") -> PropertyData:
+        """부동산 Mock 데이터 - 구글시트에서 받은 유의사항 사용"""
+        return EnhancedMockAPIHandler.mock_property_data_batch(
+            [address], advertising_notice)[0]
+
+    @staticmethod
+    def mock_property_data_batch(addresses: List[str],
+                                 advertising_notice: str = "") -> List[PropertyData]:
+        """여러 주소의 Mock 데이터를 한 번에 생성 - numpy로 난수를 일괄 추출"""
+        n = len(addresses)
+        if n == 0:
+            return []
+
+        trends_pool = ('상승', '보합', '하락')
+        if NUMPY_AVAILABLE:
+            # 🆕 난수를 벡터화 호출로 추출 - 거래가 오프셋은 원래 분포(±500/±300/±200) 유지
+            rng = np.random.default_rng()
+            bases = rng.integers(30000, 80000, size=n)
+            offsets = np.column_stack([
+                rng.integers(-500, 501, size=n),
+                rng.integers(-300, 301, size=n),
+                rng.integers(-200, 201, size=n),
+            ])
+            trend_idx = rng.integers(0, len(trends_pool), size=n)
+            rows = [(int(bases[i]), offsets[i].tolist(),
+                     trends_pool[trend_idx[i]]) for i in range(n)]
+        else:
+            import random
+            rows = [(random.randint(30000, 80000),
+                     [random.randint(-500, 500), random.randint(-300, 300),
+                      random.randint(-200, 200)],
+                     random.choice(trends_pool)) for _ in range(n)]
+
+        # 🆕 구글시트에서 받은 유의사항이 없으면 기본값 사용
+        if not advertising_notice:
+            advertising_notice = CheongsanBrandingManager.get_advertising_notice()
+
+        results = []
+        for address, (price_base, offs, trend) in zip(addresses, rows):
+            results.append(PropertyData(
+                address=address,
+                property_type="아파트",
+                average_price=f"{price_base}만원",
+                recent_trades=[f"{price_base + int(o)}만원" for o in offs],
+                price_trend=trend,
+                market_analysis=f"최근 3개월간 거래량이 증가하고 있으며, {trend} 추세를 보이고 있습니다. "
+                              f"주변 재개발 계획과 교통 호재로 인해 중장기적으로 안정적인 투자처로 평가됩니다.",
+                school_info="초등학교 도보 5분, 중학교 도보 8분, 고등학교 도보 12분",
+                transport_info="지하철 2호선 도보 10분, 버스정류장 3분, 고속도로 진입 15분",
+                advertising_notice=advertising_notice  # 🆕 구글시트에서 받은 유의사항 사용
+            ))
+        return results
+
+class CompleteAutomationSystem:
+    """완전 자동화 시스템 - 모든 기능 통합 및 개선"""
+    
+    def __init__(self):
+        # 🆕 무거운 매니저들은 첫 사용 시점에 생성 (지연 초기화)
+        self._lazy = {}
+        self.progress_callback = None
+        self.progress_tracker = None
+
+    @property
+    def sheets_manager(self):
+        if 'sheets' not in self._lazy:
+            self._lazy['sheets'] = FixedSheetsManager()
+        return self._lazy['sheets']
+
+    @property
+    def branding(self):
+        if 'branding' not in self._lazy:
+            self._lazy['branding'] = CheongsanBrandingManager()
+        return self._lazy['branding']
+
+    @property
+    def mock_handler(self):
+        if 'mock' not in self._lazy:
+            self._lazy['mock'] = EnhancedMockAPIHandler()
+        return self._lazy['mock']
+
+    @property
+    def tts_engine(self):
+        if 'tts' not in self._lazy:
+            self._lazy['tts'] = RealTTSEngine()
+        return self._lazy['tts']
+
+    @property
+    def video_editor(self):
+        if 'video' not in self._lazy:
+            self._lazy['video'] = RealVideoEditor()
+        return self._lazy['video']
+
+    @property
+    def youtube_uploader(self):
+        if 'youtube' not in self._lazy:
+            self._lazy['youtube'] = YouTubeUploader()
+        return self._lazy['youtube']
+
+    @property
+    def auto_monitor(self):
+        if 'monitor' not in self._lazy:
+            self._lazy['monitor'] = AutoMonitoringManager(self)
+        return self._lazy['monitor']
+
+    # 자동화 수준 가중치 - 기능 플래그를 데이터로 선언 (상태 패널과 공용)
+    _CAPS = (
+        ('tts', 20), ('ffmpeg', 25), ('youtube', 20),
+        ('gspread', 20), ('pil', 10), ('pptx', 5),
+    )
+
+    def capability_score(self) -> int:
+        """설치된 라이브러리 기준 자동화 수준(%) - 인스턴스당 1회만 계산"""
+        if 'capability_score' not in self._lazy:
+            flags = {
+                'tts': bool(TTS_ENGINE),
+                'ffmpeg': self.video_editor.ffmpeg_available,
+                'youtube': YOUTUBE_API_AVAILABLE,
+                'gspread': GSPREAD_AVAILABLE,
+                'pil': PIL_AVAILABLE,
+                'pptx': PPTX_AVAILABLE,
+            }
+            self._lazy['capability_score'] = sum(
+                weight for name, weight in self._CAPS if flags[name])
+        return self._lazy['capability_score']
+
+    def set_progress_callback(self, callback):
+        """진행상황 콜백 설정"""
+        self.progress_callback = callback
+
+    def _get_output_folder(self) -> str:
+        """바탕화면 완성 폴더 경로 반환 (인스턴스당 1회만 해석)"""
+        if 'output_folder' in self._lazy:
+            return self._lazy['output_folder']
+        try:
+            desktop = os.path.join(os.path.expanduser("~"), "Desktop")
+            output_folder = os.path.join(desktop, "완성")
+            _ensure_dir(output_folder)
+        except Exception as e:
+            logger.warning(f"완성 폴더 생성 실패: {e}")
+            output_folder = os.getcwd()
+        self._lazy['output_folder'] = output_folder
+        return output_folder
+
+    def update_progress(self, message: str, percent: int = 0):
+        """진행상황 업데이트"""
+        logger.info(message)
+        if self.progress_callback:
+            try:
+                self.progress_callback(message, percent)
+            except Exception as e:
+                logger.warning(f"진행률 콜백 오류: {e}")
+    
+    def set_auto_upload_mode(self, enabled: bool):
+        """🆕 100% 자동화 모드 설정"""
+        self.youtube_uploader.set_auto_upload_mode(enabled)
+    
+    def start_auto_monitoring(self, sheet_url: str = ""):
+        """자동 모니터링 시작"""
+        try:
+            self.auto_monitor.start_monitoring(sheet_url)
+            return True
+        except Exception as e:
+            logger.error(f"자동 모니터링 시작 오류: {e}")
+            return False
+    
+    def stop_auto_monitoring(self):
+        """자동 모니터링 중지"""
+        try:
+            self.auto_monitor.stop_monitoring()
+            return True
+        except Exception as e:
+            logger.error(f"자동 모니터링 중지 오류: {e}")
+            return False
+    
+    def get_monitoring_status(self) -> Dict:
+        """모니터링 상태 확인"""
+        return self.auto_monitor.get_status()
+    
+    def run_full_automation(self, property_address: str, property_type="아파트", 
+                           sheets_row_id: Optional[int] = None) -> ContentResult:
+        """완전 자동화 실행 - 기본 유의사항 사용"""
+        return self.run_full_automation_with_notice(property_address, property_type, "", sheets_row_id)
+    
+    def run_full_automation_with_notice(self, property_address: str, property_type="아파트", 
+                                      advertising_notice: str = "", 
+                                      sheets_row_id: Optional[int] = None) -> ContentResult:
+        """🆕 완전 자동화 실행 - 구글시트 유의사항 포함"""
+        try:
+            # 🆕 진행률 추적 시스템 초기화
+            self.progress_tracker = ProgressTracker(self.update_progress)
+            
+            self.progress_tracker.update(0, "🚀 청산부동산 완전 자동화 시작...")
+            
+            # 1단계: 부동산 데이터 수집 (구글시트 유의사항 포함)
+            self.progress_tracker.update(1, "🏠 부동산 데이터 수집 중...")
+            property_data = self.mock_handler.mock_property_data(property_address, advertising_notice)
+            
+            # 2단계: 브랜디드 스크립트 생성 (구글시트 유의사항 포함)
+            self.progress_tracker.update(2, "✍️ AI 스크립트 생성 중...")
+            script_data = self._generate_branded_script_with_notice(property_data)
+            
+            # 3~5단계: PPT/썸네일/음성은 서로 독립이므로 동시 실행
+            # (TTS가 가장 오래 걸리고 PPT·썸네일은 그 아래에 숨는다)
+            from concurrent.futures import ThreadPoolExecutor
+
+            # 산출물 파일명 상관관계를 위해 실행당 타임스탬프 1회만 생성
+            run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+            # 🆕 입력(매물 데이터+스크립트) 기반 체크포인트 키 - 재시도 시
+            # 이미 만들어진 산출물이 있으면 해당 단계를 통째로 생략
+            cache_key = hashlib.blake2b(
+                (json.dumps(asdict(property_data), sort_keys=True,
+                            ensure_ascii=False)
+                 + script_data['full_script']).encode('utf-8'),
+                digest_size=8).hexdigest()
+
+            cached_ppt = self._cache_get_artifact('ppt', cache_key)
+            cached_thumb = self._cache_get_artifact('thumb', cache_key)
+            cached_voice = self._cache_get_artifact('voice', cache_key)
+
+            self.progress_tracker.update(3, "📊 PPT·썸네일·음성 동시 생성 중...")
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                ppt_future = None if cached_ppt else executor.submit(
+                    self._create_branded_ppt_with_notice, script_data, property_data, run_ts)
+                thumb_future = None if cached_thumb else executor.submit(
+                    self._create_thumbnail, property_data, script_data, run_ts)
+                voice_future = None if cached_voice else executor.submit(
+                    self._generate_real_voice_and_subtitles, script_data, run_ts)
+
+                if cached_ppt:
+                    ppt_file = cached_ppt
+                else:
+                    ppt_file = ppt_future.result()
+                    self._cache_put_artifact('ppt', cache_key, ppt_file)
+
+                self.progress_tracker.update(4, "🎨 썸네일 생성 완료 대기 중...")
+                if cached_thumb:
+                    thumbnail_file = cached_thumb
+                else:
+                    thumbnail_file = thumb_future.result()
+                    self._cache_put_artifact('thumb', cache_key, thumbnail_file)
+
+                self.progress_tracker.update(5, "🎙️ 음성 생성 완료 대기 중...")
+                if cached_voice:
+                    voice_file, subtitle_file = cached_voice
+                else:
+                    voice_file, subtitle_file = voice_future.result()
+                    self._cache_put_artifact(
+                        'voice', cache_key, [voice_file, subtitle_file])
+
+            # 6단계: 자막 파일 생성
+            self.progress_tracker.update(6, "📝 자막 파일 생성 중...")
+            # 이미 위에서 처리됨
+            
+            # 7단계: 실제 영상 생성
+            self.progress_tracker.update(7, "🎬 영상 편집 중...")
+            cached_video = self._cache_get_artifact('video', cache_key)
+            if cached_video:
+                video_file = cached_video
+            else:
+                video_file = self._create_real_video(ppt_file, voice_file,
+                                                   subtitle_file, thumbnail_file,
+                                                   run_ts)
+                self._cache_put_artifact('video', cache_key, video_file)
+            
+            # 8단계: YouTube 업로드
+            self.progress_tracker.update(8, "📺 YouTube 업로드 중...")
+            youtube_url = self._upload_to_youtube_with_confirmation(
+                video_file, property_data, script_data['full_script'])
+            
+            # 9단계: 구글시트 상태 업데이트
+            self.progress_tracker.update(9, "✅ 최종 완료 및 상태 업데이트...")
+            if sheets_row_id:
+                self.sheets_manager.update_status(sheets_row_id, "완료", youtube_url)
+            
+            result = ContentResult(
+                video_file=video_file,
+                script=script_data['full_script'],
+                ppt_file=ppt_file,
+                voice_file=voice_file,
+                subtitle_file=subtitle_file,
+                thumbnail_file=thumbnail_file,
+                youtube_url=youtube_url,
+                success=True,
+                sheets_row_id=sheets_row_id
+            )
+            
+            self.progress_tracker.update(9, "🎉 완전 자동화 100% 완료!", 100)
+            return result
+            
+        except Exception as e:
+            logger.error(f"완전 자동화 오류: {e}")
+            if sheets_row_id:
+                self.sheets_manager.update_status(sheets_row_id, "오류", "")
+            
+            return ContentResult(
+                video_file="",
+                script="",
+                ppt_file="",
+                voice_file="",
+                subtitle_file="",
+                thumbnail_file="",
+                youtube_url="",
+                success=False,
+                error_message=str(e),
+                sheets_row_id=sheets_row_id
+            )
+    
+    def run_batch_automation(self, items: List[Dict[str, Any]],
+                             processes: int = None) -> List[ContentResult]:
+        """🆕 여러 매물을 워커 프로세스로 병렬 처리 - 코어 수만큼 파이프라인 동시 실행"""
+        if not items:
+            return []
+
+        # 워커는 CompleteAutomationSystem을 새로 만들므로 업로드 모드를
+        # 작업 페이로드에 실어 보낸다 (안 그러면 기본값 False로 리셋됨)
+        auto_mode = self.youtube_uploader.auto_upload_mode
+        jobs = [{
+            'address': item.get('address', ''),
+            'property_type': item.get('property_type', '아파트'),
+            'advertising_notice': item.get('advertising_notice', ''),
+            'row_id': item.get('row_id'),
+            'auto_upload_mode': auto_mode,
+        } for item in items]
+
+        # 단일 항목은 프로세스 기동 비용이 아까우므로 현재 프로세스에서 처리
+        if len(jobs) == 1:
+            return [_process_one_video(jobs[0])]
+
+        try:
+            import multiprocessing
+
+            ctx = multiprocessing.get_context('spawn')
+            worker_count = processes or min(4, os.cpu_count() or 1)
+
+            logger.info(f"🚀 {len(jobs)}건을 워커 {worker_count}개로 병렬 처리 시작")
+            with ctx.Pool(processes=worker_count) as pool:
+                results = pool.map(_process_one_video, jobs)
+
+            logger.info(f"✅ 병렬 일괄 처리 완료: {len(results)}건")
+            return results
+
+        except Exception as e:
+            logger.error(f"병렬 일괄 처리 실패, 순차 처리로 전환: {e}")
+            return [_process_one_video(job) for job in jobs]
+
+    def _generate_branded_script_with_notice(self, property_data: PropertyData) -> Dict[str, Any]:
+        """🆕 광고시 유의사항이 포함된 브랜디드 스크립트 생성"""
+        advertising_notice = property_data.advertising_notice
+
+        main_script = _SCRIPT_TMPL.format_map(
+            {**vars(property_data),
+             'intro': self.branding.get_brand_intro(),
+             'outro': self.branding.get_brand_outro()})
+
+        return {
+            'full_script': main_script,
+            'duration': '6분',
+            # split() 리스트 할당 없이 단어 수 계산 (개행 등 모든 공백 구분 인정)
+            'word_count': sum(1 for _ in re.finditer(r'\S+', main_script)),
+            'advertising_notice': advertising_notice
+        }
+    
+    def _create_branded_ppt_with_notice(self, script_data: Dict[str, Any], property_data: PropertyData,
+                                        timestamp: Optional[str] = None) -> str:
+        """🆕 광고시 유의사항이 포함된 브랜디드 PPT 생성"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        ppt_filename = os.path.join(self._get_output_folder(), f"청산부동산_분석_{timestamp}.pptx")
+        
+        if PPTX_AVAILABLE:
+            try:
+                from pptx import Presentation
+                prs = Presentation()
+
+                # 슬라이드 구성을 데이터로 선언하고 루프 1개로 생성
+                # (레이아웃 객체는 1회만 조회 - python-pptx 속성 접근은 XML 순회)
+                slides_spec = [
+                    # (레이아웃 번호, 제목, 본문)
+                    (0, "청산부동산 전문가 분석",
+                     f"{property_data.address}\n{property_data.property_type} 투자 분석 리포트"),
+                    (1, "💰 현재 시세 분석", f"""
+📍 평균 시세: {property_data.average_price}
+📈 최근 거래가: {property_data.recent_trades_str}
+📊 시장 트렌드: {property_data.price_trend}
+
+전문가 분석:
+{property_data.market_analysis[:150]}..."""),
+                    (1, "🏫 입지 및 교통 분석", f"""
+🎓 교육 환경: {property_data.school_info}
+🚇 교통 접근성: {property_data.transport_info}
+🏪 생활 편의시설: 대형마트, 병원, 공원 인근
+
+청산부동산 평가: ⭐⭐⭐⭐⭐"""),
+                    # 🆕 광고시 유의사항 슬라이드
+                    (1, "⚠️ 광고시 유의사항", property_data.advertising_notice),
+                ]
+
+                layout_cache = {i: prs.slide_layouts[i]
+                                for i in {lid for lid, _, _ in slides_spec}}
+                for lid, slide_title, body in slides_spec:
+                    slide = prs.slides.add_slide(layout_cache[lid])
+                    slide.shapes.title.text = slide_title
+                    slide.placeholders[1].text = body
+
+                prs.save(ppt_filename)
+                return ppt_filename
+                
+            except Exception as e:
+                logger.error(f"PPT 생성 오류: {e}")
+        
+        # 텍스트 버전 생성
+        txt_filename = ppt_filename.replace('.pptx', '.txt')
+        with open(txt_filename, 'w', encoding='utf-8') as f:
+            f.write(f"청산부동산 분석 - {property_data.address}\n")
+            f.write(f"평균 시세: {property_data.average_price}\n")
+            f.write(f"시장 트렌드: {property_data.price_trend}\n")
+            f.write(f"광고시 유의사항: {property_data.advertising_notice}\n")
+        
+        return txt_filename
+    
+    def _pipeline_cache(self) -> Dict[str, Any]:
+        """단계별 산출물 체크포인트 인덱스 - 재시도 시 완료된 단계를 건너뜀"""
+        if 'pipeline_cache' not in self._lazy:
+            index_path = os.path.join(
+                self._get_output_folder(), '.pipeline_cache.json')
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    self._lazy['pipeline_cache'] = json.load(f)
+            except Exception:
+                self._lazy['pipeline_cache'] = {}
+        return self._lazy['pipeline_cache']
+
+    def _cache_get_artifact(self, stage: str, key: str):
+        """체크포인트 조회 - 기록된 산출물 파일이 실제 존재할 때만 재사용"""
+        value = self._pipeline_cache().get(f"{stage}_{key}")
+        if value is None:
+            return None
+        paths = value if isinstance(value, list) else [value]
+        if all(p and os.path.exists(p) for p in paths):
+            logger.info("♻️ 체크포인트 적중: %s 단계 생략", stage)
+            return value
+        return None
+
+    def _cache_put_artifact(self, stage: str, key: str, value):
+        """체크포인트 기록 - 인덱스 파일에 즉시 반영"""
+        cache = self._pipeline_cache()
+        cache[f"{stage}_{key}"] = value
+        try:
+            index_path = os.path.join(
+                self._get_output_folder(), '.pipeline_cache.json')
+            with open(index_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f"체크포인트 저장 실패: {e}")
+
+    def _get_thumbnail_template(self):
+        """썸네일 배경 템플릿 - 고정 브랜드 문구까지 미리 그려 두고 copy()로 재사용"""
+        if 'thumb_template' not in self._lazy:
+            template = Image.new('RGB', (1280, 720), color='#1E3A8A')
+            draw = ImageDraw.Draw(template)
+            # 모든 썸네일에서 불변인 문구는 템플릿에 1회만 렌더링
+            draw.text((50, 600), "청산부동산",
+                      fill='white', font=_load_font("arial.ttf", 40))
+            draw.text((50, 640), "투자 전 전문가 상담 필수",
+                      fill='#EF4444', font=_load_font("arial.ttf", 30))
+            self._lazy['thumb_template'] = template
+        return self._lazy['thumb_template']
+
+    def _create_thumbnail(self, property_data: PropertyData, script_data: Dict[str, Any],
+                          timestamp: Optional[str] = None) -> str:
+        """썸네일 생성"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        thumbnail_filename = os.path.join(self._get_output_folder(), f"thumbnail_{timestamp}.png")
+        
+        if PIL_AVAILABLE:
+            try:
+                width, height = 1280, 720
+                img = self._get_thumbnail_template().copy()
+                draw = ImageDraw.Draw(img)
+
+                # 폰트는 모듈 캐시에서 재사용 (호출마다 TTF 재파싱 방지)
+                font_large = _load_font("arial.ttf", 60)
+                font_medium = _load_font("arial.ttf", 40)
+                font_small = _load_font("arial.ttf", 30)
+
+                # 동적 필드만 그리기 (브랜드/유의사항 문구는 템플릿에 포함)
+                title_text = f"{property_data.address}"
+                draw.text((50, 100), title_text, fill='white', font=font_large)
+
+                price_text = f"평균 {property_data.average_price}"
+                draw.text((50, 200), price_text, fill='#F59E0B', font=font_medium)
+
+                trend_text = f"시장 트렌드: {property_data.price_trend}"
+                draw.text((50, 260), trend_text, fill='#10B981', font=font_small)
+
+                img.save(thumbnail_filename)
+                return thumbnail_filename
+                
+            except Exception as e:
+                logger.error(f"썸네일 생성 오류: {e}")
+        
+        # HTML 버전 생성
+        html_filename = thumbnail_filename.replace('.png', '.html')
+        html_content = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>청산부동산 썸네일</title>
+    <style>
+        body {{
+            background: #1E3A8A;
+            color: white;
+            font-family: Arial;
+            padding: 50px;
+            width: 1280px;
+            height: 720px;
+        }}
+        .title {{ font-size: 60px; }}
+        .price {{ color: #F59E0B; font-size: 40px; }}
+        .brand {{ color: #10B981; font-size: 40px; }}
+        .notice {{ color: #EF4444; font-size: 20px; }}
+    </style>
+</head>
+<body>
+    <div class="title">{property_data.address}</div>
+    <div class="price">평균 {property_data.average_price}</div>
+    <div class="brand">청산부동산</div>
+    <div class="notice">투자 전 전문가 상담 필수</div>
+</body>
+</html>"""
+        
+        with open(html_filename, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        
+        return html_filename
+    
+    def _generate_real_voice_and_subtitles(self, script_data: Dict[str, Any],
+                                           timestamp: Optional[str] = None) -> Tuple[str, str]:
+        """실제 음성 및 자막 생성 - 진행률 추적"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        # 🆕 gTTS는 mp3를 원본으로 출력 - wav 중간 변환(디코드+인코드) 1회 생략.
+        #    영상 합성 시 ffmpeg이 mp3를 바로 입력받아 AAC로 1회만 인코딩한다.
+        voice_ext = 'mp3' if TTS_ENGINE == 'gtts' else 'wav'
+        voice_file = os.path.join(
+            self._get_output_folder(), f"narration_{timestamp}.{voice_ext}")
+        subtitle_file = os.path.join(self._get_output_folder(), f"subtitles_{timestamp}.srt")
+        
+        # 실제 음성 생성
+        success = self.tts_engine.generate_voice(script_data['full_script'], voice_file, self.progress_tracker)
+        if not success:
+            logger.warning("음성 생성 실패. Mock 파일 사용")
+        
+        # 자막 생성
+        self._create_subtitle_file(script_data['full_script'], subtitle_file)
+        
+        return voice_file, subtitle_file
+    
+    def _create_subtitle_file(self, script: str, filename: str):
+        """SRT 자막 파일 생성"""
+        # 가격 표기의 소수점에서 끊기지 않도록 문장 종결 부호 + 공백 기준으로 분리
+        # filter/map은 C 레벨에서 1회 순회, islice로 자막 상한(20문장) 이후는 아예 처리 안 함
+        sentences = itertools.islice(
+            filter(None, map(str.strip, _SENTENCE_SPLIT_RE.split(script))), 20)
+
+        # += 누적 대신 리스트 + join 1회 (긴 스크립트에서 재할당 방지)
+        parts = [
+            f"{i+1}\n"
+            f"{self._format_time(i * 10)} --> {self._format_time((i + 1) * 10)}\n"
+            f"{sentence}\n"
+            for i, sentence in enumerate(sentences)
+        ]
+
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write("\n".join(parts))
+        except Exception as e:
+            logger.error(f"자막 파일 생성 오류: {e}")
+    
+    def _format_time(self, seconds: int) -> str:
+        """시간 포맷 변환 (SRT 형식)"""
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        secs = seconds % 60
+        return f"{hours:02d}:{minutes:02d}:{secs:02d},000"
+    
+    def _create_real_video(self, ppt_file: str, voice_file: str,
+                          subtitle_file: str, thumbnail_file: str,
+                          timestamp: Optional[str] = None):
+        """실제 영상 생성 - 진행률 추적"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        video_file = os.path.join(self._get_output_folder(), f"청산부동산_영상_{timestamp}.mp4")
+        
+        # 실제 영상 편집
+        success = self.video_editor.create_video_from_ppt(
+            ppt_file, voice_file, subtitle_file, video_file, self.progress_tracker)
+        
+        if not success:
+            logger.warning("영상 생성 실패. Mock 파일 사용")
+        
+        return video_file
+    
+    def _upload_to_youtube_with_confirmation(self, video_file: str, 
+                                           property_data: PropertyData, script: str):
+        """확인 팝업 후 YouTube 업로드 - 광고시 유의사항 포함"""
+        try:
+            # YouTube 제목 및 설명 생성
+            title = self.branding.create_branded_title(
+                property_data.address, property_data.property_type)
+            
+            description = _YT_DESC_TMPL.format_map(vars(property_data))
+
+            # YouTube 업로드 (확인 팝업 포함 또는 100% 자동화)
+            success, youtube_url = self.youtube_uploader.upload_video_with_confirmation(
+                video_file, title, description, 
+                tags=['부동산', '투자', '청산부동산', '아파트', '시세분석'],
+                progress_tracker=self.progress_tracker)
+            
+            if success:
+                return youtube_url
+            else:
+                logger.error(f"YouTube 업로드 실패: {youtube_url}")
+                return f"업로드 실패: {youtube_url}"
+                
+        except Exception as e:
+            logger.error(f"YouTube 업로드 오류: {e}")
+            return f"업로드 오류: {str(e)}"
+
+def _process_one_video(job: Dict[str, Any]) -> ContentResult:
+    """워커 프로세스에서 단일 매물 파이프라인 실행 (multiprocessing pickling용 최상위 함수)"""
+    system = CompleteAutomationSystem()
+    # 부모 프로세스의 업로드 모드 복원 - 워커의 새 인스턴스는 False로 시작함
+    system.set_auto_upload_mode(job.get('auto_upload_mode', False))
+    return system.run_full_automation_with_notice(
+        job.get('address', ''),
+        job.get('property_type', '아파트'),
+        job.get('advertising_notice', ''),
+        job.get('row_id'))
+
+
+# 콘솔 메뉴 핸들러들 - elif 체인 대신 디스패치 테이블에서 선택
+def _menu_start_monitoring(automation):
+    print("\n🚀 24시간 자동 모니터링 시작")
+    sheet_url = input("구글시트 URL (엔터시 기본값): ").strip()
+    if not sheet_url:
+        sheet_url = "https://docs.google.com/spreadsheets/d/1xXxaMYfdTytn3a28_c9AuAEMU4Uu3PLI99FfWZHbknE/edit?usp=sharing"
+
+    auto_mode_input = input("100% 자동화 모드 사용? (y/n, 기본값: n): ").strip().lower()
+    auto_mode = auto_mode_input in ['y', 'yes', '예']
+    automation.set_auto_upload_mode(auto_mode)
+
+    if automation.start_auto_monitoring(sheet_url):
+        mode_text = "100% 자동화" if auto_mode else "확인 팝업 포함"
+        print(f"✅ 자동 모니터링이 시작되었습니다! (모드: {mode_text})")
+        print("📡 5분마다 구글시트를 체크하여 새 항목을 완전 자동화 처리합니다.")
+        print("🎬 스크립트 → PPT → 음성 → 영상 → YouTube 업로드까지 완전 자동화!")
+        if auto_mode:
+            print("🎯 100% 자동화: 확인 팝업 없이 바로 업로드")
+        print("⚠️ 이 프로그램을 종료하지 마세요. (24시간 무인 운영)")
+    else:
+        print("❌ 자동 모니터링 시작 실패")
+
+
+def _menu_stop_monitoring(automation):
+    print("\n⏹️ 자동 모니터링 중지")
+    if automation.stop_auto_monitoring():
+        print("✅ 자동 모니터링이 중지되었습니다.")
+    else:
+        print("❌ 자동 모니터링 중지 실패")
+
+
+def _menu_monitoring_status(automation):
+    print("\n📊 모니터링 상태 확인")
+    status = automation.get_monitoring_status()
+    print(f"🔄 실행 중: {'예' if status['is_running'] else '아니오'}")
+    print(f"📅 마지막 체크: {status['last_check']}")
+    print(f"⏰ 체크 간격: {status['check_interval_minutes']}분")
+    print(f"📋 처리된 항목: {status['processed_count']}개")
+    print(f"🔗 시트 URL: {status['sheet_url']}")
+    print(f"🧵 스레드 상태: {'활성' if status['thread_alive'] else '비활성'}")
+
+
+def _menu_single_automation(automation):
+    print("\n🎬 단일 완전 자동화 실행")
+    address = input("부동산 주소: ").strip() or "서울시 강남구 대치동 아파트"
+    property_type = input("매물 유형 (기본: 아파트): ").strip() or "아파트"
+
+    auto_mode_input = input("100% 자동화 모드 사용? (y/n, 기본값: n): ").strip().lower()
+    auto_mode = auto_mode_input in ['y', 'yes', '예']
+    automation.set_auto_upload_mode(auto_mode)
+
+    mode_text = "100% 자동화" if auto_mode else "확인 팝업 포함"
+    print(f"\n🚀 {address} 완전 자동화 시작... (모드: {mode_text})")
+    print("📋 스크립트 생성 → 📊 PPT 제작 → 🎙️ 음성 생성 → 🎬 영상 편집 → 📺 YouTube 업로드")
+    print("🆕 구글폼 '광고시 유의사항' 필드가 자동으로 연동됩니다.")
+
+    result = automation.run_full_automation(address, property_type)
+
+    if result.success:
+        print(f"\n🎉 완전 자동화 v3.0 성공!")
+        print(f"📹 영상: {result.video_file}")
+        print(f"📊 PPT: {result.ppt_file}")
+        print(f"🎨 썸네일: {result.thumbnail_file}")
+        print(f"🎙️ 음성: {result.voice_file}")
+        print(f"📝 자막: {result.subtitle_file}")
+        print(f"📺 YouTube: {result.youtube_url}")
+        print(f"⚠️ 광고시 유의사항이 구글폼 연동으로 자동 포함되었습니다.")
+        print(f"\n✨ 모든 과정이 완료되었습니다!")
+    else:
+        print(f"\n❌ 완전 자동화 실패: {result.error_message}")
+
+
+def _menu_system_status(automation):
+    # 🔧 출력을 한 번에 모아서 write 1회로 내보냄 (파이프/SSH 콘솔 대응)
+    lines = [
+        "\n🔧 시스템 상태 확인",
+        f"🎙️ TTS 엔진: {'✅ ' + TTS_ENGINE if TTS_ENGINE else '❌ 설치 필요: pip install pyttsx3 gTTS'}",
+        f"🎬 FFmpeg: {'✅ 사용 가능' if automation.video_editor.ffmpeg_available else '❌ 설치 필요: https://ffmpeg.org/download.html'}",
+        f"📺 YouTube API: {'✅ 사용 가능' if YOUTUBE_API_AVAILABLE else '❌ 설치 필요: pip install google-api-python-client'}",
+        f"📋 Google Sheets: {'✅ 사용 가능' if GSPREAD_AVAILABLE else '❌ 설치 필요: pip install gspread google-auth'}",
+        f"🖼️ 이미지 처리: {'✅ 사용 가능' if PIL_AVAILABLE else '❌ 설치 필요: pip install Pillow'}",
+        f"📊 PPT 생성: {'✅ 사용 가능' if PPTX_AVAILABLE else '❌ 설치 필요: pip install python-pptx'}",
+        f"📈 데이터 처리: {'✅ 사용 가능' if PANDAS_AVAILABLE else '❌ 설치 필요: pip install pandas'}",
+        "",
+        "📋 인증 파일:",
+    ]
+
+    # 🔧 인증 파일 상태 - 루프 1개로 존재 여부 확인
+    for cred_file in ('credentials.json', 'youtube_secrets.json'):
+        lines.append(
+            f"📄 {cred_file}: {'✅ 발견' if os.path.exists(cred_file) else '❌ 없음'}")
+
+    automation_level = automation.capability_score()
+
+    lines.append(f"\n📊 전체 자동화 수준: {automation_level}%")
+    if automation_level >= 95:
+        lines.append("🎉 100% 완전 자동화 가능!")
+    elif automation_level >= 80:
+        lines.append("⚡ 거의 완전 자동화 가능")
+    elif automation_level >= 60:
+        lines.append("⚠️ 일부 수동 작업 필요")
+    else:
+        lines.append("❌ 많은 라이브러리 설치 필요")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _menu_youtube_auth(automation):
+    print("\n📺 YouTube 인증 설정")
+    print("YouTube 자동 업로드를 위해 다음이 필요합니다:")
+    print("1. Google Cloud Console에서 YouTube Data API v3 활성화")
+    print("2. OAuth 2.0 클라이언트 ID 생성 (데스크톱 애플리케이션)")
+    print("3. JSON 파일을 youtube_secrets.json으로 저장")
+    print()
+
+    if input("인증을 시도하시겠습니까? (y/n): ").lower() == 'y':
+        if automation.youtube_uploader.setup_youtube_auth():
+            print("✅ YouTube 인증 성공!")
+        else:
+            print("❌ YouTube 인증 실패. youtube_secrets.json 파일을 확인해주세요.")
+
+
+def _menu_sheets_test(automation):
+    print("\n📋 구글시트 연결 테스트")
+    sheet_url = input("테스트할 시트 URL (엔터시 기본값): ").strip()
+    if not sheet_url:
+        sheet_url = "https://docs.google.com/spreadsheets/d/1xXxaMYfdTytn3a28_c9AuAEMU4Uu3PLI99FfWZHbknE/edit?usp=sharing"
+
+    print("🔄 구글시트 연결 테스트 중...")
+    if automation.sheets_manager.setup_sheets_connection(sheet_url):
+        print(f"✅ 구글시트 연결 성공! (방식: {automation.sheets_manager.data_source})")
+
+        # 데이터 읽기 테스트
+        items = automation.sheets_manager.get_property_queue(sheet_url)
+        print(f"📊 읽어온 데이터: {len(items)}개 항목")
+
+        if items:
+            print("\n📋 대기중인 항목들:")
+            for item in items[:5]:
+                print(f"• {item.get('address', 'N/A')} ({item.get('property_type', 'N/A')})")
+                # 🆕 광고시 유의사항 표시
+                notice = item.get('advertising_notice', '')
+                if notice:
+                    print(f"  📋 유의사항: {notice[:50]}...")
+    else:
+        print("❌ 구글시트 연결 실패")
+        print("💡 해결 방법:")
+        print("1. credentials.json 파일 확인")
+        print("2. 시트에 서비스 계정 이메일 편집 권한 부여")
+        print("3. 시트를 '링크가 있는 모든 사용자'로 공개 설정")
+
+
+def _menu_auto_mode(automation):
+    print("\n🎯 100% 자동화 모드 설정")
+    current_mode = automation.youtube_uploader.auto_upload_mode
+    print(f"현재 모드: {'100% 자동화' if current_mode else '확인 팝업 포함'}")
+
+    new_mode_input = input("100% 자동화 모드로 변경? (y/n): ").strip().lower()
+    new_mode = new_mode_input in ['y', 'yes', '예']
+
+    automation.set_auto_upload_mode(new_mode)
+    mode_text = "100% 자동화" if new_mode else "확인 팝업 포함"
+    print(f"✅ 모드가 '{mode_text}'로 설정되었습니다.")
+
+
+def _menu_exit(automation):
+    print("\n⏹️ 프로그램 종료 중...")
+
+    # 자동 모니터링 중지
+    if automation.get_monitoring_status()['is_running']:
+        print("🔄 자동 모니터링 중지 중...")
+        automation.stop_auto_monitoring()
+
+    print("👋 청산부동산 완전 자동화 시스템 v3.0을 종료합니다.")
+    return True  # 루프 종료
+
+
+# O(1) 디스패치 테이블 - 메뉴 번호 → 핸들러 (핸들러가 True를 반환하면 종료)
+_MENU_HANDLERS = {
+    "1": _menu_start_monitoring,
+    "2": _menu_stop_monitoring,
+    "3": _menu_monitoring_status,
+    "4": _menu_single_automation,
+    "5": _menu_system_status,
+    "6": _menu_youtube_auth,
+    "7": _menu_sheets_test,
+    "8": _menu_auto_mode,
+    "9": _menu_exit,
+}
+
+
+# 콘솔 모드 함수들
+def safe_main_console():
+    """안전한 콘솔 모드 메인 함수 - v3.0 업그레이드"""
+    print("🏢 청산부동산 완전 자동화 시스템 v3.0 🚀")
+    print("=" * 70)
+    print("🔧 v3.0 업그레이드 완료:")
+    print("• Google Sheets 인증 문제 완전 해결")
+    print("• 실시간 진행률 바 + 10단계 세부 상태 표시")
+    print("• 광고시 유의사항 구글폼 연동 (접수폼 마지막 항목)")
+    print("• 100% 완전 자동화 달성")
+    print("=" * 70)
+    
+    # 라이브러리 상태 확인
+    automation = CompleteAutomationSystem()
+    
+    print(f"🎙️ TTS 엔진: {'✅ ' + TTS_ENGINE if TTS_ENGINE else '❌ 없음'}")
+    print(f"🎬 FFmpeg: {'✅ 사용 가능' if automation.video_editor.ffmpeg_available else '❌ 없음'}")
+    print(f"📺 YouTube API: {'✅ 사용 가능' if YOUTUBE_API_AVAILABLE else '❌ 없음'}")
+    print(f"📋 Google Sheets: {'✅ 사용 가능' if GSPREAD_AVAILABLE else '❌ 없음'}")
+    
+    # 🔧 인증 파일 상태 확인
+    print("\n📋 인증 파일 상태:")
+    print(f"📄 credentials.json: {'✅ 발견' if os.path.exists('credentials.json') else '❌ 없음'}")
+    print(f"📄 youtube_secrets.json: {'✅ 발견' if os.path.exists('youtube_secrets.json') else '❌ 없음'}")
+    print()
+    
+    while True:
+        print("\n📋 메뉴를 선택하세요:")
+        print("1. 🚀 24시간 자동 모니터링 시작 (100% 무인 운영)")
+        print("2. ⏹️ 자동 모니터링 중지")
+        print("3. 📊 모니터링 상태 확인")
+        print("4. 🎬 단일 완전 자동화 (YouTube 업로드 포함)")
+        print("5. 🔧 시스템 상태 확인")
+        print("6. 📺 YouTube 인증 설정")
+        print("7. 📋 구글시트 연결 테스트")
+        print("8. 🎯 100% 자동화 모드 설정")
+        print("9. ❌ 종료")
+
+        try:
+            choice = input("\n선택 (1-9): ").strip()
+
+            handler = _MENU_HANDLERS.get(choice)
+            if handler is None:
+                print("❌ 잘못된 선택입니다. 1-9 중에서 선택해주세요.")
+                continue
+
+            if handler(automation):
+                break
+
+        except KeyboardInterrupt:
+            print("\n\n⏹️ 사용자가 중단했습니다.")
+
+            # 자동 모니터링 중지
+            if automation.get_monitoring_status()['is_running']:
+                print("🔄 자동 모니터링 중지 중...")
+                automation.stop_auto_monitoring()
+            break
+        except Exception as e:
+            print(f"\n❌ 오류 발생: {e}")
+            logger.error(f"콘솔 실행 오류: {e}")
+
+# 신호 핸들러
+def signal_handler(signum, frame):
+    """안전한 종료 처리"""
+    global SHUTDOWN_FLAG, MONITORING_ACTIVE
+    
+    print("\n⏹️ 종료 신호 감지됨...")
+    SHUTDOWN_FLAG = True
+    MONITORING_ACTIVE = False
+
+    # wait(300) 중인 모니터 스레드를 즉시 깨워서 정리 단계로 보냄
+    for monitor in list(_ACTIVE_MONITORS):
+        monitor.is_running = False
+        monitor._stop_event.set()
+
+    # 정리 대기 - 모니터링 스레드가 끝나는 즉시 반환 (최대 2초)
+    SHUTDOWN_DONE.wait(timeout=2.0)
+
+    print("👋 안전하게 종료되었습니다.")
+    sys.exit(0)
+
+# 메인 실행 함수
+def main():
+    """메인 실행 함수 - v3.0 완전 업그레이드 버전"""
+    # 신호 핸들러 등록
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    
+    print("🏢 청산부동산 완전 자동화 시스템 v3.0 🚀")
+    print("=" * 60)
+    print("🎉 v3.0 업그레이드 완료!")
+    print("✅ Google Sheets 인증 수정 | 📊 진행률 개선")
+    print("✅ 광고시 유의사항 구글폼 연동 | 🎯 100% 자동화 달성")
+    print("=" * 60)
+    
+    # 모드 선택
+    if len(sys.argv) > 1 and sys.argv[1] == "--console":
+        safe_main_console()
+    else:
+        print("⚠️ GUI 기능은 최종 코드에서 제외되었습니다. 콘솔 모드로 실행합니다.")
+        safe_main_console()
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        logger.error(f"프로그램 실행 오류: {e}")
+        print(f"❌ 심각한 오류 발생: {e}")
+        print("\n🔧 필요한 라이브러리 설치:")
+        print("pip install pandas requests python-pptx pillow gspread google-auth")
+        print("pip install pyttsx3 gTTS google-api-python-client google-auth-oauthlib")
+        print("\n📺 YouTube 업로드를 위해서는:")
+        print("1. Google Cloud Console에서 YouTube Data API v3 활성화")
+        print("2. OAuth 2.0 클라이언트 ID 생성")
+        print("3. JSON 파일을 youtube_secrets.json으로 저장")
+        print("\n🎬 영상 편집을 위해서는:")
+        print("FFmpeg 설치: https://ffmpeg.org/download.html")
+        print("\n📋 구글시트 연동을 위해서는:")
+        print("1. credentials.json 파일 준비")
+        print("2. 시트에 서비스 계정 편집 권한 부여")
+    finally:
+        # 최종 정리
+        SHUTDOWN_FLAG = True
+        print("🔄 프로그램 종료 중...")
+